@@ -0,0 +1,103 @@
+"""Content-addressed cache of assembled object code.
+
+An entry is keyed by a hash of everything the object code depends
+on:  the assembly source, the instruction set (opdefs.txt), the
+method and field layout of every module the source refers to, the
+output options, and the assembler itself.  If none of those have
+changed, the cached object code is exactly what the assembler
+would produce, so it can be emitted without assembling.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional
+
+import logging
+log = logging.getLogger(__name__)
+
+# Changes to these files change what the assembler produces
+ASSEMBLER_FILES = ["assemble.py", "objfile.py", "asm_cache.py"]
+
+
+def _assembler_digest() -> str:
+    h = hashlib.sha256()
+    here = Path(__file__).resolve().parent
+    for name in ASSEMBLER_FILES:
+        path = here.joinpath(name)
+        if path.exists():
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+ASSEMBLER_DIGEST = _assembler_digest()
+
+
+class AssemblyCache:
+    """A directory of object files named by their content key"""
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: Iterable[str], instruction_set: str,
+            signatures: Iterable[str], options: str) -> str:
+        """Hash of the source lines, the instruction set digest,
+        the import signatures (in a stable order), and options.
+        """
+        h = hashlib.sha256()
+        for part in [ASSEMBLER_DIGEST, instruction_set, options]:
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        for signature in sorted(signatures):
+            h.update(signature.encode("utf-8"))
+            h.update(b"\0")
+        h.update(b"\0")
+        for line in source:
+            h.update(line.encode("utf-8"))
+        return h.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory.joinpath(key[:2], key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            data = self.path(key).read_bytes()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Store an entry; concurrent writers of the same key
+        are harmless, since they write the same bytes.
+        """
+        self._store(key, lambda f: f.write(data))
+
+    def put_file(self, key: str, source: Path):
+        """Store an entry from an object file already written,
+        without reading it into memory
+        """
+        def copy(f: BinaryIO):
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, f)
+        self._store(key, copy)
+
+    def _store(self, key: str, write: Callable[[BinaryIO], object]):
+        path = self.path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp, path)
+        except OSError as e:
+            log.warning(f"Could not write assembly cache entry {path}: {e}")
+
+    def report(self) -> str:
+        total = self.hits + self.misses
+        return f"Assembly cache: {self.hits} hits, {self.misses} misses of {total}"
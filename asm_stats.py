@@ -0,0 +1,106 @@
+"""Where the assembler spends its time (assemble.py --stats).
+
+Phases nest (loading an import happens while handling a
+directive, logging happens anywhere), so each phase is charged
+only for the time not spent in a phase nested within it, and the
+phases add up to the total.  Logging is its own phase:  the time
+to filter, format and emit each record the logger lets through.
+(The f-strings we pass to the logger are built before it decides
+whether to keep them; that cost stays with the caller's phase.)
+"""
+
+import collections
+import contextlib
+import json
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class AssemblyStats:
+    def __init__(self):
+        self.seconds: Dict[str, float] = collections.defaultdict(float)
+        self.counts: Dict[str, int] = collections.Counter()
+        self.log_records: Dict[str, int] = collections.Counter()
+        self.methods: List[dict] = []
+        self._stack: List[list] = []    # [phase, start of its current slice]
+        self._started = time.perf_counter()
+        self._logger: Optional[logging.Logger] = None
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            parent = self._stack[-1]
+            self.seconds[parent[0]] += now - parent[1]
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            name, start = self._stack.pop()
+            self.seconds[name] += end - start
+            if self._stack:
+                self._stack[-1][1] = end
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        """function, charging each call to a phase"""
+        def timed_function(*args):
+            with self.phase(name):
+                return function(*args)
+        return timed_function
+
+    def count(self, name: str, n: int = 1):
+        self.counts[name] += n
+
+    def method(self, name: str, instructions: int, words: int):
+        self.methods.append({"name": name, "instructions": instructions,
+                             "words": words})
+
+    def watch_logging(self, logger: logging.Logger):
+        """Count and time the records logger handles"""
+        handle = logger.handle
+
+        def timed_handle(record: logging.LogRecord):
+            self.log_records[record.levelname] += 1
+            with self.phase("logging"):
+                handle(record)
+
+        logger.handle = timed_handle
+        self._logger = logger
+
+    def unwatch_logging(self):
+        if self._logger is not None:
+            del self._logger.handle     # Back to the class's method
+            self._logger = None
+
+    def report(self) -> dict:
+        total = time.perf_counter() - self._started
+        seconds = dict(self.seconds)
+        seconds["other"] = max(0.0, total - sum(seconds.values()))
+        seconds["total"] = total
+        return {
+            "seconds": {name: round(value, 6) for name, value in seconds.items()},
+            "counts": dict(self.counts),
+            "log_records": dict(self.log_records),
+            "methods": self.methods,
+        }
+
+
+def merge_reports(reports: List[dict]) -> dict:
+    """Sum of the seconds and counts of several reports"""
+    merged = {"seconds": collections.defaultdict(float),
+              "counts": collections.Counter(),
+              "log_records": collections.Counter()}
+    for report in reports:
+        for key in merged:
+            for name, value in report[key].items():
+                merged[key][name] += value
+    merged["seconds"] = {name: round(value, 6)
+                         for name, value in merged["seconds"].items()}
+    return {key: dict(value) for key, value in merged.items()}
+
+
+def write_report(report: dict, stream):
+    json.dump(report, stream, indent=2)
+    stream.write("\n")
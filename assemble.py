@@ -11,43 +11,160 @@ There are two approaches to "resolving" labels:
     references to labels and "patch them up" at the end.
 """
 
+import abc
 import re
 import sys
-import json
+from array import array
 from pathlib import Path
 import argparse
+import bisect
 import configparser
-from typing import Dict, List,  Optional, Tuple
+import contextlib
+import itertools
+import heapq
+import json
+import multiprocessing
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List,  Optional, Tuple, Union
+
+import objfile
+import opcodes
+from manifest import Manifest
+from asm_cache import AssemblyCache
+from asm_stats import AssemblyStats, merge_reports, write_report
 
 import logging
 logging.basicConfig()
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
+_NO_PHASE = contextlib.nullcontext()
+
+
+def phase(stats: Optional[AssemblyStats], name: str):
+    """Charge what follows to a phase, if we are keeping statistics"""
+    return _NO_PHASE if stats is None else stats.phase(name)
+
 
 class Configuration:
-    def __init__(self):
+    """Where to find library classes (TVMLIB) and the assembly
+    cache, and whether to verify by default, from a configuration
+    file (asm.conf in the current directory unless we are told
+    otherwise).  Relative paths are relative to the file's directory.
+    """
+    def __init__(self, path: Union[str, Path] = "asm.conf"):
+        here = Path(path).parent
         config = configparser.ConfigParser()
         try:
-            config.read("asm.conf")
-            self.tvmlib = Path(config["DEFAULT"]["TVMLIB"])
-        except FileExistsError:
-            # If no configuration file is present, we will look in ./OBJ
-            self.tvmlib = Path("./OBJ")
-
-
-CONFIG = Configuration()  # Visible from any code
+            config.read(path)
+            self.tvmlib = here.joinpath(config["DEFAULT"]["TVMLIB"])
+        except (FileExistsError, KeyError):
+            # If no configuration file is present, we will look in OBJ beside it
+            self.tvmlib = here.joinpath("OBJ")
+        # Previously assembled object code, by content hash
+        asmcache = config["DEFAULT"].get("ASMCACHE")
+        self.asmcache = (self.tvmlib.joinpath(".asmcache") if asmcache is None
+                         else here.joinpath(asmcache))
+        # Only a VM built with VM_UNCHECKED gains from verified
+        # classes, so set VERIFY = yes where the VM is built that way
+        self.verify = config["DEFAULT"].getboolean("VERIFY", fallback=False)
 
 
 def cli() -> object:
     parser = argparse.ArgumentParser(
-        description="Assemble tiny virtual machine module"
-                    "into JSON-formatted object code"
+        description="Assemble tiny virtual machine module "
+                    "into binary (.tvm) or JSON-formatted object code"
     )
-    parser.add_argument("source", type=argparse.FileType("r"))
-    parser.add_argument("target", type=argparse.FileType("w"),
-                        nargs="?", default=sys.stdout)
-    return parser.parse_args()
+    parser.add_argument("source", type=argparse.FileType("r"), nargs="?")
+    parser.add_argument("target", type=Path, nargs="?", default=None,
+                        help="Object file; format follows the suffix "
+                             "(.json or .tvm).  Default: JSON on stdout.  "
+                             "A source of several classes puts each in "
+                             "Class.tvm (or .json) beside the target")
+    parser.add_argument("--format", choices=["bin", "json"], default=None,
+                        help="Object file format, overriding the target "
+                             "suffix (--batch default: bin)")
+    parser.add_argument("-O", "--optimize", action="store_true",
+                        help="Thread jumps and remove unreachable "
+                             "or useless instructions")
+    parser.add_argument("--fuse", action="store_true",
+                        help="Use the superinstructions of superops.txt "
+                             "(the VM must be built with the same file)")
+    parser.add_argument("--verify", action=argparse.BooleanOptionalAction,
+                        default=None,
+                        help="Verify each class, so that a VM built with "
+                             "VM_UNCHECKED runs it without run-time checks "
+                             "(default: VERIFY in asm.conf, else no)")
+    parser.add_argument("--stats", nargs="?", const="-", default=None,
+                        metavar="FILE",
+                        help="Report time and counts by phase as JSON, "
+                             "to FILE or standard error")
+    parser.add_argument("--map", action="store_true",
+                        help="Also write a source map (pc -> line) "
+                             "beside each object file, as Class.map")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="Always assemble, ignoring and not updating "
+                             "the cache of assembled classes")
+    parser.add_argument("--batch", nargs="+", type=Path, metavar="PATH",
+                        help="Assemble every .asm file in these files "
+                             "or directories (instead of source/target)")
+    parser.add_argument("--outdir", type=Path, default=None,
+                        help="Where --batch, or a source of several "
+                             "classes without a target, puts object "
+                             "files (default TVMLIB from asm.conf)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of worker processes for --batch "
+                             "(default: number of CPUs)")
+    args = parser.parse_args()
+    if args.batch is None and args.source is None:
+        parser.error("a source file or --batch is required")
+    if args.map and args.batch is None and args.target is None:
+        parser.error("--map requires a target file")
+    return args
+
+
+# ----------------
+#  Symbol tables:  Methods, fields, locals, and imported
+#  classes all live in numbered slots, and the slot layout
+#  is what the loader sees.  We keep the names in slot order
+#  along with a dict from name to slot, so resolving a name
+#  does not scan the list.
+#
+class SymbolTable:
+    """Names in slot order, with constant-time lookup of slots"""
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.slots: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> int:
+        """Slot of name, adding it at the end if it is new"""
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = len(self.names)
+            self.slots[name] = slot
+            self.names.append(name)
+        return slot
+
+    def slot(self, name: str) -> int:
+        """Raises KeyError (a LookupError) if name is not present"""
+        return self.slots[name]
+
+    def copy(self) -> "SymbolTable":
+        table = SymbolTable()
+        table.names = list(self.names)
+        table.slots = dict(self.slots)
+        return table
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.slots
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 # ----------------
@@ -60,36 +177,26 @@ class ImportedModule:
     """Imported module uses information from
     json file
     """
-    def __init__(self, path: Path):
-        with open(path, "r") as source:
-            self.json = json.load(source)
-        # Dict from name to position would be faster, but
-        # number of lookups is very small
-        self.methods: List[str] = self.json["methods"]
-        self.fields:  List[str] = self.json["fields"]
+    def __init__(self, record: dict):
+        self.json = record
+        self.methods = SymbolTable(self.json["methods"])
+        self.fields = SymbolTable(self.json["fields"])
+        # Of the methods it defines, as far as we know
+        self.arities: Dict[str, int] = objfile.arities(record)
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ImportedModule":
+        return cls(objfile.read_object(path))
 
     def method_slot(self, name: str) -> int:
-        if name in self.methods:
-            return self.methods.index(name)
-        log.error(f"Method {name} not defined")
-        return 0
+        """Raises KeyError (a LookupError) if name is not a method"""
+        return self.methods.slot(name)
 
     def n_methods(self) -> int:
         return len(self.methods)
 
     def field_slot(self, name: str) -> int:
-        return self.fields.index(name)
-
-
-IMPORTS: Dict[str, Optional[ImportedModule]] = { "$": None }
-# $ will be replaced by current class name in output .json file
-
-
-def import_module(module: str) -> ImportedModule:
-    if module not in IMPORTS:
-        path = CONFIG.tvmlib.joinpath(module).with_suffix(".json")
-        IMPORTS[module] = ImportedModule(path)
-    return IMPORTS[module]
+        return self.fields.slot(name)
 
 
 # The named literals MUST match the definitions
@@ -108,8 +215,9 @@ NAMED_LITERALS = {
 #  The instruction set of the machine and the numeric
 #  encoding of instructions must be consistent between
 #  assembler and loader, so it is derived from a common
-#  text file, opdefs.txt.  The assembler constructs an
-#  internal representation for translation.
+#  text file, opdefs.txt (and superops.txt).  The generator
+#  build_bytecode_table.py writes the VM's table and opcodes.py,
+#  from which the assembler builds its internal representation.
 #
 #  There is one ugly hack in this scheme:  We need to
 #  know that constants are re-encoded in the loader, because
@@ -117,11 +225,24 @@ NAMED_LITERALS = {
 #  all loaded modules (non-local information).
 #
 
+# Stack effect:  a count, or "n", "n+1", "*" (see opdefs.txt)
+StackEffect = Union[int, str]
+
+
 class InstructionDef:
-    def __init__(self, name: str, code: int, ops: int):
+    __slots__ = ["name", "code", "ops", "kind", "pops", "pushes", "parts"]
+
+    def __init__(self, name: str, code: int, ops: int,
+                 kind: str = "none", pops: StackEffect = 0,
+                 pushes: StackEffect = 0, parts: Tuple[str, ...] = ()):
         self.name = name
         self.code = code
-        self.ops = ops
+        self.ops = ops      # Number of operand words
+        self.kind = kind    # How the operand is encoded
+        self.pops = pops
+        self.pushes = pushes
+        # Operations of a superinstruction, in order
+        self.parts = parts or (name,)
 
     def size(self) -> int:
         """An instruction without an operand
@@ -141,22 +262,24 @@ class InstructionSet:
     """A dict-like structure
     mapping instruction names to InstructionCode objects
     """
-    def __init__(self, path: str):
+    def __init__(self, operations: Dict[str, tuple],
+                 superinstructions: Dict[str, tuple], digest: str):
         self.ops: Dict[str, InstructionDef] = {}
-        """Instruction set initialized from text table"""
-        opcode = 0
-        with open(path, "r") as f:
-            for line in f:
-                # Strip comments, discard empty lines
-                line = line.split("#")[0].strip()
-                if not line:
-                    continue
-                # What remains should be an instruction definition
-                parts = line.split(",")
-                name, code, ops = parts
-                instr = InstructionDef(name, opcode, ops)
-                self.ops[name] = instr
-                opcode += 1
+        for name, (code, ops, kind, pops, pushes) in operations.items():
+            self.ops[name] = InstructionDef(name, code, ops, kind, pops, pushes)
+        # Superinstructions, if any, are numbered after the
+        # base instructions, as in the VM's bytecode table.
+        # Source code cannot name them; the assembler fuses
+        # sequences of their parts (--fuse).
+        self.superops: Dict[Tuple[str, ...], InstructionDef] = {}
+        for name, (code, ops, parts) in superinstructions.items():
+            self.superops[parts] = InstructionDef(name, code, ops, parts=parts)
+        self.longest_superop = max((len(parts) for parts in self.superops), default=0)
+        # For reading object code back
+        self.by_code: Dict[int, InstructionDef] = {
+            op.code: op for op in [*self.ops.values(), *self.superops.values()]}
+        # Object code depends on the instruction set encoding
+        self.digest = digest
 
     def __getitem__(self, name: str):
         return self.ops[name]
@@ -174,19 +297,26 @@ class InstructionSet:
 # after all).  Create stub symbol files for built-ins.
 # So assembler does a lot of the symbolic -> numeric resolution. 
 
-# Instruction set is a global
-INSTRS = InstructionSet("opdefs.txt")
+# The instruction set the VM was built with.  Nothing modifies
+# it, so it is the default for (and shared by) every Assembler.
+INSTRS = InstructionSet(opcodes.OPERATIONS, opcodes.SUPEROPS, opcodes.DIGEST)
 
 
 class Instruction:
     """Object code instruction, including operand if any."""
+    __slots__ = ["label", "operation", "operand", "line", "source_line"]
+
     def __init__(self, label: Optional[str],
                  operation: InstructionDef,
                  operand: Optional[str]):
         self.label = label
         self.operation = operation
         self.operand = operand
-        if operation.ops == '0':
+        # Where it came from (for the source map):
+        # assembly line and .line (Quack source line)
+        self.line: Optional[int] = None
+        self.source_line: Optional[int] = None
+        if operation.ops == 0:
             assert operand is None
         else:
             assert operand is not None
@@ -203,6 +333,28 @@ class Instruction:
         return f"{label} {self.operation.name} {operand}"
 
 
+class Superinstruction(Instruction):
+    """Consecutive instructions dispatched as one (see superops.py).
+    The operands of the parts follow it in the object code, in order.
+    """
+    __slots__ = ["parts"]
+
+    def __init__(self, operation: InstructionDef, parts: List[Instruction]):
+        self.label = None
+        self.operation = operation
+        self.operand = None
+        self.parts = parts
+        self.line = parts[0].line
+        self.source_line = parts[0].source_line
+
+    def __str__(self) -> str:
+        return "   " + "; ".join(str(part).strip() for part in self.parts)
+
+
+# Body of a method:  labels (str) and instructions, in order
+MethodBody = List[Union[str, Instruction]]
+
+
 # ----------------
 # Our object file will be a JSON structure with
 # constants, code, and other information.  We'll build
@@ -210,42 +362,152 @@ class Instruction:
 #
 UNRESOLVED_ADDRESS = -42  # Just an easily recognized value
 
+# Code is held in compact columns, array("i") of 32-bit words
+# rather than lists of Python ints, so that a class of millions
+# of instructions fits in memory:  the code of each method, the
+# address of each label, the jumps waiting for a label, and the
+# positions of call and field operands (OperandRefs).
+
+
+class OperandRefs:
+    """The method or field named by each call or field operand
+    of a method, by position in its code:  columns of positions
+    (increasing) and of name numbers in a table the methods of a
+    class share
+    """
+    def __init__(self, names: SymbolTable):
+        self.names = names
+        self.positions = array("i")
+        self.numbers = array("i")
+
+    def add(self, position: int, kind: str, full_name: str):
+        self.positions.append(position)
+        self.numbers.append(self.names.add(f"{kind} {full_name}"))
+
+    def _ref(self, number: int) -> Tuple[str, str]:
+        kind, _, full_name = self.names.names[number].partition(" ")
+        return kind, full_name
+
+    def get(self, position: int) -> Optional[Tuple[str, str]]:
+        """(kind, "Class:name") of the operand at position, if any"""
+        i = bisect.bisect_left(self.positions, position)
+        if i < len(self.positions) and self.positions[i] == position:
+            return self._ref(self.numbers[i])
+        return None
+
+    def items(self) -> Iterator[Tuple[int, Tuple[str, str]]]:
+        for position, number in zip(self.positions, self.numbers):
+            yield position, self._ref(number)
+
 
 class ObjectCode:
-    def __init__(self):
+    def __init__(self, assembler: "Assembler",
+                 stats: Optional[AssemblyStats] = None,
+                 mapped: bool = False,
+                 writer: Optional[objfile.ObjectWriter] = None):
+        self.assembler = assembler
+        self.instrs = assembler.instrs
+        self.stats = stats
+        self.errors = 0   # Faulty object code must not be cached
+        # Imported classes, in order of class index.
+        # $ will be replaced by current class name in output .json file
+        self.imports: Dict[str, Optional[ImportedModule]] = {"$": None}
+        self.import_slots = SymbolTable(self.imports)
         # The following are initialized in declare_class
         self.class_name: str = ""
         self.super_name: str = ""
-        self.method_list: List[str] = []
-        self.field_list: List[str] = []
-        # Constant pool
-        self.constants: List[Tuple[str, int]] = []
+        self.method_list = SymbolTable()
+        self.n_inherited = 0
+        self.field_list = SymbolTable()
+        # Constant pool, with each distinct literal
+        # interned in exactly one slot:  (kind, value) -> slot
+        self.constants: List[dict] = []
+        self.constant_slots: Dict[Tuple[str, str], int] = {}
+        self.constants_saved = 0   # Duplicate literals not added
         # Method code (instructions)
-        self.code = []  # Will expand to code per method
+        self.code = array("i")  # Will expand to code per method
+        # Operand kind and "Class:name" of the method or field
+        # operands of each method, for its frame size and for
+        # the verifier
+        self.ref_names = SymbolTable()
+        self.refs = OperandRefs(self.ref_names)
+        self.method_refs: List[Optional[OperandRefs]] = []
+        # Whether we verify, and whether every method so far passed
+        self.verifying = assembler.verify
+        self.verified = assembler.verify
+        # Labels and instructions of the current method, held
+        # until the method is complete if we optimize them;
+        # otherwise we encode each as we read it
+        self.body: MethodBody = []
+        self.holding = assembler.optimize or assembler.fuse
+        self.n_labels = 0           # Of the current method, encoded
+        self.n_instructions = 0
+        self.last_label: Optional[str] = None   # For the source map
+        self.optimize = assembler.optimize
+        self.optimizer_hits: Dict[str, int] = {}   # Rule name -> matches
+        self.optimizer_removed = 0   # Instructions
+        self.fuse = assembler.fuse
+        self.fusion_hits: Dict[str, int] = {}   # Superinstruction -> uses
         # For each method defined here, we want its
         # name, its slot# (position in vtable), its
         # local variable names, and its code.
         self.method_code: List[dict] = []
-        self.method_locals: List[str] = []
-        self.method_args: List[str] = []
+        self.arities: Dict[str, int] = {}   # Of the methods finished
+        # Methods finished but not yet measured and verified:  index
+        # in method_code, and methods of this class ("$:name") that
+        # it calls and we have not seen, so whose arity or result
+        # we do not know
+        self.pending: List[Tuple[int, List[str]]] = []
+        # If we are writing the object file as we go, the code of
+        # each method goes to it (and out of memory) once settled
+        self.writer = writer
+        # And for the source map (if mapped), each method's
+        # [pc, assembly line, label, source line] by instruction
+        self.mapped = mapped
+        self.method_lines: List[list] = []
+        self.source_lines: List[dict] = []
+        self.line = 0           # Of the assembly code, as we read it
+        self.source_line: Optional[int] = None   # From .line
+        self.method_locals = SymbolTable()
+        self.method_args = SymbolTable()
         # Things to be resolved
         # Labels resolve to addresses within the code
-        # of a method.
-        # label -> address
-        self.labels: Dict[str, int] = {}
-        # address -> unresolved label
-        self.label_patch: Dict[int, str] = {}
+        # of a method:  label -> label number, and the
+        # address of each label number (-1 until we see it)
+        self.labels = SymbolTable()
+        self.label_addresses = array("i")
+        # Jump operands to patch:  address, label number
+        self.patch_addresses = array("i")
+        self.patch_labels = array("i")
+
+    def error(self, message: str):
+        log.error(message)
+        self.errors += 1
+
+    def phase(self, name: str):
+        return phase(self.stats, name)
+
+    def import_module(self, module: str) -> ImportedModule:
+        """Metadata for a module, giving it the next class
+        index if this class has not referred to it before
+        """
+        if module not in self.imports:
+            with self.phase("imports"):
+                self.imports[module] = self.assembler.load_module(module)
+            self.import_slots.add(module)
+        return self.imports[module]
 
     def declare_class(self, name: str, super_name: str):
         self.class_name = name
         self.super_name = super_name
-        super_module = import_module(super_name)
+        super_module = self.import_module(super_name)
         # Methods and field list are initially those
         # we inherit, but may be extended elsewhere
-        # in the assembly code
-        self.method_list = super_module.methods
+        # in the assembly code.  Copies, because the
+        # superclass metadata may be shared with other classes.
+        self.method_list = super_module.methods.copy()
         self.n_inherited = len(super_module.methods)
-        self.field_list = super_module.fields
+        self.field_list = super_module.fields.copy()
         # AND we need to be able to refer to this class in NEW
 
     def declare_field(self, name: str):
@@ -253,7 +515,7 @@ class ObjectCode:
         do this before methods.
         """
         assert name not in self.field_list, "Field already exists"
-        self.field_list.append(name)
+        self.field_list.add(name)
 
     def declare_method(self, method_name: str):
         """If we need calls to a method before we
@@ -262,36 +524,41 @@ class ObjectCode:
         we define before (or without) calling from within
         the same class.
         """
-        if method_name not in self.method_list:
-            self.method_list.append(method_name)
+        self.method_list.add(method_name)
         # That's all!  We're just reserving a spot
         # in the vtable.  Bad things will happen if
         # it's not filled in later in the code.
 
     def begin_method(self, method_name: str):
-        self.resolve_jumps()  # Of preceding method!
+        self.finish_method()  # Preceding method!
         # And then re-initialize tables
-        # label -> address
-        self.labels: Dict[str, int] = {}
-        # address -> unresolved label
-        self.label_patch: Dict[int, str] = {}
+        self.labels = SymbolTable()
+        self.label_addresses = array("i")
+        self.patch_addresses = array("i")
+        self.patch_labels = array("i")
+        self.n_labels = self.n_instructions = 0
+        self.last_label = None
         ###
-        if method_name not in self.method_list:
-            self.method_list.append(method_name)
-        method_slot = self.method_list.index(method_name)
+        method_slot = self.method_list.add(method_name)
         # Initialize code block
-        self.method_locals = []
-        self.code = []  # We will append instructions to this list
+        self.method_locals = SymbolTable()
+        self.method_args = SymbolTable()
+        self.code = array("i")  # We will append instructions to this
         self.method_code.append({"name": method_name, "slot": method_slot,
                                  "code": self.code})
+        self.refs = OperandRefs(self.ref_names)
+        self.method_refs.append(self.refs)
+        self.method_lines = []
+        self.source_lines.append({"name": method_name, "slot": method_slot,
+                                  "lines": self.method_lines})
 
     def declare_locals(self, method_locals: List[str]):
         """Map local variable names to position in activation record"""
-        self.method_locals = method_locals
+        self.method_locals = SymbolTable(method_locals)
 
     def declare_args(self, args: List[str]):
         """Map argument names to offsets *before* the frame pointer"""
-        self.method_args = args
+        self.method_args = SymbolTable(args)
 
     def resolve_local(self, var: str) -> int:
         """Map local variable to position in activation record.
@@ -304,13 +571,13 @@ class ObjectCode:
         if var == "$":
             # Special case for the "this" variable
             return 0
-        if var in self.method_args:
-            arg_num = self.method_args.index(var)
+        arg_num = self.method_args.slots.get(var)
+        if arg_num is not None:
             return arg_num - len(self.method_args)
-        if var in self.method_locals:
-            local_num = self.method_locals.index(var)
+        local_num = self.method_locals.slots.get(var)
+        if local_num is not None:
             return 3 + local_num
-        log.error(f"Local variable {var} not declared in this method")
+        self.error(f"Local variable {var} not declared in this method")
         return 88   # Just a placeholder; this code should not be used!
 
     def resolve_call(self, full_name: str) -> int:
@@ -319,133 +586,340 @@ class ObjectCode:
         try:
             if class_name == "$":
                 # This class
-                method_slot = self.method_list.index(method_name)
+                method_slot = self.method_list.slot(method_name)
             else:
                 # Imported class
-                module_record = import_module(class_name)
+                module_record = self.import_module(class_name)
+                if method_name not in module_record.methods:
+                    self.error(f"Method {method_name} not defined")
+                    return 0
                 method_slot = module_record.method_slot(method_name)
         except LookupError:
-            log.error(f"No such method '{full_name}'")
+            self.error(f"No such method '{full_name}'")
             method_slot = 0xBAD  # 2989 decimal
         return method_slot
 
+    def method_arity(self, full_name: str) -> Optional[int]:
+        """Arity of "Class:method", if we know it"""
+        class_name, method_name = full_name.split(":")
+        if class_name == "$":
+            if method_name in self.arities:
+                return self.arities[method_name]
+            class_name = self.super_name   # Inherited
+        return self.assembler.method_arity(class_name, method_name)
+
+    def method_returns(self, full_name: str) -> Optional[str]:
+        """Class of the result of "Class:method", if we know it"""
+        class_name, method_name = full_name.split(":")
+        if class_name == "$":
+            if method_name in self.arities:
+                return None     # No signatures for our own methods
+            class_name = self.super_name
+        return self.assembler.method_returns(class_name, method_name)
+
+    def class_layout(self, class_name: str) -> Tuple[int, int]:
+        """(methods, fields) of this class ("$") or an imported one"""
+        if class_name in ["$", self.class_name]:
+            return len(self.method_list), len(self.field_list)
+        module = self.import_module(class_name)
+        return module.n_methods(), len(module.fields)
+
+    def is_subclass(self, class_name: str, ancestor: str) -> bool:
+        """Whether every instance of class_name is an instance
+        of ancestor, as far as we know
+        """
+        if ancestor == "$":
+            ancestor = self.class_name
+        if class_name == self.class_name:
+            if ancestor == class_name:
+                return True
+            class_name = self.super_name
+        return ancestor in self.assembler.lineage(class_name)
+
+    def settle(self, final: bool = False):
+        """Measure and verify each finished method that calls
+        only methods we know (or every one, once the class is
+        complete), and pass its code to the writer if we have one
+        """
+        waiting = []
+        for index, unknown in self.pending:
+            unknown = [name for name in unknown if name not in self.arities]
+            if unknown and not final:
+                waiting.append((index, unknown))
+                continue
+            method, refs = self.method_code[index], self.method_refs[index]
+            decoded = self.decode(method)
+            self.measure_frame(method, refs, decoded,
+                               self.verify(method, refs, decoded))
+            if self.writer is not None:
+                with self.phase("write"):
+                    self.writer.add_method(method)
+                # The writer has the code now
+                method["code"] = self.method_refs[index] = None
+        self.pending = waiting
+
+    def decode(self, method: dict) -> Optional["DecodedMethod"]:
+        """The method's code decoded for the passes that follow
+        paths through it, or None (an error) if it does not decode
+        """
+        with self.phase("decode"):
+            try:
+                return DecodedMethod(method["code"], self.instrs)
+            except FrameError as e:
+                self.error(f"{self.class_name}:{method['name']}: {e}")
+                return None
+
+    def verify(self, method: dict, refs: OperandRefs,
+               decoded: Optional["DecodedMethod"]) -> Optional[int]:
+        """Whether the verifier proves for the method the
+        properties the VM checks at run time (see "Verification");
+        the class is verified only if all its methods are.  Its
+        walk finds the method's max_stack too, which we return
+        if it passes.
+        """
+        if not (self.verified and self.errors == 0 and decoded is not None):
+            self.verified = False
+            return None
+        with self.phase("verify"):
+            verifier = MethodVerifier(self, decoded, method, refs)
+            try:
+                verifier.verify()
+            except (VerifyError, FrameError) as e:
+                log.info(f"{self.class_name}:{method['name']} "
+                         f"not verified: {e}")
+                self.verified = False
+                return None
+        return verifier.deepest
+
+    def measure_frame(self, method: dict, refs: OperandRefs,
+                      decoded: Optional["DecodedMethod"],
+                      max_stack: Optional[int] = None):
+        """Maximum stack depth and frame size of a method,
+        once the methods it calls (and their arities) are known,
+        unless the verifier found max_stack already
+        """
+        # 0 for not known; the VM falls back to checking each push
+        method["max_stack"] = method["frame_size"] = 0
+        if decoded is None:
+            return
+        if max_stack is not None:
+            method["max_stack"] = max_stack
+            method["frame_size"] = FRAME_HEADER + decoded.locals_words + max_stack
+            return
+        with self.phase("frames"):
+            # Arity of each method called, by name
+            arities = {name: self.method_arity(name) for kind, name
+                       in map(refs._ref, set(refs.numbers)) if kind == "method"}
+            unknown = sorted(name for name, arity in arities.items()
+                             if arity is None)
+            if unknown:
+                log.warning(f"{self.class_name}:{method['name']}: frame size "
+                            f"not known (arity of {', '.join(unknown)})")
+                return
+            try:
+                locals_words, max_stack = FrameDepth(
+                    decoded, lambda pc: arities[refs.get(pc)[1]]).measure()
+            except FrameError as e:
+                self.error(f"{self.class_name}:{method['name']}: {e}")
+                return
+            method["max_stack"] = max_stack
+            method["frame_size"] = FRAME_HEADER + locals_words + max_stack
+
     def resolve_field(self, full_name: str) -> int:
         """Resolve Class:field to slot number"""
         class_name, field_name = full_name.split(":")
         try:
             if class_name == "$":
                 # This class
-                field_slot = self.field_list.index(field_name)
+                field_slot = self.field_list.slot(field_name)
             else:
                 # Imported class (is that legal in Quack?)
-                module_record = import_module(class_name)
+                module_record = self.import_module(class_name)
                 field_slot = module_record.field_slot(field_name)
         except LookupError:
-            log.error(f"No such field '{full_name}'")
+            self.error(f"No such field '{full_name}'")
             field_slot = 0xBAD  # 2989 decimal
         return field_slot
 
     def resolve_class(self, class_name: str) -> int:
-        import_module(class_name)  # In case we need to
-        index = list(IMPORTS).index(class_name)
-        return index
+        self.import_module(class_name)  # In case we need to
+        return self.import_slots.slot(class_name)
 
     def resolve_jumps(self):
         """Patch up references to code labels"""
-        for (patch_loc, patch_label) in self.label_patch.items():
+        with self.phase("jumps"):
+            self._resolve_jumps()
+
+    def _resolve_jumps(self):
+        if self.stats is not None:
+            self.stats.count("patches", len(self.patch_addresses))
+        for patch_loc, label_number in zip(self.patch_addresses, self.patch_labels):
             assert self.code[patch_loc] == UNRESOLVED_ADDRESS
-            try:
-                label_loc =  self.labels[patch_label]
-                # PC will be patch loc + 1
-                jump_span = label_loc - (patch_loc + 1)
-                self.code[patch_loc] = jump_span
-                log.debug(f"Jump from loc {patch_loc} to {patch_label} "
-                          f"({label_loc}) is {jump_span} words")
-            except IndexError:
-                log.error(f"Unresolved label '{patch_label}'")
-
-    def add_int_constant(self, literal: str) -> int:
-        literal_index = len(self.int_constants)
-        self.int_constants.append(literal)
-        return literal_index
-
-    def add_str_constant(self, literal: str) -> int:
-        literal_index = len(self.str_constants)
-        self.str_constants.append(literal)
-        return literal_index
+            label_loc = self.label_addresses[label_number]
+            if label_loc < 0:
+                self.error(f"Unresolved label '{self.labels.names[label_number]}'")
+                continue
+            # PC will be patch loc + 1
+            self.code[patch_loc] = label_loc - (patch_loc + 1)
+
+    def label_number(self, label: str) -> int:
+        number = self.labels.add(label)
+        if number == len(self.label_addresses):
+            self.label_addresses.append(-1)
+        return number
+
+    def define_label(self, label: str):
+        """The label is the address of the next instruction"""
+        self.label_addresses[self.label_number(label)] = len(self.code)
+        self.last_label = label
+        self.n_labels += 1
 
     def add_label(self, label: str):
         """On a line by itself"""
-        self.labels[label] = len(self.code)
+        if self.holding:
+            self.body.append(label)
+        else:
+            self.define_label(label)
+
+    def set_source_line(self, line: int):
+        """Instructions that follow come from this line of
+        the program (say, in Quack) that was translated
+        """
+        self.source_line = line
 
     def add_instruction(self, instr: Instruction):
+        instr.line = self.line
+        instr.source_line = self.source_line
         if instr.label:
-            # Address of next instruction
-            self.labels[instr.label] = len(self.code)
+            self.add_label(instr.label)
+        if self.holding:
+            self.body.append(instr)
+        else:
+            with self.phase("encode"):
+                self.emit(instr)
+
+    def emit(self, instr: Instruction):
+        """Encode an instruction at the end of the current method"""
+        if self.mapped:
+            self.method_lines.append([len(self.code), instr.line,
+                                      self.last_label, instr.source_line])
+        self.encode_instruction(instr)
+        self.n_instructions += 1
+
+    def finish_method(self):
+        """Optimize (if asked) and encode the body of the
+        current method, then resolve its jumps and settle it
+        if we can.
+        """
+        body = self.body
+        with self.phase("optimize"):
+            if self.optimize:
+                before = sum(isinstance(item, Instruction) for item in body)
+                body = optimize(body, self.optimizer_hits, self.instrs)
+                after = sum(isinstance(item, Instruction) for item in body)
+                self.optimizer_removed += before - after
+            if self.fuse:
+                body = fuse(body, self.fusion_hits, self.instrs)
+        with self.phase("encode"):
+            for item in body:
+                if isinstance(item, str):
+                    self.define_label(item)
+                else:
+                    self.emit(item)
+        self.body = []
+        self.resolve_jumps()
+        if self.method_code:
+            method = self.method_code[-1]
+            method["arity"] = self.arities[method["name"]] = len(self.method_args)
+            own = {name for kind, name in map(self.refs._ref, set(self.refs.numbers))
+                   if kind == "method" and name.startswith("$:")}
+            self.pending.append((len(self.method_code) - 1,
+                                 sorted(name[2:] for name in own)))
+        if self.stats is not None and self.method_code:
+            self.stats.count("labels", self.n_labels)
+            self.stats.count("instructions", self.n_instructions)
+            self.stats.method(self.method_code[-1]["name"], self.n_instructions,
+                              len(self.code))
+        self.settle()
+
+    def encode_instruction(self, instr: Instruction):
         self.code.append(instr.operation.code)
-        if instr.operand:
+        if isinstance(instr, Superinstruction):
+            for part in instr.parts:
+                if part.operand:
+                    self.code.append(self.encode_operand(part))
+        elif instr.operand:
             # Many operands require interpretation
             # that depends on the operation
             op_value = self.encode_operand(instr)
             self.code.append(op_value)
 
     def encode_operand(self, instr: Instruction):
-        """Each operand type is idiosyncratic"""
-        op: str = instr.operation.name
-        operand: str = instr.operand
-        if op == "const":
-            # We have integer constants and string
-            # constants.  They reside in the same
-            # runtime table, but are initialized
-            # by different vm operations.  We need to
-            # keep them together in one list to give them
-            # consistent internal numbers that can be remapped
-            # in the loader.
-            if operand in NAMED_LITERALS:
-                return NAMED_LITERALS[operand]
-            if re.match("[0-9]+", operand):
-                kind = "i"
-            elif re.match('["][^"]*["]', operand):
-                kind = "s"
-                operand = operand.strip("\"").\
-                    encode("utf-8").decode("unicode_escape")
-            else:
-                log.error(f"Could not type operand '{operand}'")
-                kind = "BOGUS CONSTANT"
-            self.constants.append({"kind": kind, "value": operand})
-            return len(self.constants) - 1
-        if op == "call":
-            slot = self.resolve_call(operand)
-            return slot
-        if op in ["load_field", "store_field"]:
-            # These operations use indexes into the fields of an object
-            slot = self.resolve_field(operand)
-            return slot
-        if op in  ["new", "is_instance"]:
-            # We use an index into the list of modules
-            slot = self.resolve_class(operand)
+        """Each operand type is idiosyncratic, so we
+        dispatch on the operation to an operand encoder.
+        """
+        if instr.operation.kind in ["method", "field"]:
+            self.refs.add(len(self.code), instr.operation.kind, instr.operand)
+        encoder = OPERAND_ENCODERS.get(instr.operation.kind)
+        if encoder is None:
+            self.error(f"Unhandled operand type for {instr}")
+            return None
+        return encoder(self, instr.operand)
+
+    def encode_const(self, operand: str) -> int:
+        """We have integer constants and string
+        constants.  They reside in the same
+        runtime table, but are initialized
+        by different vm operations.  We need to
+        keep them together in one list to give them
+        consistent internal numbers that can be remapped
+        in the loader.
+        """
+        if operand in NAMED_LITERALS:
+            return NAMED_LITERALS[operand]
+        if operand[0].isdigit():
+            kind = "i"
+        elif operand[0] == '"' and operand[-1] == '"':
+            kind = "s"
+            operand = operand.strip("\"").\
+                encode("utf-8").decode("unicode_escape")
+        else:
+            self.error(f"Could not type operand '{operand}'")
+            kind = "BOGUS CONSTANT"
+        key = (kind, operand)
+        slot = self.constant_slots.get(key)
+        if slot is not None:
+            self.constants_saved += 1
             return slot
-        if op in ["load", "store"]:
-            return self.resolve_local(operand)
-        if op in ["return",  "alloc", "roll"]:
-            # These operations have integer operands that should be
-            # resolved by the compiler
-            return int(operand)
-        if op in ["jump", "jump_if", "jump_ifnot"]:
-            # Operand is a label, which we may not have seen yet.
-            # Leave it to be patched in the final label resolution step
-            self.label_patch[len(self.code)] = operand
-            return UNRESOLVED_ADDRESS
-        # Match should be exhaustive
-        log.error(f"Unhandled operand type for {instr}")
+        slot = len(self.constants)
+        self.constant_slots[key] = slot
+        self.constants.append({"kind": kind, "value": operand})
+        return slot
+
+    def encode_int(self, operand: str) -> int:
+        """Integer operands that should be
+        resolved by the compiler (return, alloc, roll)
+        """
+        return int(operand)
 
-    def json(self) -> str:
-        struct = {
+    def encode_label(self, operand: str) -> int:
+        """Operand is a label, which we may not have seen yet.
+        Leave it to be patched in the final label resolution step
+        """
+        self.patch_addresses.append(len(self.code))
+        self.patch_labels.append(self.label_number(operand))
+        return UNRESOLVED_ADDRESS
+
+    def struct(self) -> dict:
+        """The object code as a dict, which objfile
+        writes in binary or JSON form.
+        """
+        return {
             "class_name": self.class_name,
             "super": self.super_name,
-            "imports": [self.class_name] + list(IMPORTS)[1:],
-            "methods": self.method_list,
-            "fields": self.field_list,
+            "imports": [self.class_name] + self.import_slots.names[1:],
+            "methods": self.method_list.names,
+            "fields": self.field_list.names,
             # It's just simpler to count fields and methods
             # in the assembler than in the loader, so we'll add
             # some redundant information here.
@@ -453,18 +927,758 @@ class ObjectCode:
             "n_methods": len(self.method_list),
             "n_inherited": self.n_inherited,
             "constants": self.constants,
-            "code": self.method_code
+            "code": self.method_code,
+            "verified": self.verified
+        }
+
+    def source_map(self, asm: Optional[str] = None) -> dict:
+        """Where each instruction came from, by method:
+        [pc (word offset in the method), assembly line, label
+        (the last one at or before the instruction), source line]
+        """
+        return {
+            "class_name": self.class_name,
+            "asm": asm,
+            "methods": [dict(method, length=len(code["code"]))
+                        for method, code in zip(self.source_lines, self.method_code)]
         }
-        return json.dumps(struct, indent=4)
+
+    def json(self) -> str:
+        return objfile.to_json(self.struct())
+
+    def binary(self) -> bytes:
+        return objfile.to_binary(self.struct())
 
     def __str__(self) -> str:
         return self.json()
 
 
+# Operand kind (opdefs.txt) -> how to encode the operand
+OPERAND_ENCODERS: Dict[str, Callable[[ObjectCode, str], int]] = {
+    "const": ObjectCode.encode_const,
+    "method": ObjectCode.resolve_call,
+    # Indexes into the fields of an object
+    "field": ObjectCode.resolve_field,
+    # We use an index into the list of modules
+    "class": ObjectCode.resolve_class,
+    "local": ObjectCode.resolve_local,
+    "int": ObjectCode.encode_int,
+    "label": ObjectCode.encode_label,
+}
+
+
+# ----------------
+#  Control flow (-O):  Before applying the peephole rules, we
+#  follow each jump to where it finally lands, so chains of
+#  jumps through jump-only blocks become a single jump, and we
+#  drop code that no path from the method entry reaches
+#  (typically after a jump or return).
+#
+
+# Operations after which control never falls through
+NO_FALLTHROUGH = {"jump", "return", "halt"}
+JUMPS = {"jump", "jump_if", "jump_ifnot"}
+
+
+def _label_targets(body: MethodBody) -> Dict[str, int]:
+    """Label -> position of the instruction it labels
+    (len(body) for labels at the end of the method)
+    """
+    targets = {}
+    pending = []
+    for i, item in enumerate(body):
+        if isinstance(item, str):
+            pending.append(item)
+        else:
+            for label in pending:
+                targets[label] = i
+            pending = []
+    for label in pending:
+        targets[label] = len(body)
+    return targets
+
+
+def _jump_at(body: MethodBody, targets: Dict[str, int],
+             label: str) -> Optional[str]:
+    """If label marks an unconditional jump, where that jump goes"""
+    i = targets.get(label, len(body))
+    if i < len(body) and _is_op(body[i], "jump"):
+        return body[i].operand
+    return None
+
+
+def thread_jumps(body: MethodBody, hits: Dict[str, int]) -> MethodBody:
+    """Retarget jumps (conditional or not) that land
+    on an unconditional jump to where that one goes
+    """
+    targets = _label_targets(body)
+    threaded = list(body)
+    for i, item in enumerate(body):
+        if not _is_op(item, *JUMPS):
+            continue
+        label = item.operand
+        seen = {label}
+        onward = _jump_at(body, targets, label)
+        while onward is not None and onward not in seen:
+            # (A loop of jumps stops us where it closes)
+            label = onward
+            seen.add(label)
+            onward = _jump_at(body, targets, label)
+        if label != item.operand:
+            threaded[i] = _replacing(item, Instruction(None, item.operation, label))
+            hits["thread_jump"] = hits.get("thread_jump", 0) + 1
+    return threaded
+
+
+def drop_unreachable(body: MethodBody, hits: Dict[str, int]) -> MethodBody:
+    """Remove instructions that no path from the entry reaches.
+    Labels are kept; they cost nothing in the object code.
+    """
+    targets = _label_targets(body)
+    reachable = set()
+    work = [0]
+    while work:
+        i = work.pop()
+        while i < len(body) and i not in reachable:
+            item = body[i]
+            if isinstance(item, Instruction):
+                reachable.add(i)
+                name = item.operation.name
+                if name in JUMPS and item.operand in targets:
+                    work.append(targets[item.operand])
+                if name in NO_FALLTHROUGH:
+                    break
+            i += 1
+    kept = [item for i, item in enumerate(body)
+            if isinstance(item, str) or i in reachable]
+    dropped = len(body) - len(kept)
+    if dropped:
+        hits["unreachable"] = hits.get("unreachable", 0) + dropped
+    return kept
+
+
+def optimize(body: MethodBody, hits: Dict[str, int],
+             instrs: InstructionSet = INSTRS) -> MethodBody:
+    """Control flow passes, then peephole rules, until the
+    method stops shrinking (each can enable the other)
+    """
+    while True:
+        size = len(body)
+        body = thread_jumps(body, hits)
+        body = drop_unreachable(body, hits)
+        body = peephole(body, hits, instrs)
+        if len(body) == size:
+            return body
+
+
+# ----------------
+#  Superinstructions (--fuse):  After any optimization, we replace
+#  each run of instructions that matches a superinstruction, longest
+#  first, so the VM dispatches once for the whole run.  A label
+#  inside the run would be a jump into the middle of it, so runs
+#  never span labels.
+#
+
+def fuse(body: MethodBody, hits: Dict[str, int],
+         instrs: InstructionSet = INSTRS) -> MethodBody:
+    fused: MethodBody = []
+    i = 0
+    while i < len(body):
+        item = body[i]
+        for length in range(instrs.longest_superop, 1, -1):
+            run = body[i:i + length]
+            if len(run) < length or not all(isinstance(x, Instruction) for x in run):
+                continue
+            superop = instrs.superops.get(tuple(x.operation.name for x in run))
+            if superop is not None:
+                fused.append(Superinstruction(superop, run))
+                hits[superop.name] = hits.get(superop.name, 0) + 1
+                i += length
+                break
+        else:
+            fused.append(item)
+            i += 1
+    return fused
+
+
+# ----------------
+#  Peephole optimization (-O):  The translator emits many short
+#  sequences that do nothing useful at run time, and each
+#  instruction we remove is one less dispatch in the VM.
+#  A rule looks at the method body at one position and, if it
+#  recognizes its pattern there, returns how many items it
+#  matched and what to put in their place.  Labels are items
+#  of the body, so a pattern never spans a jump target unless
+#  the rule looks for one.
+#
+#  (store x; load x) cannot be shortened without an instruction
+#  that keeps the stored value on the stack, which we lack.
+#
+
+def _replacing(old: Instruction, new: Instruction) -> Instruction:
+    """new, attributed to the same source lines as old"""
+    new.line = old.line
+    new.source_line = old.source_line
+    return new
+
+
+def _is_op(item: Union[str, Instruction], *names: str) -> bool:
+    """Is item an instruction with one of these operations?"""
+    return isinstance(item, Instruction) and item.operation.name in names
+
+
+def _labels_at(body: MethodBody, i: int) -> List[str]:
+    """Labels at body[i:], up to the next instruction"""
+    labels = []
+    while i < len(body) and isinstance(body[i], str):
+        labels.append(body[i])
+        i += 1
+    return labels
+
+
+def _pair(body: MethodBody, i: int, first: Tuple[str, ...],
+          second: Tuple[str, ...]) -> bool:
+    """Adjacent instructions at body[i], body[i+1]"""
+    return (i + 1 < len(body) and _is_op(body[i], *first)
+            and _is_op(body[i + 1], *second))
+
+
+def _push_pop(body: MethodBody, i: int,
+              instrs: InstructionSet) -> Optional[Tuple[int, MethodBody]]:
+    """const or load whose value is immediately discarded"""
+    if _pair(body, i, ("const", "load"), ("pop",)):
+        return 2, []
+    return None
+
+
+def _load_store(body: MethodBody, i: int,
+                instrs: InstructionSet) -> Optional[Tuple[int, MethodBody]]:
+    """load x; store x changes nothing"""
+    if (_pair(body, i, ("load",), ("store",))
+            and body[i].operand == body[i + 1].operand):
+        return 2, []
+    return None
+
+
+def _jump_to_next(body: MethodBody, i: int,
+                  instrs: InstructionSet) -> Optional[Tuple[int, MethodBody]]:
+    """Jump to the instruction that follows anyway.  A conditional
+    jump still consumes its condition.
+    """
+    if (_is_op(body[i], "jump", "jump_if", "jump_ifnot")
+            and body[i].operand in _labels_at(body, i + 1)):
+        if body[i].operation.name == "jump":
+            return 1, []
+        return 1, [_replacing(body[i], Instruction(None, instrs["pop"], None))]
+    return None
+
+
+def _branch_over_jump(body: MethodBody, i: int,
+                      instrs: InstructionSet) -> Optional[Tuple[int, MethodBody]]:
+    """jump_if L; jump M; L:  is  jump_ifnot M; L:  (and vice versa)"""
+    if (_pair(body, i, ("jump_if", "jump_ifnot"), ("jump",))
+            and body[i].operand in _labels_at(body, i + 2)):
+        inverse = {"jump_if": "jump_ifnot", "jump_ifnot": "jump_if"}
+        branch = instrs[inverse[body[i].operation.name]]
+        return 2, [_replacing(body[i], Instruction(None, branch, body[i + 1].operand))]
+    return None
+
+
+PeepholeRule = Callable[[MethodBody, int, InstructionSet],
+                        Optional[Tuple[int, MethodBody]]]
+
+# Rule name -> rule, tried in this order at each position
+PEEPHOLE_RULES: Dict[str, PeepholeRule] = {
+    "push_pop": _push_pop,
+    "load_store": _load_store,
+    "jump_to_next": _jump_to_next,
+    "branch_over_jump": _branch_over_jump,
+}
+
+
+def _instruction_before(body: MethodBody, i: int) -> int:
+    """Position of the last instruction before body[i], or 0"""
+    i -= 1
+    while i > 0 and not isinstance(body[i], Instruction):
+        i -= 1
+    return max(i, 0)
+
+
+def peephole(body: MethodBody, hits: Dict[str, int],
+             instrs: InstructionSet = INSTRS) -> MethodBody:
+    """Apply the rules until none matches, counting matches in hits"""
+    body = list(body)
+    i = 0
+    while i < len(body):
+        for name, rule in PEEPHOLE_RULES.items():
+            match = rule(body, i, instrs)
+            if match is not None:
+                matched, replacement = match
+                body[i:i + matched] = replacement
+                hits[name] = hits.get(name, 0) + 1
+                # No rule matches more than two instructions (and
+                # the labels after them), so a rewrite can only
+                # complete a pattern starting up to two back.
+                i = _instruction_before(body, _instruction_before(body, i))
+                break
+        else:
+            i += 1
+    return body
+
+
+# ----------------
+#  Frame sizes:  The words a method pushes on its frame (its
+#  locals, then the evaluation stack) are bounded, and we find the
+#  bound as the JVM finds max_stack:  following every path through
+#  the encoded method from its entry, applying the stack effect of
+#  each instruction (opdefs.txt) and taking the deepest stack seen
+#  where paths join.  The loader records it so the VM can check
+#  once, at the call, that the whole frame fits on its stack.
+#  A call pops the receiver and the arguments of the method
+#  called, so we need the arity of every method a method calls.
+#
+
+# Receiver, return address, and saved frame pointer (see resolve_local)
+FRAME_HEADER = 3
+
+
+class FrameError(Exception):
+    """The stack of a method is not bounded as it must be"""
+
+
+def _words(effect: StackEffect, operand: Optional[int],
+           arity: Optional[int]) -> int:
+    """A stack effect (opdefs.txt) as a count of words"""
+    if isinstance(effect, int):
+        return effect
+    if effect == "n":
+        return operand
+    if effect == "n+1":
+        return operand + 1
+    return arity + 1
+
+
+# Encoded method code
+Code = Union[List[int], "array[int]"]
+
+# An operation of a decoded instruction:  its definition, its
+# operand (or None), and the position of the operand in the code
+DecodedPart = Tuple[InstructionDef, Optional[int], int]
+
+
+def decode_one(code: Code, pc: int, instrs: InstructionSet
+               ) -> Tuple[List[DecodedPart], int]:
+    """(operations, pc of the next instruction) of the instruction
+    at pc.  Raises FrameError for a byte code that is not an
+    instruction.
+    """
+    op = instrs.by_code.get(code[pc])
+    if op is None:
+        raise FrameError(f"unknown operation {code[pc]} at {pc}")
+    parts = []
+    at = pc + 1
+    for name in op.parts:
+        part = instrs[name]
+        operand = None
+        if part.ops:
+            if at >= len(code):
+                raise FrameError(f"operand of {name} at {pc} missing")
+            operand = code[at]
+            at += 1
+        parts.append((part, operand, at - 1))
+    return parts, at
+
+
+def decode(code: Code, instrs: InstructionSet
+           ) -> Iterator[Tuple[int, List[DecodedPart], int]]:
+    """(pc, operations, pc of the next instruction) for each
+    instruction of encoded method code, in order
+    """
+    pc = 0
+    while pc < len(code):
+        parts, at = decode_one(code, pc, instrs)
+        yield pc, parts, at
+        pc = at
+
+
+def successors(parts: List[DecodedPart], at: int) -> List[int]:
+    """Where control may go after an instruction ending at at"""
+    targets = [at + operand for part, operand, _ in parts if part.kind == "label"]
+    if parts[-1][0].name not in NO_FALLTHROUGH:
+        targets.append(at)
+    return targets
+
+
+class DecodedMethod:
+    """Encoded method code, decoded once for every pass that
+    follows paths through it.  Identical instructions share one
+    list of decoded operations, with each operand's position given
+    relative to the instruction, so a method held decoded costs a
+    few words per instruction.  We also note which positions start
+    an instruction and which start a basic block:  the entry, every
+    jump target, and every instruction after a jump, return, or
+    halt.  Paths need only be followed block by block, and what
+    we know about them kept only where blocks start.
+    Raises FrameError for code that does not decode.
+    """
+    def __init__(self, code: Code, instrs: InstructionSet):
+        self.length = len(code)
+        # Instruction at each position, or -1 within one
+        self.index = array("i", [-1]) * len(code)
+        self.leaders = bytearray(len(code))
+        # pc, decoded operations, and pc of the next, by instruction
+        self.pcs = array("i")
+        self.ends = array("i")
+        self.parts: List[List[DecodedPart]] = []
+        self.locals_words = 0   # Pushed by alloc instructions
+        self.bound = 0          # Most any path without loops could push
+        shapes: Dict[tuple, Tuple[List[DecodedPart], int]] = {}
+        if code:
+            self.leaders[0] = 1
+        pc = 0
+        while pc < len(code):
+            op = instrs.by_code.get(code[pc])
+            if op is None:
+                raise FrameError(f"unknown operation {code[pc]} at {pc}")
+            at = pc + 1 + op.ops
+            key = tuple(code[pc:at])
+            shape = shapes.get(key)
+            if shape is None:
+                parts, at = decode_one(code, pc, instrs)
+                parts = [(part, operand, where - pc) for part, operand, where in parts]
+                pushes = sum(_words(part.pushes, operand, None)
+                             for part, operand, _ in parts)
+                shape = shapes[key] = (parts, pushes)
+            parts, pushes = shape
+            self.index[pc] = len(self.pcs)
+            self.pcs.append(pc)
+            self.ends.append(at)
+            self.parts.append(parts)
+            self.bound += pushes
+            last = parts[-1][0]
+            if last.name == "alloc":
+                self.locals_words += parts[-1][1]
+            if last.kind == "label" or last.name in NO_FALLTHROUGH:
+                if at < len(code):
+                    self.leaders[at] = 1
+                for successor in successors(parts, at):
+                    if 0 <= successor < len(code):
+                        self.leaders[successor] = 1
+            pc = at
+
+    def is_instruction(self, pc: int) -> bool:
+        return 0 <= pc < self.length and self.index[pc] >= 0
+
+    def block(self, pc: int) -> Iterator[Tuple[int, List[DecodedPart], int]]:
+        """(pc, operations, pc of the next) for each instruction
+        of the basic block starting at pc; the position of each
+        operand is relative to pc
+        """
+        i = self.index[pc]
+        while True:
+            at = self.ends[i]
+            yield self.pcs[i], self.parts[i], at
+            if at >= self.length or self.leaders[at]:
+                return
+            i += 1
+
+
+class Worklist:
+    """Basic blocks still to follow, lowest address first, each
+    at most once at a time.  Following paths in address order
+    settles what we know at the top of a loop before we go on
+    past it, rather than again for everything after it.
+    """
+    def __init__(self, starts: Iterable[int] = ()):
+        self.heap = sorted(set(starts))
+        self.queued = set(self.heap)
+
+    def add(self, pc: int):
+        if pc not in self.queued:
+            self.queued.add(pc)
+            heapq.heappush(self.heap, pc)
+
+    def pop(self) -> int:
+        pc = heapq.heappop(self.heap)
+        self.queued.discard(pc)
+        return pc
+
+    def __bool__(self) -> bool:
+        return bool(self.heap)
+
+
+class PathWalker(abc.ABC):
+    """Follows every path through a decoded method, block by
+    block, keeping what we know where each block starts and
+    joining it with what each path brings there.  Subclasses
+    say what that state is, how each operation changes it, and
+    how states join; each tracks the deepest the stack goes.
+    """
+    error = FrameError
+
+    def __init__(self, method: DecodedMethod):
+        self.method = method
+        self.pc = 0
+        self.deepest = 0
+
+    def walk(self, entry):
+        method = self.method
+        states = {0: entry} if method.length else {}
+        work = Worklist(states)
+        while work:
+            start = work.pop()
+            self.enter(states[start])
+            for self.pc, parts, at in method.block(start):
+                for part, operand, offset in parts:
+                    self.step(part, operand, self.pc + offset)
+            out = self.leave()
+            for successor in successors(parts, at):
+                if not method.is_instruction(successor):
+                    raise self.error(f"jump from {self.pc} to {successor}, "
+                                     f"which is not an instruction")
+                old = states.get(successor)
+                joined = out if old is None else self.join(old, out, successor)
+                if joined != old:
+                    states[successor] = joined
+                    work.add(successor)
+
+    @abc.abstractmethod
+    def enter(self, state):
+        """Start a block in this state"""
+
+    @abc.abstractmethod
+    def step(self, part: InstructionDef, operand: Optional[int], where: int):
+        """Apply one part of the instruction at where"""
+
+    @abc.abstractmethod
+    def leave(self):
+        """The state at the end of the block"""
+
+    @abc.abstractmethod
+    def join(self, old, new, pc: int):
+        """The state at pc, where a path bringing new meets old"""
+
+
+class FrameDepth(PathWalker):
+    """The depth of the stack along every path; where paths
+    join, the deeper.  arity_of gives the arity of the method
+    called by the call whose operand is at a position.
+    """
+    def __init__(self, method: DecodedMethod, arity_of: Callable[[int], int]):
+        super().__init__(method)
+        self.arity_of = arity_of
+        self.depth = 0
+
+    def measure(self) -> Tuple[int, int]:
+        """(locals, max_stack):  the words the method's alloc
+        instructions push, and the most words above them on the
+        stack along any path.  Raises FrameError if the stack
+        can underflow or grow forever.
+        """
+        self.walk(0)
+        locals_words = self.method.locals_words
+        return locals_words, max(self.deepest - locals_words, 0)
+
+    def enter(self, depth: int):
+        self.depth = depth
+
+    def step(self, part: InstructionDef, operand: Optional[int], where: int):
+        arity = self.arity_of(where) if part.kind == "method" else None
+        pops = _words(part.pops, operand, arity)
+        if self.depth < pops:
+            raise FrameError(f"stack underflow at {self.pc}")
+        self.depth += _words(part.pushes, operand, arity) - pops
+        if self.depth > self.deepest:
+            self.deepest = self.depth
+
+    def leave(self) -> int:
+        if self.depth > self.method.bound:
+            raise FrameError(f"stack grows without bound in a loop at {self.pc}")
+        return self.depth
+
+    def join(self, old: int, new: int, pc: int) -> int:
+        return max(old, new)
+
+
 # ----------------
-#  Assembly code is line-oriented and can be parsed
-#  with regular expressions.  We strip away comments
-#  and then scan for label, operation, and operand fields.
+#  Verification:  A VM built with VM_UNCHECKED runs the code of a
+#  class without its run-time checks (of object health, Boolean
+#  conditions, and so on) if the object file says the class was
+#  verified.  Following every path through each method, as
+#  FrameDepth does, but keeping the class of each value on the
+#  stack and in each local variable where we can tell, we prove
+#  that jumps land on instructions within the method, that the
+#  stack is equally deep wherever paths join, that constant,
+#  local, field, method and class operands are in range, and that
+#  jump_if and jump_ifnot test a Bool.  A class is verified only
+#  if all of its methods are; if not, its code keeps the checks.
+#  Verifying costs about as much as the rest of assembly, and
+#  only a VM built with VM_UNCHECKED gains from it, so we verify
+#  only when asked (--verify, or VERIFY in asm.conf).  Its walk
+#  measures the stack as it goes, so a verified method needs no
+#  separate FrameDepth walk.
+#
+
+ANY = ""    # Class of a value, where we cannot tell
+
+# Constant operands for the named literals (NAMED_LITERALS)
+LITERAL_CLASSES = {-1: "Nothing", -2: "Bool", -3: "Bool"}
+CONSTANT_CLASSES = {"i": "Int", "s": "String"}
+
+
+class VerifyError(Exception):
+    """A property of a method the verifier could not prove"""
+
+
+# Classes of the values on the stack (top last), and of
+# the arguments, receiver and local variables of the frame
+AbstractFrame = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _join(old: AbstractFrame, new: AbstractFrame, pc: int) -> AbstractFrame:
+    """Where two paths meet, what holds on both"""
+    if len(old[0]) != len(new[0]):
+        raise VerifyError(f"stack depth {len(old[0])} or {len(new[0])} at {pc}")
+    if len(old[1]) != len(new[1]):
+        raise VerifyError(f"local variables allocated on one path only at {pc}")
+    return tuple(tuple(a if a == b else ANY for a, b in zip(old_part, new_part))
+                 for old_part, new_part in zip(old, new))
+
+
+class MethodVerifier(PathWalker):
+    """Follows the paths through one method of a class"""
+    error = VerifyError
+
+    def __init__(self, objcode: "ObjectCode", decoded: DecodedMethod,
+                 method: dict, refs: OperandRefs):
+        super().__init__(decoded)
+        self.objcode = objcode
+        self.arity: int = method["arity"]
+        self.refs = refs
+        # State at the instruction being checked
+        self.stack: List[str] = []
+        self.slots: List[str] = []
+
+    def verify(self):
+        """Raises VerifyError (or FrameError) for the first
+        property we cannot prove
+        """
+        self.walk(((), (ANY,) * self.arity + (self.objcode.class_name,)))
+
+    def enter(self, frame: AbstractFrame):
+        self.stack, self.slots = map(list, frame)
+
+    def step(self, part: InstructionDef, operand: Optional[int], where: int):
+        self.check(part, operand, where)
+        if len(self.stack) > self.deepest:
+            self.deepest = len(self.stack)
+
+    def leave(self) -> AbstractFrame:
+        return tuple(self.stack), tuple(self.slots)
+
+    def join(self, old: AbstractFrame, new: AbstractFrame, pc: int) -> AbstractFrame:
+        return _join(old, new, pc)
+
+    def pop(self, n: int = 1) -> List[str]:
+        if len(self.stack) < n:
+            raise VerifyError(f"stack underflow at {self.pc}")
+        popped = self.stack[len(self.stack) - n:]
+        del self.stack[len(self.stack) - n:]
+        return popped
+
+    def slot(self, offset: int) -> int:
+        """Index in self.slots of a frame offset (see resolve_local)"""
+        if -self.arity <= offset <= 0:
+            return self.arity + offset
+        if FRAME_HEADER <= offset < FRAME_HEADER + len(self.slots) - self.arity - 1:
+            return self.arity + 1 + offset - FRAME_HEADER
+        raise VerifyError(f"no local variable at {offset} (at {self.pc})")
+
+    def ref(self, where: int) -> Tuple[str, str]:
+        """Class and name the operand at where refers to"""
+        kind, full_name = self.refs.get(where)
+        class_name, name = full_name.split(":")
+        return class_name, name
+
+    def check(self, part: InstructionDef, operand: Optional[int], where: int):
+        """Check one operation, applying it to the state"""
+        objcode = self.objcode
+        name = part.name
+        if name in ["enter", "halt", "jump"]:
+            pass
+        elif name == "const":
+            if operand in LITERAL_CLASSES:
+                self.stack.append(LITERAL_CLASSES[operand])
+            elif 0 <= operand < len(objcode.constants):
+                self.stack.append(CONSTANT_CLASSES[objcode.constants[operand]["kind"]])
+            else:
+                raise VerifyError(f"no constant {operand} (at {self.pc})")
+        elif name == "call":
+            full_name = self.refs.get(where)[1]
+            arity = objcode.method_arity(full_name)
+            if arity is None:
+                raise VerifyError(f"arity of {full_name} not known")
+            n_methods, _ = objcode.class_layout(self.ref(where)[0])
+            if not 0 <= operand < n_methods:
+                raise VerifyError(f"no method {full_name} (at {self.pc})")
+            self.pop(arity + 1)
+            self.stack.append(objcode.method_returns(full_name) or ANY)
+        elif name == "return":
+            if operand != self.arity:
+                raise VerifyError(f"return {operand} from a method "
+                                  f"of {self.arity} arguments")
+            self.pop()
+        elif name in ["new", "is_instance"]:
+            if not 0 <= operand < len(objcode.import_slots):
+                raise VerifyError(f"no class {operand} (at {self.pc})")
+            if name == "new":
+                class_name = objcode.import_slots.names[operand]
+                self.stack.append(objcode.class_name if class_name == "$" else class_name)
+            else:
+                self.pop()
+                self.stack.append("Bool")
+        elif name == "pop":
+            self.pop()
+        elif name == "alloc":
+            if self.stack or operand < 0:
+                raise VerifyError(f"alloc {operand} above the stack (at {self.pc})")
+            self.slots += ["Nothing"] * operand
+        elif name == "load":
+            self.stack.append(self.slots[self.slot(operand)])
+        elif name == "store":
+            index = self.slot(operand)
+            self.slots[index] = self.pop()[0]
+        elif name in ["load_field", "store_field"]:
+            target = self.pop()[0]
+            class_name, field = self.ref(where)
+            _, n_fields = objcode.class_layout(class_name)
+            if not (objcode.is_subclass(target, class_name)
+                    and 0 <= operand < n_fields):
+                raise VerifyError(f"field {class_name}:{field} of "
+                                  f"{target or 'an object'} (at {self.pc})")
+            if name == "load_field":
+                self.stack.append(ANY)
+            else:
+                self.pop()
+        elif name == "roll":
+            if operand < 0:
+                raise VerifyError(f"roll {operand} (at {self.pc})")
+            rolled = self.pop(operand + 1)
+            self.stack += rolled[1:] + rolled[:1]
+        elif name in ["jump_if", "jump_ifnot"]:
+            if self.pop()[0] != "Bool":
+                raise VerifyError(f"{name} at {self.pc} may not test a Bool")
+        else:
+            raise VerifyError(f"{name} at {self.pc} is not verified")
+
+
+# ----------------
+#  Assembly code is line-oriented.  We strip away comments
+#  and then classify each line in a single pass:  a leading
+#  "." selects a directive, anything else is an instruction
+#  (optionally labeled) or a bare label.  Only operands and
+#  names are checked with regular expressions, and only once
+#  we know what kind of line we are looking at.
 #
 
 def strip_comments(line: str) -> str:
@@ -473,180 +1687,836 @@ def strip_comments(line: str) -> str:
     # as will blank lines.
 
 
-# Instruction pattern (single operation of vm)
-INSTR_PAT = re.compile(r"""
-    ((?P<label> \w+) [:] )?   # Optional label
-    \s*
-    (?P<opname> [a-zA-Z_]+)      # Operation name is required
-    (\s+ (?P<operand>     # Operands are integers, quoted strings, or names
-             [0-9]+           # Integers are strings of digits
-           |
-             ["](             # String begins and ends with quote 
-               ([\\].)  |           # Anything escaped
-               [^"\\]               # Anything but a quote or escape
-             )*["]
-           |
-             (\w|[:$])+         # name, which may be part:part or $:part
-             )
-    )?                # Operand is optional
-   \s*
+# Operands are integers, quoted strings, or names
+OPERAND_PAT = re.compile(r"""
+      [0-9]+            # Integers are strings of digits
+    |
+      ["](              # String begins and ends with quote
+        ([\\].)  |          # Anything escaped
+        [^"\\]              # Anything but a quote or escape
+      )*["]
+    |
+      (\w|[:$])+        # name, which may be part:part or $:part
     """, re.VERBOSE)
 
-# Bare labels
-LABEL_PAT = re.compile(r"""
-    ((?P<label> \w+):)   # Nothing but the label
-   \s*
-    """, re.VERBOSE)
+LABEL_NAME_PAT = re.compile(r"\w+")
+# Class names ($ is this class), method names ($constructor)
+CLASS_DECL_PAT = re.compile(r"(?P<class_name>[\w$]+):(?P<super_name>\w+)")
+METHOD_NAME_PAT = re.compile(r"[$]?\w+")
+# Comma-separated lists of field, local, and argument names
+NAME_LIST_PAT = re.compile(r"\w+(\s*,\s*\w+)*")
 
-# Directive:  Name this class
-CLASS_DECL_PAT = re.compile(r"""
-[.]class \s+ 
-(?P<class_name> [\w$]+ )[:](?P<super_name> \w+)
-\s*
-""", re.VERBOSE)
-
-# Directive: Name this method
-#   (Starts a new method entry in the code object)
-METHOD_DEF_PAT = re.compile(r"""
-[.]method \s+
-(?P<method_name> [$]?\w+ )
-\s*
-""", re.VERBOSE)
-
-# Directive:  Declare a method to be defined
-# later in this class, so we can call it before
-# we define it.
-METHOD_DECL_PAT = re.compile(r"""
-[.]method \s+ 
-(?P<method_name> [$]?\w+ )
-\s+ forward
-\s*
-""", re.VERBOSE)
-
-
-# Directive: Add a field to the objects of this class
-FIELD_DECL_PAT = re.compile(r"""
-[.]field \s+
-(?P<field_name> \w+ )
-\s*
-""", re.VERBOSE)
-
-# Local variable:  The assembler emits an "alloc" instruction
-#   and records the positions of local variables so that they
-#   can be used within method code.
-LOCALS_DECL_PAT = re.compile(r"""
-[.]local \s+
-(?P<local_var_name> (\w+)(,\w+)*)
-\s*
-""", re.VERBOSE)
-
-# Method argument:
-#    These will have addresses that are at a negative
-#    offset from the frame pointer
-ARGS_DECL_PAT = re.compile(r"""
-[.]args \s+
-(?P<arg_var_name> (\w+)(,\w+)*)
-\s*
-""", re.VERBOSE)
-
-
-def translate(lines: List[str]) -> ObjectCode:
-    code = ObjectCode()
-    for line in lines:
-        line = strip_comments(line)
-        if not line:
-            continue
 
-        # Kinds of assembly language line:
-        # Class declaration (.class)
-        match = CLASS_DECL_PAT.match(line)
-        if match:
-            class_name = match.groupdict()["class_name"]
-            superclass_name = match.groupdict()["super_name"]
-            code.declare_class(class_name, superclass_name)
-            continue
+def _names(directive: str, kind: str, rest: str) -> tuple:
+    if not NAME_LIST_PAT.fullmatch(rest):
+        return "error", f"Malformed name list '{directive} {rest}'"
+    return kind, tuple(name.strip() for name in rest.split(","))
 
-        # Method (.method f forward) to be filled in later
-        match = METHOD_DECL_PAT.match(line)
-        if match:
-            method_name = match.groupdict()["method_name"]
-            code.declare_method(method_name)
-            continue
 
-        # Method (.method) followed immediately by body
-        match = METHOD_DEF_PAT.match(line)
-        if match:
-            method_name = match.groupdict()["method_name"]
-            code.begin_method(method_name)
-            continue
+def _lex_class(rest: str) -> tuple:
+    """.class Name:Super"""
+    match = CLASS_DECL_PAT.fullmatch(rest)
+    if not match:
+        return "error", f"Malformed class declaration '.class {rest}'"
+    return "class", match.group("class_name"), match.group("super_name")
 
-        # Field declaration, ".field name"
-        match = FIELD_DECL_PAT.match(line)
-        if match:
-            field_name = match.groupdict()["field_name"]
-            code.declare_field(field_name)
-            continue
 
-        # Local variable declaration, ".local name,name,name"
-        match = LOCALS_DECL_PAT.match(line)
-        if match:
-            locals_name_list = match.groupdict()["local_var_name"]
-            method_locals = locals_name_list.split(",")
-            n_locals = len(method_locals)
-            # Allocate space on stack for local variables
-            code.add_instruction(Instruction(
-                label=None,
-                operation=INSTRS["alloc"],
-                operand=n_locals))
-            # Now set up locals symbol table information
-            code.declare_locals(method_locals)
-            continue
+def _lex_method(rest: str) -> tuple:
+    """.method name            (method body follows)
+       .method name forward    (declared to be defined later)
+    """
+    parts = rest.split()
+    if not parts or not METHOD_NAME_PAT.fullmatch(parts[0]):
+        return "error", f"Malformed method declaration '.method {rest}'"
+    if len(parts) == 1:
+        return "method", parts[0]
+    if len(parts) == 2 and parts[1] == "forward":
+        return "method_decl", parts[0]
+    return "error", f"Malformed method declaration '.method {rest}'"
+
+
+def _lex_line(rest: str) -> tuple:
+    """.line n   (what follows was translated from line n)"""
+    if not rest.isdigit():
+        return "error", f"Malformed line number '.line {rest}'"
+    return "line", int(rest)
+
+
+DIRECTIVES: Dict[str, Callable[[str], tuple]] = {
+    ".class": _lex_class,
+    ".method": _lex_method,
+    # .field name[,name...]
+    ".field": lambda rest: _names(".field", "fields", rest),
+    # .local name[,name...]   (also spelled .locals)
+    ".local": lambda rest: _names(".local", "locals", rest),
+    ".locals": lambda rest: _names(".locals", "locals", rest),
+    # .args name[,name...]
+    ".args": lambda rest: _names(".args", "args", rest),
+    ".line": _lex_line,
+}
 
-        # Local variable declaration, ".local name,name,name"
-        match = ARGS_DECL_PAT.match(line)
-        if match:
-            locals_name_list = match.groupdict()["arg_var_name"]
-            args = locals_name_list.split(",")
-            # No space allocation needed, unlike local variables,
-            # because these are *before* (at negative offsets from)
-            # the frame pointer.
-            # Set up locals symbol table information
-            code.declare_args(args)
-            continue
 
-        # An operation (label: operation operand)
-        match = INSTR_PAT.fullmatch(line)
-        if match:
-            parts = match.groupdict()
-            label = parts["label"]
-            opname = parts["opname"]
-            operand = parts["operand"]
-            instruction = Instruction(label, INSTRS[opname], operand)
-            code.add_instruction(instruction)
-            continue
+def lex(line: str, instrs: InstructionSet = INSTRS) -> Optional[tuple]:
+    """Classify one line of assembly code.  Returns None for
+    blank and comment lines, otherwise a tuple whose first element
+    is the kind of line ("class", "method", "instr", "label", ...,
+    or "error") and whose remaining elements are its parts.
+    """
+    line = strip_comments(line)
+    if not line:
+        return None
+    if line[0] == ".":
+        parts = line.split(None, 1)
+        lexer = DIRECTIVES.get(parts[0])
+        if lexer is None:
+            return "error", f"Unknown directive '{parts[0]}'"
+        return lexer(parts[1] if len(parts) > 1 else "")
+
+    # [label:] [operation [operand]]
+    label = None
+    parts = line.split(None, 1)
+    colon = parts[0].find(":")
+    if colon >= 0:
+        label = parts[0][:colon]
+        if not LABEL_NAME_PAT.fullmatch(label):
+            return "error", f"NO MATCH on '{line}'"
+        rest = parts[0][colon + 1:]
+        if rest:
+            parts[0] = rest
+        else:
+            del parts[0]
+            if not parts:
+                return "label", label
+            parts = parts[0].split(None, 1)
+    opname = parts[0]
+    operation = instrs.ops.get(opname)
+    if operation is None:
+        return "error", f"Unknown operation '{opname}' in '{line}'"
+    operand = parts[1].strip() if len(parts) > 1 else None
+    if operand is not None and not OPERAND_PAT.fullmatch(operand):
+        return "error", f"Malformed operand in '{line}'"
+    if (operation.ops == 0) != (operand is None):
+        return "error", f"Wrong number of operands in '{line}'"
+    return "instr", Instruction(label, operation, operand)
+
+
+def _declare_fields(code: ObjectCode, names: Tuple[str, ...]):
+    for name in names:
+        code.declare_field(name)
+
+
+def _declare_locals(code: ObjectCode, names: Tuple[str, ...]):
+    # Allocate space on stack for local variables
+    code.add_instruction(Instruction(
+        label=None,
+        operation=code.instrs["alloc"],
+        operand=str(len(names))))
+    # Now set up locals symbol table information
+    code.declare_locals(list(names))
+
+
+# Kind of line (from lex) -> what to do with it
+LINE_ACTIONS: Dict[str, Callable] = {
+    "class": ObjectCode.declare_class,
+    # Method (.method f forward) to be filled in later
+    "method_decl": ObjectCode.declare_method,
+    # Method (.method) followed immediately by body
+    "method": ObjectCode.begin_method,
+    "fields": _declare_fields,
+    "locals": _declare_locals,
+    # Arguments need no space allocation, unlike local variables,
+    # because they are *before* (at negative offsets from)
+    # the frame pointer.
+    "args": lambda code, names: code.declare_args(list(names)),
+    "instr": ObjectCode.add_instruction,
+    "label": ObjectCode.add_label,
+    "line": ObjectCode.set_source_line,
+    "error": ObjectCode.error,
+}
 
-        # A label with no instruction
-        # An operation (label: operation operand)
-        match = LABEL_PAT.match(line)
-        if not match:
-            log.error(f"NO MATCH on '{line}'")
-            continue
-        parts = match.groupdict()
-        label = parts["label"]
-        code.add_label(label)
 
+# ----------------
+#  The assembler:  Everything that assembling a class depends on
+#  besides its source (configuration, instruction set, and the
+#  layout of the modules it imports) belongs to an Assembler.
+#  Each call of assemble() builds its own ObjectCode, with its own
+#  import table (whose order defines the class indexes of that
+#  class), so one Assembler can assemble any number of classes in
+#  the same process, from any number of threads.  Metadata of
+#  imported modules is read once and shared by all of them.
+#
 
+class Assembler:
+    def __init__(self, config: Optional[Configuration] = None,
+                 instrs: InstructionSet = INSTRS,
+                 cache: Optional[AssemblyCache] = None,
+                 optimize: bool = False, fuse: bool = False,
+                 verify: bool = False):
+        self.config = config if config is not None else Configuration()
+        self.instrs = instrs
+        self.cache = cache
+        self.optimize = optimize
+        self.fuse = fuse
+        self.verify = verify
+        # What TVMLIB holds, from its manifest (read when first needed)
+        self.library = Manifest(self.config.tvmlib)
+        # Module metadata already read from disk (or supplied by a batch)
+        self.modules: Dict[str, ImportedModule] = {}
+        self._lock = threading.Lock()
+
+    def load_module(self, module: str) -> ImportedModule:
+        """Metadata for a module, from the TVMLIB manifest
+        (or the object file itself) at most once
+        """
+        found = self.modules.get(module)
+        if found is not None:
+            return found
+        with self._lock:
+            if module not in self.modules:
+                record = self.library.get(module)
+                if record is not None:
+                    self.modules[module] = ImportedModule(record)
+                else:
+                    path = objfile.find_object(self.config.tvmlib, module)
+                    self.modules[module] = ImportedModule.from_path(path)
+            return self.modules[module]
+
+    def _ancestry(self, class_name: str) -> Iterator[ImportedModule]:
+        """An imported class and its superclasses, as far as
+        we can read them
+        """
+        seen = set()
+        while class_name not in seen:
+            seen.add(class_name)
+            try:
+                module = self.load_module(class_name)
+            except (OSError, KeyError, ValueError):
+                return
+            yield module
+            class_name = module.json.get("super")
+
+    def lineage(self, class_name: str) -> List[str]:
+        """Names of an imported class and its superclasses"""
+        return [module.json["class_name"] for module in self._ancestry(class_name)]
+
+    def method_arity(self, class_name: str, method_name: str) -> Optional[int]:
+        """Arity of a method of an imported class, which may
+        inherit it, or None if we cannot tell
+        """
+        for module in self._ancestry(class_name):
+            if method_name in module.arities:
+                return module.arities[method_name]
+        return None
+
+    def method_returns(self, class_name: str, method_name: str) -> Optional[str]:
+        """Class of the result of a method of an imported class,
+        from its signature, or None if we do not have one
+        """
+        for module in self._ancestry(class_name):
+            signature = module.json.get("signatures", {}).get(method_name)
+            if signature is not None:
+                return signature.get("ret")
+            if method_name in module.arities:
+                return None
+        return None
+
+    def add_modules(self, modules: Dict[str, ImportedModule]):
+        """Use this metadata instead of reading it from TVMLIB"""
+        with self._lock:
+            self.modules.update(modules)
+
+    def assemble(self, lines: Iterable[str],
+                 stats: Optional[AssemblyStats] = None,
+                 mapped: bool = False,
+                 writer: Optional[objfile.ObjectWriter] = None,
+                 first_line: int = 1) -> ObjectCode:
+        """Object code for the source lines, which we read once,
+        in order (numbering them from first_line).  With a writer,
+        the code of each method goes to it as soon as the method
+        is settled, leaving the writer to be finished with the
+        struct() of the result.
+        """
+        code = ObjectCode(self, stats, mapped, writer)
+        lexer = lex
+        if stats is not None:
+            lexer = stats.timed("parse", lex)
+        for number, line in enumerate(lines, first_line):
+            token = lexer(line, self.instrs)
+            if token is not None:
+                code.line = number
+                LINE_ACTIONS[token[0]](code, *token[1:])
+        code.finish_method()  # The last method entered
+        code.settle(final=True)
+        if not code.class_name:
+            code.error("No .class directive")
+        code.verified = code.verified and code.errors == 0
+        if stats is not None:
+            stats.count("constants", len(code.constants))
+            stats.count("imports", len(code.import_slots) - 1)
+            stats.count("interned_literals", code.constants_saved)
+            if self.optimize:
+                stats.count("optimized_away", code.optimizer_removed)
+            if self.fuse:
+                stats.count("superinstructions", sum(code.fusion_hits.values()))
+        log.debug(f"{code.class_name}: {len(code.constants)} constants "
+                  f"({code.constants_saved} duplicate literals interned)")
+        if self.optimize:
+            rules = ", ".join(f"{name} {count}" for name, count
+                              in code.optimizer_hits.items())
+            log.debug(f"{code.class_name}: optimizer removed "
+                      f"{code.optimizer_removed} instructions ({rules})")
+        if self.fuse:
+            fused = ", ".join(f"{name} {count}" for name, count
+                              in code.fusion_hits.items())
+            log.debug(f"{code.class_name}: {sum(code.fusion_hits.values())} "
+                      f"superinstructions ({fused})")
+        return code
+
+    # Incremental assembly:  The object code for a source depends
+    # only on the source, the instruction set, and the method and
+    # field layout of the classes it refers to.  If we have assembled
+    # the same combination before, the cache has the result.
+
+    def import_signatures(self, summary: "SourceSummary") -> Optional[List[str]]:
+        """The layout of each class the source refers to, or
+        None if one of them cannot be read (so we must assemble
+        to report the problem).
+        """
+        signatures = []
+        for name in summary.references:
+            try:
+                module = self.load_module(name)
+            except (OSError, KeyError, ValueError):
+                return None
+            arities = ",".join(f"{method}/{arity}" for method, arity
+                               in sorted(module.arities.items()))
+            returns = ",".join(f"{method}>{signature.get('ret')}" for method, signature
+                               in sorted(module.json.get("signatures", {}).items()))
+            signatures.append(f"{name}({module.json.get('super')}):"
+                              f"{','.join(module.methods)}:{','.join(module.fields)}"
+                              f":{arities}:{returns}")
+        return signatures
+
+    def cache_key(self, lines: Callable[[], Iterable[str]],
+                  binary: bool) -> Optional[str]:
+        """Key of the source in the cache, reading it through
+        lines() (twice), or None if we cannot cache it
+        """
+        if self.cache is None:
+            return None
+        signatures = self.import_signatures(SourceSummary(lines(), self.instrs))
+        if signatures is None:
+            self.cache.misses += 1
+            return None
+        options = (("bin" if binary else "json")
+                   + (" -O" if self.optimize else "")
+                   + (" --fuse" if self.fuse else "")
+                   + (" --verify" if self.verify else ""))
+        return self.cache.key(lines(), self.instrs.digest, signatures, options)
+
+    def cached(self, key: Optional[str],
+               stats: Optional[AssemblyStats] = None) -> Optional[bytes]:
+        data = self.cache.get(key) if key is not None else None
+        if data is not None and stats is not None:
+            stats.count("cache_hits")
+            stats.count("output_bytes", len(data))
+        return data
+
+    def assemble_bytes(self, lines: List[str], binary: bool,
+                       stats: Optional[AssemblyStats] = None) -> bytes:
+        """Serialized object code for the source, from the cache if
+        we have assembled the same source against the same imports.
+        """
+        key = self.cache_key(lambda: lines, binary)
+        data = self.cached(key, stats)
+        if data is not None:
+            return data
+        objcode = self.assemble(lines, stats)
+        data = serialize(objcode, binary, stats)
+        if key is not None and objcode.errors == 0:
+            self.cache.put(key, data)
+        return data
+
+    def assemble_file(self, source: Path, target: Path,
+                      stats: Optional[AssemblyStats] = None):
+        """Assemble a source file into a binary object file,
+        reading the source a line at a time and writing the code
+        of each method as soon as it is settled, so that memory
+        holds about one method rather than the whole class.
+        """
+        self.assemble_stream(file_lines(source), target, stats)
 
-    code.resolve_jumps()  # Of the last method entered
-    return code
+    def assemble_stream(self, lines: Callable[[], Iterable[str]], target: Path,
+                        stats: Optional[AssemblyStats] = None, first_line: int = 1):
+        """Assemble the source lines() gives into a binary object
+        file as assemble_file does.  The cache, if we have one,
+        calls lines() to read the source before we assemble it.
+        """
+        key = self.cache_key(lines, binary=True)
+        data = self.cached(key, stats)
+        if data is not None:
+            with phase(stats, "write"):
+                write_bytes(data, target)
+            return
+        n_lines = 0
+
+        def counted() -> Iterator[str]:
+            nonlocal n_lines
+            for n_lines, line in enumerate(lines(), 1):
+                yield line
+
+        with open(target, "wb") as f:
+            writer = objfile.ObjectWriter(f)
+            objcode = self.assemble(counted(), stats, writer=writer,
+                                    first_line=first_line)
+            with phase(stats, "write"):
+                writer.finish(objcode.struct())
+            if stats is not None:
+                stats.count("lines", n_lines)
+                stats.count("output_bytes", f.tell())
+        if key is not None and objcode.errors == 0:
+            self.cache.put_file(key, target)
+
+    def assemble_mapped(self, lines: List[str], binary: bool,
+                        stats: Optional[AssemblyStats] = None,
+                        asm: Optional[str] = None,
+                        first_line: int = 1) -> Tuple[bytes, dict]:
+        """Serialized object code and its source map.  The cache
+        has no source maps, so this always assembles.
+        """
+        objcode = self.assemble(lines, stats, mapped=True, first_line=first_line)
+        return serialize(objcode, binary, stats), objcode.source_map(asm)
+
+    def assemble_unit(self, lines: Callable[[], Iterable[str]], outdir: Path,
+                      binary: bool, stats: Optional[AssemblyStats] = None,
+                      mapped: bool = False, asm: Optional[str] = None) -> List[Path]:
+        """Assemble each class of a unit (see "Assembly units")
+        into outdir/<class>.tvm (or .json), superclasses first.
+        lines() gives the whole source each time we call it.
+        Returns the object files written.
+        """
+        sections = class_sections(lines())
+        summaries = [SourceSummary(class_section(lines, *where)(), self.instrs)
+                     for where in sections]
+        self.add_modules(batch_modules(self, summaries))
+        suffix = ".tvm" if binary else ".json"
+        targets = []
+        for i in superclasses_first(summaries):
+            first_line = sections[i][0]
+            part = class_section(lines, *sections[i])
+            target = outdir.joinpath(summaries[i].class_name or "_").with_suffix(suffix)
+            if binary and not mapped:
+                self.assemble_stream(part, target, stats, first_line)
+            else:
+                source = list(part())
+                if stats is not None:
+                    stats.count("lines", len(source))
+                if mapped:
+                    data, source_map = self.assemble_mapped(source, binary, stats,
+                                                            asm, first_line)
+                else:
+                    data = self.assemble_bytes(source, binary, stats)
+                with phase(stats, "write"):
+                    write_bytes(data, target)
+                    if mapped:
+                        write_map(source_map, target)
+            targets.append(target)
+        return targets
+
+
+def serialize(objcode: ObjectCode, binary: bool,
+              stats: Optional[AssemblyStats] = None) -> bytes:
+    with phase(stats, "serialize"):
+        if binary:
+            data = objcode.binary()
+        else:
+            data = objcode.json().encode("utf-8") + b"\n"
+    if stats is not None:
+        stats.count("output_bytes", len(data))
+    return data
+
+
+# ----------------
+#  Batch assembly:  Many classes in one invocation, spread
+#  over a pool of worker processes.  Each worker would otherwise
+#  re-read the same imported modules for every class, so we
+#  read them once here and hand the workers a read-only copy.
+#  Classes in the batch may import each other; we obtain their
+#  method and field layout from a quick scan of the source
+#  rather than waiting for the importee's object file.
+#
+
+class SourceSummary:
+    """What a quick scan of assembly source tells us about a class
+    without assembling it:  its own fields and methods (in order),
+    the arities of the methods it defines, and the names of the
+    classes it refers to.
+    """
+    def __init__(self, lines: Iterable[str], instrs: InstructionSet = INSTRS):
+        self.class_name: Optional[str] = None
+        self.super_name: Optional[str] = None
+        self.methods: List[str] = []
+        self.fields: List[str] = []
+        self.arities: Dict[str, int] = {}
+        self.references: List[str] = []
+        method = None
+        for line in lines:
+            token = lex(line, instrs)
+            if token is None:
+                continue
+            kind = token[0]
+            if kind == "class":
+                self.class_name, self.super_name = token[1], token[2]
+                self.refer(self.super_name)
+            elif kind in ["method", "method_decl"]:
+                if token[1] not in self.methods:
+                    self.methods.append(token[1])
+                if kind == "method":
+                    method = token[1]
+                    self.arities[method] = 0
+            elif kind == "args" and method is not None:
+                self.arities[method] = len(token[1])
+            elif kind == "fields":
+                self.fields.extend(token[1])
+            elif kind == "instr" and token[1].operand:
+                operand_kind = token[1].operation.kind
+                operand = token[1].operand
+                if operand_kind == "class":
+                    self.refer(operand)
+                elif operand_kind in ["method", "field"]:
+                    self.refer(operand.split(":")[0])
+
+    def refer(self, class_name: str):
+        if class_name != "$" and class_name not in self.references:
+            self.references.append(class_name)
+
+
+def batch_sources(paths: List[Path]) -> List[Path]:
+    """Expand directories into the .asm files they contain"""
+    sources = []
+    for path in paths:
+        if path.is_dir():
+            sources.extend(sorted(path.glob("*.asm")))
+        else:
+            sources.append(path)
+    return sources
+
+
+def batch_modules(assembler: Assembler,
+                  summaries: List[SourceSummary]) -> Dict[str, ImportedModule]:
+    """Module metadata for everything the batch refers to.
+    Classes in the batch are laid out from their summaries,
+    inheriting from superclasses in the batch or in TVMLIB.
+    """
+    in_batch = {s.class_name: s for s in summaries if s.class_name}
+    modules: Dict[str, ImportedModule] = {}
+
+    def layout(name: str, pending: Tuple[str, ...] = ()) -> ImportedModule:
+        if name in modules:
+            return modules[name]
+        if name not in in_batch or name in pending:
+            # Library class, or a cycle we can only break
+            # with an object file from an earlier build
+            module = assembler.load_module(name)
+        else:
+            summary = in_batch[name]
+            parent = layout(summary.super_name, pending + (name,))
+            methods = parent.methods.copy()
+            for method_name in summary.methods:
+                methods.add(method_name)
+            module = ImportedModule({
+                "class_name": name,
+                "super": summary.super_name,
+                "methods": methods.names,
+                "fields": parent.fields.names + summary.fields,
+                "arities": summary.arities})
+        modules[name] = module
+        return module
+
+    for summary in summaries:
+        for name in [summary.class_name] + summary.references:
+            if name is None:
+                continue
+            try:
+                layout(name)
+            except (OSError, KeyError, ValueError) as e:
+                # The worker will report it when it needs the module
+                log.warning(f"Could not read module {name}: {e}")
+    return modules
+
+
+# ----------------
+#  Assembly units:  One source may hold several classes, each
+#  running from its .class directive to the next (the translator
+#  writes a whole program that way).  We lay out the classes from
+#  a scan of the unit, as for a batch, so they may refer to one
+#  another, then assemble each into an object file of its own,
+#  superclasses first, in the one process.
+#
+
+CLASS_DIRECTIVE = re.compile(r"\s*\.class\b")
+
+
+def file_lines(source: Path) -> Callable[[], Iterator[str]]:
+    """The lines of a source file, read afresh on each call"""
+    def lines() -> Iterator[str]:
+        with open(source, "r") as f:
+            yield from f
+    return lines
+
+
+def class_sections(lines: Iterable[str]) -> List[Tuple[int, int]]:
+    """(first line number, number of lines) of each class of a
+    source; any lines before the first .class go with it
+    """
+    starts = []
+    n_lines = 0
+    for n_lines, line in enumerate(lines, 1):
+        if CLASS_DIRECTIVE.match(line):
+            starts.append(n_lines)
+    if not starts:
+        return [(1, n_lines)]
+    starts[0] = 1
+    ends = starts[1:] + [n_lines + 1]
+    return [(start, end - start) for start, end in zip(starts, ends)]
+
+
+def class_section(lines: Callable[[], Iterable[str]], start: int, count: int
+                  ) -> Callable[[], Iterable[str]]:
+    """The lines of one class of a unit, of those lines() gives"""
+    return lambda: itertools.islice(lines(), start - 1, start - 1 + count)
+
+
+def superclasses_first(summaries: List[SourceSummary]) -> List[int]:
+    """Indexes of the classes of a unit in source order, except
+    that each follows its superclass if that is in the unit too
+    """
+    index = {s.class_name: i for i, s in enumerate(summaries) if s.class_name}
+    order: List[int] = []
+    placed = set()
+
+    def place(i: int, pending: Tuple[int, ...] = ()):
+        if i in placed or i in pending:
+            return      # A cycle is reported when we assemble
+        parent = index.get(summaries[i].super_name)
+        if parent is not None:
+            place(parent, pending + (i,))
+        placed.add(i)
+        order.append(i)
+
+    for i in range(len(summaries)):
+        place(i)
+    return order
+
+
+# The assembler of a worker process
+_WORKER: Optional[Assembler] = None
+
+
+def _batch_worker_init(config: Configuration, instrs: InstructionSet,
+                       cache: Optional[AssemblyCache], optimize: bool,
+                       fuse: bool, verify: bool,
+                       modules: Dict[str, ImportedModule]):
+    """Runs once in each worker process"""
+    global _WORKER
+    _WORKER = Assembler(config, instrs, cache, optimize, fuse, verify)
+    _WORKER.add_modules(modules)
+
+
+def _batch_assemble_one(job: Tuple[Path, Path, bool, bool, bool, bool]
+                        ) -> Tuple[Path, Optional[str], bool, Optional[dict]]:
+    """Assemble one source (one class, or a unit of several) in a
+    worker; returns an error message instead of raising, so one
+    bad class does not stop the batch, whether the object code
+    came from the cache, and statistics (if asked for).
+    """
+    source, target, binary, keep_stats, source_map, unit = job
+    stats = AssemblyStats() if keep_stats else None
+    if stats is not None:
+        stats.watch_logging(log)
+    cache = _WORKER.cache
+    hits = cache.hits if cache else 0
+    try:
+        if unit:
+            _WORKER.assemble_unit(file_lines(source), target.parent, binary,
+                                  stats, source_map, str(source))
+        elif binary and not source_map:
+            _WORKER.assemble_file(source, target, stats)
+        else:
+            with phase(stats, "read"):
+                with open(source, "r") as f:
+                    lines = f.readlines()
+            if stats is not None:
+                stats.count("lines", len(lines))
+            if source_map:
+                data, mapped = _WORKER.assemble_mapped(lines, binary, stats,
+                                                       str(source))
+            else:
+                data = _WORKER.assemble_bytes(lines, binary, stats)
+            with phase(stats, "write"):
+                write_bytes(data, target)
+                if source_map:
+                    write_map(mapped, target)
+    except Exception as e:
+        return source, f"{type(e).__name__}: {e}", False, None
+    finally:
+        if stats is not None:
+            stats.unwatch_logging()
+    hit = cache is not None and cache.hits > hits
+    return source, None, hit, stats.report() if stats else None
+
+
+def assemble_batch(assembler: Assembler, paths: List[Path], outdir: Path,
+                   jobs: Optional[int] = None, binary: bool = True,
+                   reports: Optional[Dict[str, dict]] = None,
+                   source_map: bool = False) -> int:
+    """Assemble each source into outdir/<source name>.tvm
+    (or .json), or each class of a unit into outdir/<class>.tvm,
+    with the configuration, instruction set, options, and cache
+    of assembler, and its source map if asked.  Returns the number
+    of sources that failed.  If reports is given, it gets the
+    statistics of each source.
+    """
+    sources = batch_sources(paths)
+    summaries = []
+    units = set()
+    for source in sources:
+        lines = file_lines(source)
+        sections = class_sections(lines())
+        if len(sections) > 1:
+            units.add(source)
+        for where in sections:
+            summaries.append(SourceSummary(class_section(lines, *where)(),
+                                           assembler.instrs))
+    modules = batch_modules(assembler, summaries)
+    assembler.add_modules(modules)
+    # Object file names follow source file names, as in
+    # single-file use (src/Foo.asm -> OBJ/Foo.tvm)
+    suffix = ".tvm" if binary else ".json"
+    jobs_list = [(source, outdir.joinpath(source.stem).with_suffix(suffix),
+                  binary, reports is not None, source_map, source in units)
+                 for source in sources]
+    cache = assembler.cache
+    failures = 0
+    with multiprocessing.Pool(jobs, initializer=_batch_worker_init,
+                              initargs=(assembler.config, assembler.instrs,
+                                        cache, assembler.optimize,
+                                        assembler.fuse, assembler.verify,
+                                        modules)) as pool:
+        chunk = max(1, len(jobs_list) // (4 * (jobs or multiprocessing.cpu_count())))
+        for source, error, hit, report in pool.imap_unordered(
+                _batch_assemble_one, jobs_list, chunksize=chunk):
+            if report is not None:
+                reports[str(source)] = report
+            if error:
+                log.error(f"Failed to assemble {source}: {error}")
+                failures += 1
+            elif cache is not None:
+                # Workers count in their own copies of the cache
+                if hit:
+                    cache.hits += 1
+                else:
+                    cache.misses += 1
+    log.info(f"Assembled {len(jobs_list) - failures} of {len(jobs_list)} sources"
+             f" ({len(summaries)} classes)")
+    if cache is not None:
+        log.info(cache.report())
+    return failures
+
+
+MAP_SUFFIX = ".map"
+
+
+def write_map(source_map: dict, target: Path):
+    """Write the source map for object file target beside it"""
+    with open(target.with_suffix(MAP_SUFFIX), "w") as f:
+        json.dump(source_map, f)
+
+
+def write_bytes(data: bytes, target: Optional[Path]):
+    """Write object code to a file, or to stdout if target is None"""
+    if target is None:
+        sys.stdout.buffer.write(data)
+        return
+    with open(target, "wb") as f:
+        f.write(data)
+
+
+def report_stats(report: dict, destination: str):
+    if destination == "-":
+        write_report(report, sys.stderr)
+    else:
+        with open(destination, "w") as f:
+            write_report(report, f)
 
 
 def main():
-    """Assemble one file into object code in json format"""
+    """Assemble one file into object code"""
     args = cli()
-    source = [line for line in args.source]
-    objcode = translate(source)
-    print(objcode.json(), file=args.target)
+    config = Configuration()
+    cache = AssemblyCache(config.asmcache) if args.cache else None
+    verify = config.verify if args.verify is None else args.verify
+    assembler = Assembler(config, cache=cache, optimize=args.optimize,
+                          fuse=args.fuse, verify=verify)
+    if args.batch is not None:
+        outdir = args.outdir or config.tvmlib
+        binary = args.format != "json"
+        reports = {} if args.stats else None
+        failures = assemble_batch(assembler, args.batch, outdir,
+                                  args.jobs, binary, reports, args.map)
+        if args.stats:
+            report_stats({"total": merge_reports(list(reports.values())),
+                          "classes": reports}, args.stats)
+        sys.exit(1 if failures else 0)
+    stats = AssemblyStats() if args.stats else None
+    if stats is not None:
+        stats.watch_logging(log)
+    if args.format:
+        binary = args.format == "bin"
+    else:
+        # JSON is for reading, so it is what we print to the terminal
+        binary = args.target is not None and args.target.suffix != ".json"
+    if args.source is sys.stdin:
+        lines = [line for line in args.source]
+        source = lambda: lines
+    else:
+        args.source.close()
+        source = file_lines(Path(args.source.name))
+    n_classes = len(class_sections(source()))
+    if n_classes > 1:
+        # A unit:  each class beside the target, or in --outdir
+        if args.target is not None:
+            outdir = args.target.parent
+        else:
+            outdir = args.outdir or config.tvmlib
+            binary = args.format != "json"
+        targets = assembler.assemble_unit(source, outdir, binary, stats,
+                                          args.map, args.source.name)
+        log.info(f"Assembled {n_classes} classes into {outdir}: "
+                 f"{', '.join(target.name for target in targets)}")
+    elif binary and args.target is not None and not args.map \
+            and args.source is not sys.stdin:
+        # Streamed from the source file to the object file
+        assembler.assemble_file(Path(args.source.name), args.target, stats)
+    else:
+        with phase(stats, "read"):
+            lines = list(source())
+        if stats is not None:
+            stats.count("lines", len(lines))
+        if args.map:
+            data, source_map = assembler.assemble_mapped(lines, binary, stats,
+                                                         args.source.name)
+        else:
+            data = assembler.assemble_bytes(lines, binary, stats)
+        with phase(stats, "write"):
+            write_bytes(data, args.target)
+            if args.map:
+                write_map(source_map, args.target)
+    if cache is not None:
+        log.debug(cache.report())
+    if stats is not None:
+        stats.unwatch_logging()
+        report_stats(stats.report(), args.stats)
 
 
 if __name__ == "__main__":
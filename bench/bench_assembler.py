@@ -0,0 +1,336 @@
+"""Micro-benchmarks of the assembler's hot paths, by input size.
+
+Each benchmark builds a synthetic input of growing size (methods
+per class, locals per method, labels per method, constants per
+class, classes imported) and measures one path through the
+assembler on it:  the time (best of --repeat) and the peak memory
+traced while it runs.  The exponent fitted to time and memory
+against size shows the complexity curve:  about 1 for linear
+work, 2 for quadratic.
+
+Results are written as JSON with sorted keys and rounded numbers,
+so the files of two commits can be diffed, or compared with
+--compare.
+
+Usage (from anywhere):
+    python3 bench/bench_assembler.py [--sizes 250,500,1000,2000,4000]
+        [--only NAME ...] [--output FILE] [--compare OLD.json]
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+os.chdir(ROOT)       # assemble.py reads asm.conf from cwd
+sys.path.insert(0, str(ROOT))
+import assemble     # noqa: E402
+from bench_lexer import synthetic_method     # noqa: E402
+
+FORMAT_VERSION = 1
+
+# Exponents above this suggest worse than linear growth
+SUPERLINEAR = 1.3
+
+
+# ----------------
+#  Synthetic inputs, as lists of source lines
+#
+
+def class_of_methods(n: int) -> List[str]:
+    """n methods of a few blocks each"""
+    lines = [".class Bench:Obj", ".field f"]
+    for m in range(n):
+        lines += synthetic_method(m, n_blocks=1)
+    return lines
+
+
+def method_of_locals(n: int) -> List[str]:
+    """One method that stores and loads each of n locals"""
+    names = [f"v{i}" for i in range(n)]
+    lines = [".class Bench:Obj", ".method m", f".local {','.join(names)}", "    enter"]
+    for name in names:
+        lines += ["    const 1", f"    store {name}", f"    load {name}", "    pop"]
+    return lines + ["    const nothing", "    return 0"]
+
+
+def method_of_labels(n: int) -> List[str]:
+    """One method of n labels, each the target of a forward
+    and a backward jump
+    """
+    lines = [".class Bench:Obj", ".method m", "    enter"]
+    for i in range(n):
+        lines += [f"    jump l{i}", f"b{i}:", "    const 1", "    pop",
+                  f"l{i}:", "    const true", f"    jump_ifnot b{i}"]
+    return lines + ["    const nothing", "    return 0"]
+
+
+def class_of_constants(n: int) -> List[str]:
+    """One method using n distinct constants, each twice"""
+    lines = [".class Bench:Obj", ".method m", "    enter"]
+    for i in range(n):
+        for _ in range(2):
+            lines += [f"    const \"constant {i}\"", "    pop", f"    const {i}", "    pop"]
+    return lines + ["    const nothing", "    return 0"]
+
+
+def with_newlines(lines: List[str]) -> List[str]:
+    return [line + "\n" for line in lines]
+
+
+def load_lines(code: assemble.ObjectCode, lines: List[str]):
+    """Feed lines to code as Assembler.assemble does, leaving
+    the last method unfinished
+    """
+    for number, line in enumerate(lines, 1):
+        token = assemble.lex(line, code.instrs)
+        if token is not None:
+            code.line = number
+            assemble.LINE_ACTIONS[token[0]](code, *token[1:])
+
+
+# ----------------
+#  Benchmarks:  each takes a size and returns a setup function,
+#  which prepares a fresh input (not measured) and returns the
+#  operation to measure
+#
+
+Setup = Callable[[], Callable[[], object]]
+
+
+def bench_assemble(fixture: Callable[[int], List[str]]) -> Callable[[int], Setup]:
+    def sized(n: int) -> Setup:
+        lines = with_newlines(fixture(n))
+
+        def setup() -> Callable[[], object]:
+            assembler = assemble.Assembler()
+            return lambda: assembler.assemble(lines)
+        return setup
+    return sized
+
+
+def bench_encode_operand(n: int) -> Setup:
+    """n loads of n locals, n distinct constants, and n calls"""
+    names = [f"v{i}" for i in range(n)]
+    instrs = []
+    for i, name in enumerate(names):
+        for line in [f"    load {name}", f"    const \"constant {i}\"",
+                     "    call String:print"]:
+            instrs.append(assemble.lex(line)[1])
+
+    def setup() -> Callable[[], object]:
+        code = assemble.ObjectCode(assemble.Assembler())
+        load_lines(code, [".class Bench:Obj", ".method m",
+                          f".local {','.join(names)}", "    enter"])
+
+        def encode():
+            for instr in instrs:
+                code.encode_operand(instr)
+        return encode
+    return setup
+
+
+def bench_resolve_jumps(n: int) -> Setup:
+    """One method of n labels and 2n jumps to patch"""
+    lines = method_of_labels(n)
+
+    def setup() -> Callable[[], object]:
+        code = assemble.ObjectCode(assemble.Assembler())
+        load_lines(code, lines)
+        return code.resolve_jumps
+    return setup
+
+
+def bench_import_module(n: int) -> Setup:
+    """n distinct classes imported"""
+    names = [f"Lib{i}" for i in range(n)]
+    modules = {name: assemble.ImportedModule({
+        "class_name": name, "super": "Obj",
+        "methods": ["$constructor", "string", "print", "equals", f"m{i}"],
+        "fields": ["x", "y"], "arities": {f"m{i}": 1}})
+        for i, name in enumerate(names)}
+
+    def setup() -> Callable[[], object]:
+        assembler = assemble.Assembler()
+        assembler.add_modules(modules)
+        code = assemble.ObjectCode(assembler)
+
+        def imports():
+            for name in names:
+                code.import_module(name)
+        return imports
+    return setup
+
+
+def bench_serialize(binary: bool) -> Callable[[int], Setup]:
+    """ObjectCode.json() (or binary()) of a class of n methods"""
+    def sized(n: int) -> Setup:
+        code = assemble.Assembler().assemble(with_newlines(class_of_methods(n)))
+
+        def setup() -> Callable[[], object]:
+            return code.binary if binary else code.json
+        return setup
+    return sized
+
+
+# name -> (what the size counts, benchmark)
+BENCHMARKS: Dict[str, tuple] = {
+    "assemble/methods": ("methods per class", bench_assemble(class_of_methods)),
+    "assemble/locals": ("locals per method", bench_assemble(method_of_locals)),
+    "assemble/labels": ("labels per method", bench_assemble(method_of_labels)),
+    "assemble/constants": ("constants per class", bench_assemble(class_of_constants)),
+    "encode_operand": ("locals, constants and calls per method", bench_encode_operand),
+    "resolve_jumps": ("labels per method", bench_resolve_jumps),
+    "import_module": ("classes imported", bench_import_module),
+    "json": ("methods per class", bench_serialize(binary=False)),
+    "binary": ("methods per class", bench_serialize(binary=True)),
+}
+
+
+# ----------------
+#  Measurement
+#
+
+def significant(x: float, digits: int = 4) -> float:
+    """Rounded, so that results files differ only where it matters"""
+    return float(f"{x:.{digits}g}")
+
+
+def measure(setup: Setup, repeat: int) -> dict:
+    """Best time of repeat runs, and peak memory traced in one more"""
+    best = math.inf
+    for _ in range(repeat):
+        operation = setup()
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    operation = setup()
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def exponent(sizes: List[int], values: List[float]) -> Optional[float]:
+    """Least-squares slope of log(value) against log(size)"""
+    points = [(math.log(n), math.log(v)) for n, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run(names: List[str], sizes: List[int], repeat: int) -> dict:
+    results = {}
+    for name in names:
+        unit, benchmark = BENCHMARKS[name]
+        points = []
+        for n in sizes:
+            point = measure(benchmark(n), repeat)
+            points.append(point)
+            log.info(f"{name} {n}: {point['seconds']:.4f} s, "
+                     f"{point['peak_bytes'] / 1024:,.0f} KB")
+        time_exp = exponent(sizes, [p["seconds"] for p in points])
+        memory_exp = exponent(sizes, [p["peak_bytes"] for p in points])
+        results[name] = {
+            "size": unit,
+            "points": [{"size": n, "seconds": significant(p["seconds"]),
+                        "peak_bytes": p["peak_bytes"]}
+                       for n, p in zip(sizes, points)],
+            "time_exponent": None if time_exp is None else round(time_exp, 2),
+            "memory_exponent": None if memory_exp is None else round(memory_exp, 2),
+        }
+    return {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def summary(report: dict) -> str:
+    lines = [f"{'benchmark':<20} {'largest':>8} {'seconds':>9} {'peak KB':>9} "
+             f"{'time exp':>9} {'mem exp':>8}"]
+    for name, result in report["benchmarks"].items():
+        last = result["points"][-1]
+        warn = ("  superlinear?" if (result["time_exponent"] or 0) > SUPERLINEAR
+                or (result["memory_exponent"] or 0) > SUPERLINEAR else "")
+        lines.append(f"{name:<20} {last['size']:>8} {last['seconds']:>9.4f} "
+                     f"{last['peak_bytes'] / 1024:>9,.0f} "
+                     f"{result['time_exponent']!s:>9} {result['memory_exponent']!s:>8}"
+                     f"{warn}")
+    return "\n".join(lines)
+
+
+def compare(old: dict, new: dict) -> str:
+    """Time and memory at the largest size common to both, and
+    the exponents, of each benchmark in both reports
+    """
+    lines = [f"{'benchmark':<20} {'size':>6} {'time':>7} {'memory':>7} "
+             f"{'time exp':>13} {'mem exp':>13}"]
+    for name, result in new["benchmarks"].items():
+        before = old["benchmarks"].get(name)
+        if before is None:
+            continue
+        old_points = {p["size"]: p for p in before["points"]}
+        common = [p for p in result["points"] if p["size"] in old_points]
+        if not common:
+            continue
+        now = common[-1]
+        then = old_points[now["size"]]
+
+        def ratio(key: str) -> str:
+            return f"{now[key] / then[key]:.2f}x" if then[key] else "-"
+        lines.append(f"{name:<20} {now['size']:>6} {ratio('seconds'):>7} "
+                     f"{ratio('peak_bytes'):>7} "
+                     f"{before['time_exponent']!s:>5} -> {result['time_exponent']!s:<5} "
+                     f"{before['memory_exponent']!s:>5} -> {result['memory_exponent']!s:<5}")
+    return "\n".join(lines)
+
+
+log = logging.getLogger("bench_assembler")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="250,500,1000,2000,4000",
+                        help="Comma-separated input sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS),
+                        help="Run only this benchmark (may be repeated)")
+    parser.add_argument("--output", default=None,
+                        help="Write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, default=None,
+                        help="Compare with the results of an earlier run")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Report each measurement as it is made")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    assemble.log.setLevel(logging.ERROR)    # Per-class info would dominate
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    report = run(args.only or list(BENCHMARKS), sizes, args.repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    print(summary(report))
+    if args.compare:
+        with open(args.compare) as f:
+            print()
+            print(compare(json.load(f), report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Throughput of Assembler.assemble() on large machine-generated listings.
+
+Generates a synthetic class in the style of new_translator.py output
+(locals, labels, conditional jumps, constants, calls) and reports
+lines per second for assembling it.
+
+Usage (from anywhere):  python3 bench/bench_lexer.py [--mb 4] [--repeat 3]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+os.chdir(ROOT)       # assemble.py reads asm.conf from cwd
+sys.path.insert(0, str(ROOT))
+import assemble     # noqa: E402
+
+
+def synthetic_method(m: int, n_locals: int = 8, n_blocks: int = 20) -> List[str]:
+    """One method body, roughly what the translator emits for
+    nested if/while code over a handful of Int locals.
+    """
+    names = [f"v{i}" for i in range(n_locals)]
+    lines = [f".method m{m}", ".args a", f".local {','.join(names)}", "    enter"]
+    for b in range(n_blocks):
+        x, y = names[b % n_locals], names[(b + 3) % n_locals]
+        lines += [
+            f"    const {b}",
+            f"    store {x}",
+            f"cond_{b}:",
+            f"    load {x}",
+            f"    load {y}",
+            f"    call Int:less",
+            f"    jump_if loop_{b}",
+            f"    jump endloop_{b}",
+            f"loop_{b}:",
+            f"    const \"block {b}\\n\"",
+            f"    call String:print",
+            f"    pop",
+            f"    const 1",
+            f"    load {x}",
+            f"    call Int:plus",
+            f"    store {x}",
+            f"    jump cond_{b}",
+            f"endloop_{b}:",
+        ]
+    lines += ["    const nothing", "    return 1"]
+    return lines
+
+
+def synthetic_listing(megabytes: float) -> List[str]:
+    lines = [".class Bench:Obj", ".field f"]
+    size = 0
+    m = 0
+    while size < megabytes * 1024 * 1024:
+        method = synthetic_method(m)
+        size += sum(len(line) + 1 for line in method)
+        lines += method
+        m += 1
+    return [line + "\n" for line in lines]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=4.0,
+                        help="Size of the synthetic listing in megabytes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    assemble.log.setLevel(logging.WARNING)   # Per-jump debug output would dominate
+    lines = synthetic_listing(args.mb)
+    assembler = assemble.Assembler()
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        assembler.assemble(lines)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{len(lines)} lines ({args.mb:.1f} MB): best of {args.repeat} "
+          f"{best:.3f} s, {len(lines) / best:,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Peak memory (RSS) of assembling large machine-generated listings.
+
+Writes the synthetic class of bench_lexer.py to a temporary file,
+by default as one huge method (the shape that hurts:  everything
+the assembler holds per method is held for all of it at once),
+and runs assemble.py on it in a child process.  Reports the peak
+RSS of the child, and for scale, that of a child that only reads
+the whole listing into memory.  assemble.py streams a source
+file to a .tvm target, so it can need less than that.
+
+Usage (from anywhere):  python3 bench/bench_memory.py [--lines 1000000] [--methods 1]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from bench_lexer import synthetic_method     # noqa: E402
+
+# Reads the whole source into memory, and nothing more
+READ_ONLY = "import sys; source = [line for line in open(sys.argv[1])]"
+
+# Runs a command and prints its peak RSS, so each measurement
+# has a parent of its own (ru_maxrss of children is the largest
+# of any child so far)
+MEASURE = """
+import resource, subprocess, sys
+subprocess.run(sys.argv[1:], check=True,
+               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+"""
+
+
+def write_listing(path: Path, n_lines: int, n_methods: int) -> int:
+    """A class of n_methods methods of about n_lines lines in all;
+    the number of instruction lines written
+    """
+    per_method = max(n_lines // n_methods, 1)
+    blocks = max(per_method // 18, 1)       # synthetic_method writes 18 per block
+    instructions = 0
+    with open(path, "w") as f:
+        f.write(".class Bench:Obj\n.field f\n")
+        for m in range(n_methods):
+            for line in synthetic_method(m, n_blocks=blocks):
+                f.write(line + "\n")
+                if line.startswith("    "):
+                    instructions += 1
+    return instructions
+
+
+def peak_rss_mb(command: list) -> float:
+    """Peak resident set size of a child process, in MB"""
+    result = subprocess.run([sys.executable, "-c", MEASURE, *command], cwd=ROOT,
+                            check=True, capture_output=True, text=True)
+    return int(result.stdout) / 1024    # ru_maxrss is in KB on Linux
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000,
+                        help="Approximate size of the listing in lines")
+    parser.add_argument("--methods", type=int, default=1,
+                        help="Number of methods to divide it among")
+    parser.add_argument("--options", default="",
+                        help="Extra assemble.py options, e.g. \"-O --fuse\"")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp, "Bench.asm")
+        instructions = write_listing(source, args.lines, args.methods)
+        size_mb = os.path.getsize(source) / (1024 * 1024)
+        reading = peak_rss_mb([sys.executable, "-c", READ_ONLY, str(source)])
+        assembling = peak_rss_mb([sys.executable, str(ROOT / "assemble.py"),
+                                  "--no-cache", *args.options.split(), str(source),
+                                  str(Path(tmp, "Bench.tvm"))])
+    print(f"{instructions:,} instructions in {args.methods} method(s), "
+          f"{size_mb:.1f} MB of source")
+    print(f"peak RSS: assembling {assembling:,.0f} MB "
+          f"({assembling * 1024 * 1024 / instructions:,.0f} bytes per instruction), "
+          f"reading the whole source {reading:,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Start-up cost of the Quack translator, against translation itself.
+
+Each measurement is a fresh Python process, as when the translator
+is run once per program:  the time to import new_translator, and
+then to get the parser either by loading the tables of
+quack_parser_table.py (as the translator does) or by compiling
+qklib/quack_grammar.txt, as it did before.  For scale, it also
+reports the time to translate each small program of
+tests/qktests once the parser is ready.
+
+Usage (from anywhere):  python3 bench/bench_startup.py [--repeat 10] [programs.qk ...]
+"""
+import argparse
+import io
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Prints seconds to import the translator, then to get the parser
+# from its tables ("table") or from the grammar ("grammar")
+CHILD = """
+import sys, time
+start = time.perf_counter()
+import build_quack_parser, new_translator
+imported = time.perf_counter()
+if sys.argv[1] == "table":
+    new_translator.quack_parser()
+else:
+    build_quack_parser.compile_grammar(build_quack_parser.GRAMMAR.read_text())
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+def startup(how: str, repeat: int) -> dict:
+    """Best of repeat fresh processes:  seconds to import, to get
+    the parser, and for the whole process
+    """
+    best = {"import": float("inf"), "parser": float("inf"), "process": float("inf")}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", CHILD, how], cwd=ROOT,
+                                check=True, capture_output=True, text=True)
+        process = time.perf_counter() - start
+        imported, parser = (float(word) for word in result.stdout.split())
+        best = {"import": min(best["import"], imported),
+                "parser": min(best["parser"], parser),
+                "process": min(best["process"], process)}
+    return best
+
+
+def translation(paths: List[Path], repeat: int) -> dict:
+    """Best time to translate each program, parser ready"""
+    import new_translator
+    new_translator.quack_parser()
+    times = {}
+    for path in paths:
+        text = path.read_text()
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                with redirect_stdout(io.StringIO()):
+                    str(new_translator.translate(text))
+            except Exception as e:
+                best = None
+                print(f"{path.name}: translator failed ({e})", file=sys.stderr)
+                break
+            best = min(best, time.perf_counter() - start)
+        times[path.name] = best
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("programs", nargs="*", type=Path,
+                        help="Quack programs to translate (default tests/qktests/*.qk)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    programs = [ROOT / path for path in args.programs] or sorted(
+        (ROOT / "tests" / "qktests").glob("*.qk"))
+    print(f"{'parser from':<12} {'import ms':>10} {'parser ms':>10} {'process ms':>11}")
+    for how in ["grammar", "table"]:
+        best = startup(how, args.repeat)
+        print(f"{how:<12} {best['import'] * 1000:>10.1f} {best['parser'] * 1000:>10.1f} "
+              f"{best['process'] * 1000:>11.1f}")
+    print()
+    print(f"{'translating':<28} {'ms':>8}")
+    for name, seconds in translation(programs, args.repeat).items():
+        shown = "failed" if seconds is None else f"{seconds * 1000:.1f}"
+        print(f"{name:<28} {shown:>8}")
+
+
+if __name__ == "__main__":
+    main()
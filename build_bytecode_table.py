@@ -1,9 +1,20 @@
 """Build table mapping integer byte codes to function pointers.
 Machine operations, their names, and the number of operands
-for each are given in opdefs.txt.
+for each are given in opdefs.txt.  Superinstructions, if any,
+are given in superops.txt (see superops.py) and follow the
+operations of opdefs.txt in the table.
+
+With --python, also generate the same table, with the operand
+kinds and stack effects of opdefs.txt, as a Python module for
+the assembler (opcodes.py).
 """
 import argparse
 import datetime
+import hashlib
+import re
+from pathlib import Path
+
+from superops import read_superops
 
 # Fixed code at beginning of generated file
 import sys
@@ -26,15 +37,33 @@ PROLOGUE = f"""
  */
  
 #include "vm_code_table.h"
+"""
+
+TABLE_START = f"""
 op_tbl_entry vm_op_bytecodes[] = {LB}
 """
 
 # Fixed code at end of generated file
 CODA = """
-    { 0, 0, 0}  // SENTRY
+    { 0, 0, 0, 0}  // SENTRY
 };
 """
 
+# Generated Python module
+PY_PROLOGUE = f'''"""GENERATED CODE, DO NOT EDIT
+Generated {datetime.datetime.now()} by build_bytecode_table.py
+
+The instruction set of opdefs.txt and superops.txt, which
+the assembler imports rather than parsing those files.
+"""
+'''
+
+# Operand kinds (see opdefs.txt)
+OPERAND_KINDS = ["none", "const", "method", "field", "class",
+                 "local", "label", "int"]
+# Stack effects:  a count, the int operand, or the method's arguments
+STACK_EFFECT_PAT = re.compile(r"[0-9]+|n|n[+]1|[*]")
+
 def cli() -> object:
     """Command line interface"""
     parser = argparse.ArgumentParser(prog=__name__,
@@ -45,16 +74,62 @@ def cli() -> object:
     parser.add_argument("outfile", type=argparse.FileType("w"),
                         nargs="?", default=sys.stdout,
                         help="Put C header file here")
+    parser.add_argument("--superops", type=Path, default=None,
+                        help="Superinstruction definitions "
+                             "(default: superops.txt beside infile, if any)")
+    parser.add_argument("--python", type=argparse.FileType("w"), default=None,
+                        help="Also put the table in this Python module")
     args = parser.parse_args()
     return args
 
 
+def stack_effect(text: str):
+    """Count as int; n, n+1 and * as they are"""
+    assert STACK_EFFECT_PAT.fullmatch(text), f"Bad stack effect '{text}'"
+    return int(text) if text.isdigit() else text
+
+
+def python_module(ops: dict, superops: list, digest: str) -> str:
+    lines = [PY_PROLOGUE,
+             "# name: (byte code, number of operands, operand kind, pops, pushes)",
+             "# Stack effects are counts, \"n\" (the int operand), \"n+1\",",
+             "# or \"*\" (receiver and arguments of the method called)",
+             "OPERATIONS = {"]
+    for name, (code, _, inlines, kind, pops, pushes) in ops.items():
+        lines.append(f"    {name!r}: ({code}, {inlines}, {kind!r}, {pops!r}, {pushes!r}),")
+    lines += ["}", "",
+              "# name: (byte code, number of operands, operations run)",
+              "SUPEROPS = {"]
+    for name, code, inlines, parts in superops:
+        lines.append(f"    {name!r}: ({code}, {inlines}, {parts!r}),")
+    lines += ["}", "",
+              "# Of the definitions, for anything that depends on the encoding",
+              f"DIGEST = {digest!r}", ""]
+    return "\n".join(lines)
+
+
+def superop_handler(name: str, parts: list, funcs: dict) -> str:
+    """C function running the parts in sequence;
+    each part fetches its own operand.
+    """
+    calls = "".join(f"    {funcs[part]}();\n" for part in parts)
+    return (f"/* {'; '.join(parts)} */\n"
+            f"static void {name}(void) {LB}\n{calls}{RB}\n")
+
+
 def main():
     log.info("Bytecode table generation")
     args = cli()
     print(PROLOGUE, file=args.outfile)
+    entries = []
+    # name -> (byte code, C function, number of operands,
+    #          operand kind, pops, pushes)
+    ops = {}
+    # name -> C function without checks
+    unchecked = {}
     next_byte_code = 0;
-    for line in args.infile:
+    text = args.infile.read()
+    for line in text.splitlines():
         line = line.strip()
         # Strip off comments
         parts = line.split("#")
@@ -65,13 +140,43 @@ def main():
         # Is there anything left?
         if len(line) == 0:
             continue
-        parts = line.split(",")
-        assert len(parts) == 3, f"Couldn't parse {line}"
-        name, func, inlines = parts
-        print(f'\t {LB} "{name}", {func}, {inlines} {RB}, //{next_byte_code} {comment}',
+        parts = [part.strip() for part in line.split(",")]
+        assert len(parts) in [6, 7], f"Couldn't parse {line}"
+        name, func, inlines, kind, pops, pushes = parts[:6]
+        unchecked[name] = parts[6] if len(parts) == 7 else func
+        assert kind in OPERAND_KINDS, f"Unknown operand kind in {line}"
+        assert (kind == "none") == (inlines == "0"), f"Operand mismatch in {line}"
+        ops[name] = (next_byte_code, func, int(inlines), kind,
+                     stack_effect(pops), stack_effect(pushes))
+        entries.append(f'\t {LB} "{name}", {func}, {unchecked[name]}, {inlines}, 1, '
+                       f'{LB}{next_byte_code}{RB} {RB}, //{next_byte_code} {comment}')
+        next_byte_code += 1
+    superops_path = args.superops
+    if superops_path is None and args.infile is not sys.stdin:
+        superops_path = Path(args.infile.name).with_name("superops.txt")
+    superops = read_superops(superops_path, ops) if superops_path else []
+    if superops:
+        text += superops_path.read_text()
+    funcs = {name: op[1] for name, op in ops.items()}
+    py_superops = []
+    for name, parts in superops:
+        print(superop_handler(f"vm_op_{name}", parts, funcs), file=args.outfile)
+        print(superop_handler(f"vm_op_{name}_unchecked", parts, unchecked),
               file=args.outfile)
+        inlines = sum(ops[part][2] for part in parts)
+        py_superops.append((name, next_byte_code, inlines, parts))
+        codes = ", ".join(str(ops[part][0]) for part in parts)
+        entries.append(f'\t {LB} "{name}", vm_op_{name}, vm_op_{name}_unchecked, '
+                       f'{inlines}, {len(parts)}, {LB}{codes}{RB} {RB}, '
+                       f'//{next_byte_code}  Superinstruction')
         next_byte_code += 1
+    print(TABLE_START, file=args.outfile)
+    for entry in entries:
+        print(entry, file=args.outfile)
     print(CODA, file=args.outfile)
+    if args.python:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        print(python_module(ops, py_superops, digest), file=args.python, end="")
     log.info("Finished bytecode table generation")
 
 if __name__ == "__main__":
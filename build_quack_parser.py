@@ -0,0 +1,84 @@
+"""Build the LALR parser for the Quack grammar ahead of time.
+
+Compiling qklib/quack_grammar.txt into LALR tables takes longer
+than translating a typical program, so we do it once and write
+the tables, serialized by Lark, as a Python module
+(quack_parser_table.py).  The translator loads the parser from
+that module, which Python keeps compiled, as long as it was built
+from the same grammar text by the same version of Lark; otherwise
+it compiles the grammar as before.  Run this again (or let cmake
+do it) whenever the grammar changes.
+
+Usage:  python3 build_quack_parser.py [qklib/quack_grammar.txt] [quack_parser_table.py]
+"""
+import argparse
+import datetime
+import hashlib
+import logging
+import pprint
+from pathlib import Path
+
+import lark
+from lark import Lark
+from lark.grammar import Rule
+from lark.lexer import TerminalDef
+
+log = logging.getLogger(__name__)
+
+HERE = Path(__file__).resolve().parent
+GRAMMAR = HERE / "qklib" / "quack_grammar.txt"
+TABLE = HERE / "quack_parser_table.py"
+
+# The parser the translator uses; the tables depend on these too
+OPTIONS = {"parser": "lalr", "propagate_positions": True}
+
+PROLOGUE = f'''"""GENERATED CODE, DO NOT EDIT
+Generated {datetime.datetime.now()} by build_quack_parser.py
+
+The LALR parser for qklib/quack_grammar.txt, serialized by Lark,
+which the translator loads rather than compiling the grammar.
+"""
+'''
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(description="Build the Quack parser tables")
+    parser.add_argument("grammar", type=Path, nargs="?", default=GRAMMAR)
+    parser.add_argument("outfile", type=Path, nargs="?", default=TABLE,
+                        help="Python module to write")
+    return parser.parse_args()
+
+
+def grammar_digest(text: str) -> str:
+    """Of the grammar and the options it is compiled with"""
+    return hashlib.sha256((text + repr(sorted(OPTIONS.items()))).encode("utf-8")).hexdigest()
+
+
+def compile_grammar(text: str) -> Lark:
+    return Lark(text, **OPTIONS)
+
+
+def python_module(text: str) -> str:
+    data, memo = compile_grammar(text).memo_serialize([TerminalDef, Rule])
+    return "\n".join([
+        PROLOGUE,
+        "# What the tables were built from; the translator",
+        "# compiles the grammar instead if either differs",
+        f"GRAMMAR_DIGEST = {grammar_digest(text)!r}",
+        f"LARK_VERSION = {lark.__version__!r}",
+        "",
+        f"DATA = {pprint.pformat(data, width=100)}",
+        "",
+        f"MEMO = {pprint.pformat(memo, width=100)}",
+        ""])
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    args = cli()
+    args.outfile.write_text(python_module(args.grammar.read_text()))
+    log.info(f"Wrote parser tables for {args.grammar} to {args.outfile}")
+
+
+if __name__ == "__main__":
+    main()
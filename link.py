@@ -0,0 +1,346 @@
+"""Whole-program linker for the tiny virtual machine.
+
+Loading a program class by class, the VM reads each object file,
+finds each class it imports by name (loading it first if need be),
+and adds each class's literals to the program's constant pool.
+The linker does all of that once, ahead of time:  it reads the
+object files of the main class and every class it reaches, and
+writes a single prelinked image (Main.tvp) in which classes are
+ordered so each follows its superclass, class operands index that
+order, literals are merged into one pool with each appearing once,
+and vtables are complete.  The VM loads an image with -i, without
+looking anything up by name.
+
+With --shake, the image holds only the classes and methods the
+program can reach (see "Tree shaking" below).
+
+The image layout is described in vm_objfile.h, and the
+two MUST be kept consistent.
+
+Usage:
+    python3 link.py Main [-L OBJ] [-o OBJ/Main.tvp] [--shake [--report FILE]]
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import objfile
+from assemble import INSTRS, FrameError, InstructionSet, decode
+
+import logging
+logging.basicConfig()
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+IMAGE_SUFFIX = ".tvp"
+
+# Vtable entry for a method the class does not define in code
+INHERITED = -1
+
+
+class LinkError(Exception):
+    """The object files do not make a complete program"""
+
+
+def is_builtin(obj: dict) -> bool:
+    """Built-in classes have stub object files, without code"""
+    return "code" not in obj
+
+
+class Program:
+    """The classes of a program, each after its superclass"""
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.classes: Dict[str, dict] = {}   # In image order
+        self.index: Dict[str, int] = {}
+        self.pending: List[str] = []     # Classes they import
+
+    def read(self, class_name: str) -> dict:
+        path = objfile.find_object(self.directory, class_name)
+        try:
+            return objfile.read_object(path)
+        except (OSError, ValueError) as e:
+            raise LinkError(f"Cannot read {class_name} from {path}: {e}")
+
+    def place(self, class_name: str, subclasses: Tuple[str, ...] = ()) -> dict:
+        """Add a class (after its superclasses) if it is not there yet"""
+        if class_name in self.classes:
+            return self.classes[class_name]
+        if class_name in subclasses:
+            raise LinkError(f"{class_name} inherits from itself")
+        obj = self.read(class_name)
+        if obj["class_name"] != class_name:
+            raise LinkError(f"Object file of {class_name} "
+                            f"holds class {obj['class_name']}")
+        if obj["super"] != class_name:     # Obj is its own superclass
+            self.place(obj["super"], subclasses + (class_name,))
+        self.index[class_name] = len(self.classes)
+        self.classes[class_name] = obj
+        self.pending += obj.get("imports", [])
+        return obj
+
+    def gather(self, main_class: str):
+        """The main class and every class it reaches"""
+        self.pending.append(main_class)
+        while self.pending:
+            self.place(self.pending.pop())
+
+    def keep(self, class_names: Set[str]):
+        """Drop all but these classes, keeping their order"""
+        self.classes = {name: obj for name, obj in self.classes.items()
+                        if name in class_names}
+        self.index = {name: i for i, name in enumerate(self.classes)}
+
+
+# ----------------
+#  Tree shaking:  Which methods can run, by rapid type analysis.
+#  A method runs if a call to its vtable slot can reach a class
+#  whose vtable holds it, so starting from the main class's
+#  $constructor we follow the code of each method found to run,
+#  collecting the classes it creates with new and the slots it
+#  calls, until neither grows.  Object code does not say which
+#  class a call names, only the slot, so a call reaches that slot
+#  of every class created anywhere in the program.  Classes that
+#  code neither creates nor names (and that are not the superclass
+#  of one it does) are dropped along with the methods that do not
+#  run, and the vtable entries of those become -1.
+#
+
+# Methods of built-in classes (builtins.c) that call other
+# methods of the receiver:  Obj:print calls its string method
+BUILTIN_CALLS = {"print": ["string"]}
+
+
+class Reachability:
+    """The classes and methods a program can reach"""
+    def __init__(self, program: Program, instrs: InstructionSet):
+        self.program = program
+        self.instrs = instrs
+        # Slot -> method, of the methods each class defines
+        self.defined = {name: {method["slot"]: method for method in obj.get("code", [])}
+                        for name, obj in program.classes.items()}
+        self.called: Set[int] = set()       # Slots
+        self.created: Set[str] = set()      # Classes
+        self.named: Set[str] = set()        # Classes code refers to
+        self.live: Set[Tuple[str, int]] = set()     # (class, slot) of methods
+        self.work: List[Tuple[str, dict]] = []
+
+    def defining(self, class_name: str, slot: int) -> Optional[str]:
+        """Class whose method is in slot of the vtable of class_name,
+        or None if it is a method of a built-in class
+        """
+        while not is_builtin(self.program.classes[class_name]):
+            if slot in self.defined[class_name]:
+                return class_name
+            class_name = self.program.classes[class_name]["super"]
+        return None
+
+    def reach(self, class_name: str, slot: int):
+        owner = self.defining(class_name, slot)
+        if owner is not None and (owner, slot) not in self.live:
+            self.live.add((owner, slot))
+            self.work.append((owner, self.defined[owner][slot]))
+
+    def call(self, slot: int):
+        if slot in self.called:
+            return
+        self.called.add(slot)
+        for class_name in list(self.created):
+            self.reach(class_name, slot)
+        builtin_methods = self.program.classes["Obj"]["methods"]
+        if slot < len(builtin_methods):
+            for name in BUILTIN_CALLS.get(builtin_methods[slot], []):
+                self.call(builtin_methods.index(name))
+
+    def create(self, class_name: str):
+        if class_name in self.created:
+            return
+        self.created.add(class_name)
+        self.named.add(class_name)
+        for slot in list(self.called):
+            self.reach(class_name, slot)
+
+    def run(self, main_class: str) -> "Reachability":
+        # The loader creates the main class and calls its $constructor
+        self.create(main_class)
+        self.call(0)
+        while self.work:
+            owner, method = self.work.pop()
+            imports = self.program.classes[owner]["imports"]
+            for _, parts, _ in decode(method["code"], self.instrs):
+                for part, operand, _ in parts:
+                    if part.kind == "method":
+                        self.call(operand)
+                    elif part.name == "new":
+                        self.create(imports[operand])
+                    elif part.kind == "class":
+                        self.named.add(imports[operand])
+        return self
+
+    def classes(self) -> Set[str]:
+        """Classes the program needs, with their superclasses"""
+        needed = set()
+        for class_name in self.named:
+            while class_name not in needed:
+                needed.add(class_name)
+                class_name = self.program.classes[class_name]["super"]
+        return needed
+
+
+def shake(program: Program, main_class: str, instrs: InstructionSet
+          ) -> Tuple[Set[Tuple[str, int]], dict]:
+    """Drop the classes of the program it cannot reach; the
+    (class, slot) of each method it can, and a size report
+    """
+    try:
+        reachable = Reachability(program, instrs).run(main_class)
+    except (FrameError, IndexError) as e:
+        raise LinkError(f"Cannot follow the code: {e}")
+    kept = reachable.classes()
+    report = {"classes": {}, "dropped_classes": []}
+    totals = {"methods": [0, 0], "code_words": [0, 0]}
+    for name, obj in program.classes.items():
+        if name not in kept:
+            report["dropped_classes"].append(name)
+        if is_builtin(obj):
+            continue
+        methods = obj["code"]
+        live = [method for method in methods
+                if (name, method["slot"]) in reachable.live]
+        words = [sum(len(method["code"]) for method in group)
+                 for group in (methods, live)]
+        totals["methods"][0] += len(methods)
+        totals["methods"][1] += len(live)
+        totals["code_words"][0] += words[0]
+        totals["code_words"][1] += words[1]
+        report["classes"][name] = {
+            "kept": name in kept, "code_words": words,
+            "dropped_methods": [method["name"] for method in methods
+                                if method not in live]}
+    report["methods"], report["code_words"] = totals["methods"], totals["code_words"]
+    report["n_classes"] = [len(program.classes), len(kept)]
+    log.info(f"Tree shaking kept {len(kept)} of {len(program.classes)} classes, "
+             f"{totals['methods'][1]} of {totals['methods'][0]} methods, "
+             f"{totals['code_words'][1]} of {totals['code_words'][0]} code words")
+    program.keep(kept)
+    return reachable.live, report
+
+
+def relocate(code: List[int], instrs: InstructionSet,
+             constants: Callable[[int], int], classes: List[int]) -> List[int]:
+    """Method code with its constant and class operands
+    renumbered in the program image
+    """
+    relocated = list(code)
+    for _, parts, _ in decode(code, instrs):
+        for part, operand, where in parts:
+            if part.kind == "const" and operand >= 0:
+                relocated[where] = constants(operand)
+            elif part.kind == "class":
+                relocated[where] = classes[operand]
+    return relocated
+
+
+def link(main_class: str, directory: Path,
+         instrs: InstructionSet = INSTRS, shaking: bool = False) -> dict:
+    """The program image as a dict, for objfile.image_to_binary;
+    if shaking, with the tree shaking report as "shaken"
+    """
+    program = Program(directory)
+    program.gather(main_class)
+    if is_builtin(program.classes[main_class]):
+        raise LinkError(f"{main_class} is built in; nothing to run")
+    live = None
+    report = None
+    if shaking:
+        live, report = shake(program, main_class, instrs)
+    constants: List[dict] = []
+    constant_slots: Dict[Tuple[str, str], int] = {}
+    classes = []
+    methods = []
+    code: List[int] = []
+    vtables: Dict[str, List[int]] = {}
+    for name, obj in program.classes.items():
+        record = {"name": name, "super": program.index[obj["super"]],
+                  "flags": objfile.FLAG_BUILTIN if is_builtin(obj) else 0,
+                  "n_fields": len(obj["fields"]),
+                  "n_methods": len(obj["methods"]),
+                  "n_inherited": obj.get("n_inherited", 0), "vtable": []}
+        classes.append(record)
+        if is_builtin(obj):
+            continue
+        if obj.get("verified"):
+            record["flags"] |= objfile.FLAG_VERIFIED
+        # Each literal once in the whole program, if code uses it
+        def merged(index: int) -> int:
+            const = obj["constants"][index]
+            key = (const["kind"], const["value"])
+            if key not in constant_slots:
+                constant_slots[key] = len(constants)
+                constants.append(const)
+            return constant_slots[key]
+        # Live code refers only to classes we keep
+        class_map = [program.index.get(imported, -1) for imported in obj["imports"]]
+        # Inherited slots as the superclass has them, unless overridden
+        vtable = list(vtables.get(obj["super"], []))
+        vtable += [INHERITED] * (record["n_methods"] - len(vtable))
+        for method in obj["code"]:
+            if live is not None and (name, method["slot"]) not in live:
+                continue
+            try:
+                relocated = relocate(method["code"], instrs, merged, class_map)
+            except (FrameError, IndexError) as e:
+                raise LinkError(f"{name}:{method['name']}: {e}")
+            vtable[method["slot"]] = len(code)
+            methods.append({"class": program.index[name], "name": method["name"],
+                            "code_start": len(code), "code_length": len(relocated),
+                            "frame_size": method.get("frame_size", 0)})
+            code += relocated
+        for slot in range(record["n_inherited"], len(vtable)):
+            if vtable[slot] == INHERITED and live is None:
+                log.warning(f"{name}:{obj['methods'][slot]} is declared "
+                            f"but not defined")
+        vtables[name] = record["vtable"] = vtable
+    log.info(f"Linked {len(classes)} classes, {len(methods)} methods, "
+             f"{len(constants)} constants")
+    return {"main_class": program.index[main_class], "classes": classes,
+            "constants": constants, "methods": methods, "code": code,
+            "shaken": report}
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(
+        description="Link a program into one prelinked image")
+    parser.add_argument("main", help="Main class")
+    parser.add_argument("-L", "--library", type=Path, default=Path("OBJ"),
+                        help="Directory of object files (default OBJ)")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="Image file (default <library>/<main>.tvp)")
+    parser.add_argument("--shake", action="store_true",
+                        help="Leave out classes and methods the program cannot reach")
+    parser.add_argument("--report", type=Path, default=None,
+                        help="With --shake, write what was kept and dropped as JSON")
+    return parser.parse_args()
+
+
+def main():
+    args = cli()
+    output: Optional[Path] = args.output
+    if output is None:
+        output = args.library.joinpath(args.main).with_suffix(IMAGE_SUFFIX)
+    try:
+        image = link(args.main, args.library, shaking=args.shake)
+    except LinkError as e:
+        log.error(str(e))
+        exit(1)
+    with open(output, "wb") as f:
+        f.write(objfile.image_to_binary(image))
+    if args.report is not None and image["shaken"] is not None:
+        with open(args.report, "w") as f:
+            json.dump(image["shaken"], f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
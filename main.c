@@ -1,9 +1,11 @@
 #include <stdio.h>
 #include <string.h>
 #include <assert.h>
+#include <stdlib.h>
 #include <unistd.h>
 #include "vm_state.h"
 #include "vm_loader.h"
+#include "vm_profile.h"
 #include "logger.h"
 
 #define PATHBUFSIZE 1000
@@ -15,8 +17,15 @@ int main(int argc, char *argv[]) {
     char load_path[PATHBUFSIZE];
     int ok = 1;
     char *load_library = "./OBJ";
-    while ((opt = getopt(argc, argv, ":DL:")) != -1) {
+    char *profile_path = NULL;      // -p:  sample the call stack
+    int profile_interval = PROFILE_DEFAULT_INTERVAL;   // -I n:  every n instructions
+    int profile_at_entry = 0;       // -P:  at every method entry instead
+    char *image_path = NULL;        // -i:  run a prelinked program image
+    while ((opt = getopt(argc, argv, ":DL:p:PI:i:")) != -1) {
         switch (opt) {
+            case 'i':
+                image_path = optarg;
+                break;
             case 'L':
                 load_library = optarg;
                 fprintf(stderr, "Look in '%s' for object modules\n", optarg);
@@ -26,6 +35,15 @@ int main(int argc, char *argv[]) {
                 set_log_level(DEBUG);
                 vm_logging = DEBUG;
                 break;
+            case 'p':
+                profile_path = optarg;
+                break;
+            case 'P':
+                profile_at_entry = 1;
+                break;
+            case 'I':
+                profile_interval = atoi(optarg);
+                break;
             case ':':
                 fprintf(stderr, "Option %s requires a value\n", optarg);
                 ok = 0;
@@ -37,7 +55,16 @@ int main(int argc, char *argv[]) {
         }
     }
     log_debug("Finished options, load library is %s\n", load_library);
-    if (ok && optind < argc) {
+    if (profile_path) {
+        // Before loading, so the profiler learns where methods are
+        vm_profile_start(profile_path, profile_interval, profile_at_entry,
+                         load_library);
+    }
+    if (ok && image_path) {
+        vm_loader_init(load_library);
+        ok = vm_load_image(image_path);
+        main_class = image_path;
+    } else if (ok && optind < argc) {
         log_debug("There is at least one non-option argument\n");
         vm_loader_init(load_library);
         for (; ok && optind < argc; ++optind) {
@@ -0,0 +1,183 @@
+"""Manifest of the classes in a library directory (TVMLIB).
+
+Tools that only need to know about library classes (their
+superclass, the order of their methods and fields, and where
+known the signatures of their methods) should not open and
+parse every object file to find out.  The manifest keeps all
+of that in one file, <directory>/.manifest.json, along with the
+modification time and size of each object file it was built
+from.  Loading it checks those against the directory and
+re-reads only the object files that changed, so it is rebuilt
+only as far as the library has changed since it was written.
+
+Method signatures (parameter and return types) come from
+qklib/builtin_methods.json, since object files do not have them.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import objfile
+
+import logging
+log = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".manifest.json"
+VERSION = 2
+
+BUILTIN_SIGNATURES = Path(__file__).resolve().parent.joinpath(
+    "qklib", "builtin_methods.json")
+
+# What an importer needs to know about a class
+# (besides the arities of the methods it defines)
+RECORD_FIELDS = ["class_name", "super", "methods", "fields"]
+
+
+def _stamp(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class Manifest:
+    """The classes of one library directory, read on first use"""
+    def __init__(self, directory: Path,
+                 signatures: Optional[Path] = BUILTIN_SIGNATURES):
+        self.directory = Path(directory)
+        self.path = self.directory.joinpath(MANIFEST_NAME)
+        self.signatures_path = signatures
+        self._classes: Optional[Dict[str, dict]] = None
+        self._signatures: Dict[str, dict] = {}
+        self._stamps: Dict[str, list] = {}   # Member -> [file, mtime, size]
+
+    @property
+    def classes(self) -> Dict[str, dict]:
+        """Class name -> class_name, super, methods and fields
+        (in slot order), and signatures if we have them
+        """
+        if self._classes is None:
+            self._load()
+        return self._classes
+
+    def get(self, class_name: str) -> Optional[dict]:
+        return self.classes.get(class_name)
+
+    def __contains__(self, class_name: str) -> bool:
+        return class_name in self.classes
+
+    def symtab(self) -> Dict[str, dict]:
+        """Method signatures by class, in the form of
+        qklib/builtin_methods.json
+        """
+        if self._classes is None:
+            self._load()
+        return self._signatures
+
+    def changed(self) -> bool:
+        """Whether object files were added, removed or modified
+        since we loaded, so a long-lived reader should start over
+        """
+        if self._classes is None:
+            return False
+        try:
+            stamps = {name: [path.name] + _stamp(path)
+                      for name, path in self._members().items()}
+        except OSError:
+            return True     # Removed while we looked
+        return stamps != self._stamps
+
+    def _members(self) -> Dict[str, Path]:
+        """Object file of each class, preferring the
+        same suffix as objfile.find_object
+        """
+        rank = {suffix: i for i, suffix in enumerate(objfile.SUFFIXES)}
+        members: Dict[str, Path] = {}
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return members
+        for entry in entries:
+            path = Path(entry.path)
+            if path.suffix not in rank or path.name == MANIFEST_NAME:
+                continue
+            current = members.get(path.stem)
+            if current is None or rank[path.suffix] < rank[current.suffix]:
+                members[path.stem] = path
+        return members
+
+    def _read_member(self, path: Path) -> Optional[dict]:
+        try:
+            obj = objfile.read_object(path)
+            record = {field: obj[field] for field in RECORD_FIELDS}
+            record["arities"] = objfile.arities(obj)
+            return record
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Not an object file we can use; importers that
+            # ask for it will get the error from the file itself
+            log.debug(f"Manifest skips {path}: {e}")
+            return None
+
+    def _load(self):
+        old: dict = {}
+        try:
+            with open(self.path, "r") as f:
+                old = json.load(f)
+            if old.get("version") != VERSION:
+                old = {}
+        except (OSError, ValueError):
+            pass
+        old_members = old.get("members", {})
+        members = {}
+        changed = False
+        for name, path in self._members().items():
+            stamp = _stamp(path)
+            entry = old_members.get(name)
+            if entry is None or entry["file"] != path.name or entry["stamp"] != stamp:
+                entry = {"file": path.name, "stamp": stamp,
+                         "record": self._read_member(path)}
+                changed = True
+            members[name] = entry
+        if members.keys() != old_members.keys():
+            changed = True
+
+        signatures = old.get("signatures", {})
+        signatures_stamp = None
+        if self.signatures_path is not None and self.signatures_path.exists():
+            signatures_stamp = [str(self.signatures_path)] + _stamp(self.signatures_path)
+        if signatures_stamp != old.get("signatures_stamp"):
+            signatures = {}
+            if signatures_stamp is not None:
+                with open(self.signatures_path, "r") as f:
+                    signatures = json.load(f)
+            changed = True
+
+        if changed:
+            self._write({"version": VERSION, "members": members,
+                         "signatures_stamp": signatures_stamp,
+                         "signatures": signatures})
+        self._signatures = signatures
+        self._stamps = {name: [entry["file"]] + entry["stamp"]
+                        for name, entry in members.items()}
+        self._classes = {}
+        for name, entry in members.items():
+            if entry["record"] is None:
+                continue
+            record = dict(entry["record"])
+            if name in signatures:
+                record["signatures"] = signatures[name]["methods"]
+            self._classes[name] = record
+
+    def _write(self, data: dict):
+        """Replace the manifest atomically; readers see the
+        old one or the new one, never part of either.
+        """
+        try:
+            fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.chmod(temp, 0o644)
+            os.replace(temp, self.path)
+        except OSError as e:
+            log.debug(f"Could not write manifest {self.path}: {e}")
@@ -4,11 +4,15 @@ Lark Parser Generator
 
 REPL calculator shows how to write a basic calculator with variables.
 """
+import lark
 from lark import Lark, Transformer, v_args, visitors
 import argparse
 import sys
 import json
 from typing import List, Callable
+from pathlib import Path
+from manifest import Manifest
+import build_quack_parser
 import logging
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 log = logging.getLogger(__name__)
@@ -21,6 +25,10 @@ def cli():
     args = cli_parser.parse_args()
     return args
 
+# Library classes and builtin method signatures, read
+# from the library manifest when first needed
+LIBRARY = Manifest(Path(__file__).resolve().parent.joinpath("OBJ"))
+
 JUMP_COUNT = 0
 type_table = {}
 
@@ -45,6 +53,8 @@ def flatten(m: list):
 
 class ASTNode:
     """Abstract base class"""
+    line = None     # Of the source, set by ASTBuilder where known
+
     def __init__(self):
         self.children = []    # Internal nodes should set this to list of child nodes
 
@@ -177,7 +187,11 @@ class BlockNode(ASTNode):
         self.children = stmts
 
     def __str__(self):
-        return "\n".join([str(stmt) for stmt in self.stmts])
+        # .line tells the assembler where the code came from,
+        # for its source map
+        return "\n".join([str(stmt) if stmt.line is None
+                          else f".line {stmt.line}\n{stmt}"
+                          for stmt in self.stmts])
 
 
 class AssNode(ASTNode):
@@ -508,6 +522,12 @@ class VarNode(ASTNode):
 
 class ASTBuilder(Transformer):
     """Translate Lark tree to AST"""
+    def _call_userfunc(self, tree, new_children=None):
+        node = super()._call_userfunc(tree, new_children)
+        if isinstance(node, ASTNode) and not tree.meta.empty:
+            node.line = tree.meta.line
+        return node
+
     def program(self, e):
         log.debug("->program")
         classes, methods, stmt_block = e
@@ -674,19 +694,62 @@ class ASTBuilder(Transformer):
         return ReturnNode(e)
 
 
+# The LALR parser for Quack, built on first use.  Compiling the
+# grammar takes longer than translating a typical program, so we
+# load the tables build_quack_parser.py wrote when they are current.
+QUACK_PARSER = None
+
+
+def quack_parser() -> Lark:
+    global QUACK_PARSER
+    if QUACK_PARSER is None:
+        QUACK_PARSER = load_quack_parser()
+    return QUACK_PARSER
+
+
+def load_quack_parser() -> Lark:
+    """From quack_parser_table.py if it was built from this
+    grammar by this version of Lark, else from the grammar
+    """
+    text = build_quack_parser.GRAMMAR.read_text()
+    try:
+        import quack_parser_table as table
+    except ImportError:
+        log.warning("No quack_parser_table.py; run build_quack_parser.py")
+        return build_quack_parser.compile_grammar(text)
+    if table.GRAMMAR_DIGEST != build_quack_parser.grammar_digest(text):
+        log.warning("quack_parser_table.py is out of date with the grammar; "
+                    "run build_quack_parser.py")
+        return build_quack_parser.compile_grammar(text)
+    if table.LARK_VERSION != lark.__version__:
+        log.warning(f"quack_parser_table.py was built by Lark {table.LARK_VERSION}, "
+                    f"not {lark.__version__}; run build_quack_parser.py")
+        return build_quack_parser.compile_grammar(text)
+    return Lark._load_from_dict(table.DATA, table.MEMO)
+
+
+def translate(text: str) -> ASTNode:
+    """Parse a Quack program into its AST, whose string form is
+    the assembly code.  Label numbers and the type table are module
+    state, so we start them over for each program, and only one
+    program may be translated at a time.
+    """
+    global JUMP_COUNT
+    JUMP_COUNT = 0
+    type_table.clear()
+    tree = quack_parser().parse(text)
+    #print(tree.pretty())
+
+    #ultimate transformation
+    return ASTBuilder().transform(tree)
+
+
 def main():
     args = cli()
-    quack_parser = Lark(open("qklib/quack_grammar.txt"), parser='lalr')
-    quack = quack_parser.parse
     text = "".join(args.source.readlines())
     #code = sys.stdin.read()
-    tree = quack(text)
-    #print(tree.pretty())
-
-    #ultimate transformation
-    ast: ASTNode = ASTBuilder().transform(tree)
-    builtins = open("qklib/builtin_methods.json")
-    symtab = json.load(builtins)
+    ast: ASTNode = translate(text)
+    symtab = LIBRARY.symtab()
     #ast.walk(symtab, initialization_walk, type_check_walk)
     #print("AST")
     print(ast)
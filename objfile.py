@@ -0,0 +1,362 @@
+"""Object file formats for the tiny virtual machine.
+
+The assembler builds each class as a dict (the same structure
+it has always written as JSON) and this module writes it either
+as indented JSON, for reading and debugging, or in a compact
+binary form that the loader can memory-map and use without
+parsing.  Both forms read back into the same dict.
+
+The binary layout is described in vm_objfile.h, and the
+two MUST be kept consistent.
+"""
+
+import io
+import json
+import logging
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, List
+
+log = logging.getLogger(__name__)
+
+MAGIC = b"TVMO"
+VERSION = 1
+
+# Header fields after the magic number, in order (see vm_objfile.h)
+HEADER_FIELDS = [
+    "version", "flags", "class_name", "super_name",
+    "n_fields", "n_methods", "n_inherited",
+    "n_strings", "strings_off",
+    "n_imports", "imports_off",
+    "method_names_off", "field_names_off",
+    "n_constants", "constants_off",
+    "n_code_methods", "code_methods_off", "code_method_size",
+    "n_code_words", "code_off",
+]
+HEADER = struct.Struct("<4s" + "i" * len(HEADER_FIELDS))
+
+# Header flags
+FLAG_VERIFIED = 1   # The assembler's verifier accepted every method
+
+# Per-method record:  name, slot, code_start, code_length,
+# arity, max_stack, frame_size.  Files from before the last
+# three have shorter records (code_method_size 16).
+METHOD_RECORD = struct.Struct("<7i")
+METHOD_RECORD_BASE = struct.Struct("<4i")
+METHOD_FRAME_FIELDS = ["arity", "max_stack", "frame_size"]
+
+# Object files we know how to read, by suffix, in order of preference
+SUFFIXES = [".tvm", ".json"]
+
+
+def _int32s(values: List[int]) -> bytes:
+    words = array("i", values)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words.tobytes()
+
+
+def _read_int32s(data: bytes, offset: int, count: int) -> List[int]:
+    words = array("i")
+    words.frombytes(data[offset:offset + 4 * count])
+    if sys.byteorder != "little":
+        words.byteswap()
+    return words.tolist()
+
+
+class _Strings:
+    """String table under construction; each string stored once"""
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def __call__(self, s: str) -> int:
+        if s not in self.index:
+            self.index[s] = len(self.strings)
+            self.strings.append(s)
+        return self.index[s]
+
+
+class ObjectWriter:
+    """Writes the binary form of a class to a stream as it is
+    assembled:  the code of each method once it is finished, and
+    the tables and header once the class is.  The code comes
+    right after the header, so none of it need be held until the
+    end; the header, written last, replaces a placeholder, so
+    the stream must be seekable.
+    """
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.start = stream.tell()
+        self.strings = _Strings()
+        self.records: List[bytes] = []
+        self.n_code_words = 0
+        stream.write(bytes(HEADER.size))
+
+    def add_method(self, method: dict):
+        """A method record and its code"""
+        self.records.append(METHOD_RECORD.pack(
+            self.strings(method["name"]), method["slot"],
+            self.n_code_words, len(method["code"]),
+            *[method.get(field, 0) for field in METHOD_FRAME_FIELDS]))
+        self.stream.write(_int32s(method["code"]))
+        self.n_code_words += len(method["code"])
+
+    def finish(self, obj: dict):
+        """The tables and header of the class, whose methods
+        have all been added (its "code" is not used)
+        """
+        strings = self.strings
+        class_name = strings(obj["class_name"])
+        super_name = strings(obj["super"])
+        imports = [strings(name) for name in obj["imports"]]
+        method_names = [strings(name) for name in obj["methods"]]
+        field_names = [strings(name) for name in obj["fields"]]
+        constants = []
+        for const in obj["constants"]:
+            constants += [ord(const["kind"][0]), strings(const["value"])]
+
+        # Lay out the tables after the code, each 4-byte aligned
+        sections = [
+            ("imports_off", _int32s(imports)),
+            ("method_names_off", _int32s(method_names)),
+            ("field_names_off", _int32s(field_names)),
+            ("constants_off", _int32s(constants)),
+            ("code_methods_off", b"".join(self.records)),
+        ]
+        offsets = {"code_off": HEADER.size}
+        position = HEADER.size + 4 * self.n_code_words
+        for name, data in sections:
+            offsets[name] = position
+            position += len(data)
+        # String table: offsets of each string, then the strings
+        blob = [s.encode("utf-8") + b"\0" for s in strings.strings]
+        offsets["strings_off"] = position
+        position += 4 * len(blob)
+        string_offsets = []
+        for s in blob:
+            string_offsets.append(position)
+            position += len(s)
+
+        header = {
+            "version": VERSION,
+            "flags": FLAG_VERIFIED if obj.get("verified") else 0,
+            "class_name": class_name, "super_name": super_name,
+            "n_fields": len(obj["fields"]), "n_methods": len(obj["methods"]),
+            "n_inherited": obj["n_inherited"],
+            "n_strings": len(blob), "n_imports": len(imports),
+            "n_constants": len(obj["constants"]),
+            "n_code_methods": len(self.records),
+            "code_method_size": METHOD_RECORD.size,
+            "n_code_words": self.n_code_words,
+        }
+        header.update(offsets)
+        for _, data in sections:
+            self.stream.write(data)
+        self.stream.write(_int32s(string_offsets))
+        self.stream.write(b"".join(blob))
+        end = self.stream.tell()
+        self.stream.seek(self.start)
+        self.stream.write(HEADER.pack(MAGIC, *[header[field] for field in HEADER_FIELDS]))
+        self.stream.seek(end)
+
+
+def to_binary(obj: dict) -> bytes:
+    """Encode an object code dict in the binary format"""
+    stream = io.BytesIO()
+    writer = ObjectWriter(stream)
+    for method in obj["code"]:
+        writer.add_method(method)
+    writer.finish(obj)
+    return stream.getvalue()
+
+
+def from_binary(data: bytes) -> dict:
+    """Decode the binary format into an object code dict"""
+    fields = HEADER.unpack_from(data)
+    if fields[0] != MAGIC:
+        raise ValueError("Not a binary object file")
+    h = dict(zip(HEADER_FIELDS, fields[1:]))
+    if h["version"] != VERSION:
+        raise ValueError(f"Object file version {h['version']}, expected {VERSION}")
+    offsets = _read_int32s(data, h["strings_off"], h["n_strings"])
+    strings = [data[off:data.index(b"\0", off)].decode("utf-8") for off in offsets]
+
+    def names(offset: int, count: int) -> List[str]:
+        return [strings[i] for i in _read_int32s(data, offset, count)]
+
+    constants = []
+    pairs = _read_int32s(data, h["constants_off"], 2 * h["n_constants"])
+    for kind, value in zip(pairs[0::2], pairs[1::2]):
+        constants.append({"kind": chr(kind), "value": strings[value]})
+    code_words = _read_int32s(data, h["code_off"], h["n_code_words"])
+    methods = []
+    for i in range(h["n_code_methods"]):
+        offset = h["code_methods_off"] + i * h["code_method_size"]
+        name, slot, start, length = METHOD_RECORD_BASE.unpack_from(data, offset)
+        method = {"name": strings[name], "slot": slot,
+                  "code": code_words[start:start + length]}
+        if h["code_method_size"] >= METHOD_RECORD.size:
+            frame = METHOD_RECORD.unpack_from(data, offset)[4:]
+            method.update(zip(METHOD_FRAME_FIELDS, frame))
+        methods.append(method)
+    return {
+        "class_name": strings[h["class_name"]],
+        "super": strings[h["super_name"]],
+        "imports": names(h["imports_off"], h["n_imports"]),
+        "methods": names(h["method_names_off"], h["n_methods"]),
+        "fields": names(h["field_names_off"], h["n_fields"]),
+        "n_fields": h["n_fields"],
+        "n_methods": h["n_methods"],
+        "n_inherited": h["n_inherited"],
+        "constants": constants,
+        "code": methods,
+        "verified": bool(h["flags"] & FLAG_VERIFIED),
+    }
+
+
+def arities(obj: dict) -> Dict[str, int]:
+    """Number of arguments of each method a class defines:
+    from its code, or for the stubs of built-in classes,
+    which have no code, from their "arities"
+    """
+    found = dict(obj.get("arities", {}))
+    for method in obj.get("code", []):
+        if "arity" in method:
+            found[method["name"]] = method["arity"]
+    return found
+
+
+# ----------------
+#  Prelinked program images (link.py):  the classes of a whole
+#  program, already linked, in one file (see vm_objfile.h)
+#
+
+IMAGE_MAGIC = b"TVMP"
+IMAGE_VERSION = 1
+
+# Header fields after the magic number, in order (see vm_objfile.h)
+IMAGE_HEADER_FIELDS = [
+    "version", "main_class",
+    "n_strings", "strings_off",
+    "n_classes", "classes_off",
+    "n_constants", "constants_off",
+    "n_methods", "methods_off",
+    "n_vtable_words", "vtables_off",
+    "n_code_words", "code_off",
+]
+IMAGE_HEADER = struct.Struct("<4s" + "i" * len(IMAGE_HEADER_FIELDS))
+
+# Class record:  name, super, flags, n_fields, n_methods,
+# n_inherited, vtable
+IMAGE_CLASS_RECORD = struct.Struct("<7i")
+# Method record:  class, name, code_start, code_length, frame_size
+IMAGE_METHOD_RECORD = struct.Struct("<5i")
+
+# Class flags (FLAG_VERIFIED is the other)
+FLAG_BUILTIN = 2
+
+
+def image_to_binary(image: dict) -> bytes:
+    """Encode a program image (see vm_objfile.h)"""
+    strings = _Strings()
+    class_records = []
+    vtable_words: List[int] = []
+    for record in image["classes"]:
+        class_records.append(IMAGE_CLASS_RECORD.pack(
+            strings(record["name"]), record["super"], record["flags"],
+            record["n_fields"], record["n_methods"], record["n_inherited"],
+            len(vtable_words)))
+        vtable_words += record["vtable"]
+    constants = []
+    for const in image["constants"]:
+        constants += [ord(const["kind"][0]), strings(const["value"])]
+    method_records = [IMAGE_METHOD_RECORD.pack(
+        method["class"], strings(method["name"]), method["code_start"],
+        method["code_length"], method["frame_size"]) for method in image["methods"]]
+
+    # Lay out the tables after the header, each 4-byte aligned
+    sections = [
+        ("classes_off", b"".join(class_records)),
+        ("constants_off", _int32s(constants)),
+        ("methods_off", b"".join(method_records)),
+        ("vtables_off", _int32s(vtable_words)),
+        ("code_off", _int32s(image["code"])),
+    ]
+    offsets = {}
+    position = IMAGE_HEADER.size
+    for name, data in sections:
+        offsets[name] = position
+        position += len(data)
+    # String table: offsets of each string, then the strings
+    blob = [s.encode("utf-8") + b"\0" for s in strings.strings]
+    offsets["strings_off"] = position
+    position += 4 * len(blob)
+    string_offsets = []
+    for s in blob:
+        string_offsets.append(position)
+        position += len(s)
+
+    header = {
+        "version": IMAGE_VERSION, "main_class": image["main_class"],
+        "n_strings": len(blob), "n_classes": len(class_records),
+        "n_constants": len(image["constants"]),
+        "n_methods": len(method_records), "n_vtable_words": len(vtable_words),
+        "n_code_words": len(image["code"]),
+    }
+    header.update(offsets)
+    parts = [IMAGE_HEADER.pack(IMAGE_MAGIC,
+                               *[header[field] for field in IMAGE_HEADER_FIELDS])]
+    parts += [data for _, data in sections]
+    parts.append(_int32s(string_offsets))
+    parts += blob
+    return b"".join(parts)
+
+
+def _listed(words: array) -> List[int]:
+    """Method code held as an array, written as a JSON list"""
+    return words.tolist()
+
+
+def to_json(obj: dict) -> str:
+    return json.dumps(obj, indent=4, default=_listed)
+
+
+def write_object(obj: dict, stream: BinaryIO, binary: bool = True):
+    if binary:
+        stream.write(to_binary(obj))
+    else:
+        stream.write(to_json(obj).encode("utf-8") + b"\n")
+
+
+def read_object(path: Path) -> dict:
+    """Read an object file in either format"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:len(MAGIC)] == MAGIC:
+        return from_binary(data)
+    return json.loads(data)
+
+
+def find_object(directory: Path, class_name: str) -> Path:
+    """Object file for class_name in directory, preferring the
+    binary form unless the JSON form is newer (the binary form is
+    then stale).  If there is none, the path of the JSON form
+    (which doesn't exist either, as the caller will discover).
+    """
+    found = None
+    found_time = None
+    for suffix in SUFFIXES:
+        path = directory.joinpath(class_name).with_suffix(suffix)
+        try:
+            modified = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        if found is None:
+            found, found_time = path, modified
+        elif modified > found_time:
+            log.warning(f"{found} is older than {path}; using {path}")
+            found, found_time = path, modified
+    return found or directory.joinpath(class_name).with_suffix(".json")
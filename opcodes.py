@@ -0,0 +1,47 @@
+"""GENERATED CODE, DO NOT EDIT
+Generated 2026-10-17 18:14:24.021085 by build_bytecode_table.py
+
+The instruction set of opdefs.txt and superops.txt, which
+the assembler imports rather than parsing those files.
+"""
+
+# name: (byte code, number of operands, operand kind, pops, pushes)
+# Stack effects are counts, "n" (the int operand), "n+1",
+# or "*" (receiver and arguments of the method called)
+OPERATIONS = {
+    'halt': (0, 0, 'none', 0, 0),
+    'const': (1, 1, 'const', 0, 1),
+    'call': (2, 1, 'method', '*', 1),
+    'call_native': (3, 1, 'int', 0, 1),
+    'enter': (4, 0, 'none', 0, 0),
+    'return': (5, 1, 'int', 1, 0),
+    'new': (6, 1, 'class', 0, 1),
+    'pop': (7, 0, 'none', 1, 0),
+    'alloc': (8, 1, 'int', 0, 'n'),
+    'load': (9, 1, 'local', 0, 1),
+    'store': (10, 1, 'local', 1, 0),
+    'load_field': (11, 1, 'field', 1, 1),
+    'store_field': (12, 1, 'field', 2, 0),
+    'roll': (13, 1, 'int', 'n+1', 'n+1'),
+    'jump': (14, 1, 'label', 0, 0),
+    'jump_if': (15, 1, 'label', 1, 0),
+    'jump_ifnot': (16, 1, 'label', 1, 0),
+    'is_instance': (17, 1, 'class', 1, 1),
+}
+
+# name: (byte code, number of operands, operations run)
+SUPEROPS = {
+    'const_call': (18, 2, ('const', 'call')),
+    'load_call': (19, 2, ('load', 'call')),
+    'pop_const_call': (20, 2, ('pop', 'const', 'call')),
+    'const_load_call': (21, 3, ('const', 'load', 'call')),
+    'pop_const': (22, 1, ('pop', 'const')),
+    'store_load_call': (23, 3, ('store', 'load', 'call')),
+    'const_load': (24, 2, ('const', 'load')),
+    'load_load_field_call': (25, 3, ('load', 'load_field', 'call')),
+    'load_load_field': (26, 2, ('load', 'load_field')),
+    'store_load': (27, 2, ('store', 'load')),
+}
+
+# Of the definitions, for anything that depends on the encoding
+DIGEST = '378deec3338e8e4f27a0eceb199a9f2f4abe99986a7195bc5cd6ef336deb5e40'
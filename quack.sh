@@ -1,5 +1,5 @@
 #!/bin/zsh
 
-python3 new_translator.py $1 > ./tests/src/Main.asm
-python3 assemble.py ./tests/src/Main.asm ./tests/OBJ/Main.json
-./tiny_vm ./tests/OBJ/Main.json
\ No newline at end of file
+# quackd (started on first use) translates and assembles
+python3 quack_client.py build $1 ./tests/OBJ/Main.tvm --asm ./tests/src/Main.asm || exit 1
+./tiny_vm -L ./tests/OBJ Main
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Thin client for the Quack compile server (quackd.py).
+
+Sends one request and prints the diagnostics of the reply, starting
+the server first if nobody is listening.  Imports nothing but the
+standard library, so it starts in a few tens of milliseconds.
+
+Usage:
+    python3 quack_client.py build prog.qk tests/OBJ/Main.tvm [--asm tests/src/Main.asm]
+    python3 quack_client.py translate prog.qk [--asm Main.asm]
+    python3 quack_client.py assemble Main.asm Main.tvm [-O] [--fuse]
+    python3 quack_client.py shutdown
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent
+SERVER = ROOT.joinpath("quackd.py")
+
+# How long to wait for a server we started, and how long
+# a server we started stays without requests
+START_TIMEOUT = 30
+IDLE_TIMEOUT = 1800
+
+
+def default_socket() -> Path:
+    """One server per user and checkout, since the server
+    reads the configuration and library of its checkout
+    """
+    checkout = hashlib.sha256(str(ROOT).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir(), f"quackd-{os.getuid()}-{checkout}.sock")
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(
+        description="Translate and assemble Quack programs with quackd")
+    parser.add_argument("--socket", type=Path, default=None,
+                        help=f"Server socket (default {default_socket()})")
+    parser.add_argument("--no-start", dest="start", action="store_false",
+                        help="Fail rather than start a server")
+    ops = parser.add_subparsers(dest="op", required=True)
+    build = ops.add_parser("build", help="Translate and assemble")
+    build.add_argument("source", type=Path)
+    build.add_argument("target", type=Path)
+    build.add_argument("--asm", type=Path, default=None,
+                       help="Also keep the assembly code here")
+    translate = ops.add_parser("translate", help="Translate to assembly code "
+                                                 "(on stdout unless --asm)")
+    translate.add_argument("source", type=Path)
+    translate.add_argument("--asm", type=Path, default=None)
+    assemble = ops.add_parser("assemble", help="Assemble into an object file")
+    assemble.add_argument("source", type=Path)
+    assemble.add_argument("target", type=Path)
+    for sub in [build, assemble]:
+        sub.add_argument("-O", "--optimize", action="store_true")
+        sub.add_argument("--fuse", action="store_true")
+        sub.add_argument("--verify", action=argparse.BooleanOptionalAction,
+                         default=None, help="Default: VERIFY in the server's asm.conf")
+        sub.add_argument("--map", action="store_true",
+                         help="Write a source map beside the target")
+    ops.add_parser("ping")
+    ops.add_parser("shutdown")
+    return parser.parse_args()
+
+
+def connect(path: Path, start: bool = True) -> socket.socket:
+    """A connection to the server, which we start if need be"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        return sock
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not start:
+            sock.close()
+            raise
+    subprocess.Popen([sys.executable, str(SERVER), "--socket", str(path),
+                      "--idle", str(IDLE_TIMEOUT)],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + START_TIMEOUT
+    while True:
+        try:
+            sock.connect(str(path))
+            return sock
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                sock.close()
+                raise
+            time.sleep(0.02)
+
+
+def request(message: dict, path: Optional[Path] = None,
+            start: bool = True) -> dict:
+    """Send one request and wait for the reply"""
+    with connect(path or default_socket(), start) as sock:
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as replies:
+            line = replies.readline()
+    if not line:
+        raise ConnectionError("Server closed the connection")
+    return json.loads(line)
+
+
+def main():
+    args = cli()
+    message = {"op": args.op}
+    # The server has its own working directory
+    for name in ["source", "target", "asm"]:
+        value = getattr(args, name, None)
+        if value is not None:
+            message[name] = str(value.resolve())
+    for name in ["optimize", "fuse", "map"]:
+        if getattr(args, name, False):
+            message[name] = True
+    if getattr(args, "verify", None) is not None:
+        message["verify"] = args.verify
+    try:
+        reply = request(message, args.socket, args.start and args.op != "shutdown")
+    except OSError as e:
+        print(f"quackd: {e}", file=sys.stderr)
+        sys.exit(2)
+    for diagnostic in reply.get("diagnostics", []):
+        print(f"{diagnostic['level']}: {diagnostic['message']}", file=sys.stderr)
+    if args.op == "translate" and args.asm is None:
+        sys.stdout.write(reply.get("asm", ""))
+    elif args.op == "ping":
+        print(f"quackd {reply.get('pid')}")
+    sys.exit(0 if reply.get("ok") else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3529 @@
+"""GENERATED CODE, DO NOT EDIT
+Generated 2026-10-17 19:04:33.253799 by build_quack_parser.py
+
+The LALR parser for qklib/quack_grammar.txt, serialized by Lark,
+which the translator loads rather than compiling the grammar.
+"""
+
+# What the tables were built from; the translator
+# compiles the grammar instead if either differs
+GRAMMAR_DIGEST = '38dacd7710b64153016d7e102b8bdd08fcb027a19c7526caa98d72f343569e45'
+LARK_VERSION = '1.3.1'
+
+DATA = {'__type__': 'Lark',
+ 'options': {'_plugins': {},
+             'ambiguity': 'auto',
+             'cache': False,
+             'cache_grammar': False,
+             'debug': False,
+             'edit_terminals': None,
+             'g_regex_flags': 0,
+             'import_paths': [],
+             'keep_all_tokens': False,
+             'lexer': 'contextual',
+             'lexer_callbacks': {},
+             'maybe_placeholders': True,
+             'ordered_sets': True,
+             'parser': 'lalr',
+             'postlex': None,
+             'priority': 'normal',
+             'propagate_positions': True,
+             'regex': False,
+             'source_path': None,
+             'start': ['start'],
+             'strict': False,
+             'transformer': None,
+             'tree_class': None,
+             'use_bytes': False},
+ 'parser': {'__type__': 'ParsingFrontend',
+            'lexer_conf': {'__type__': 'LexerConf',
+                           'g_regex_flags': 0,
+                           'ignore': ['C_COMMENT', 'CPP_COMMENT', 'WS'],
+                           'lexer_type': 'contextual',
+                           'terminals': [{'@': 0},
+                                         {'@': 1},
+                                         {'@': 2},
+                                         {'@': 3},
+                                         {'@': 4},
+                                         {'@': 5},
+                                         {'@': 6},
+                                         {'@': 7},
+                                         {'@': 8},
+                                         {'@': 9},
+                                         {'@': 10},
+                                         {'@': 11},
+                                         {'@': 12},
+                                         {'@': 13},
+                                         {'@': 14},
+                                         {'@': 15},
+                                         {'@': 16},
+                                         {'@': 17},
+                                         {'@': 18},
+                                         {'@': 19},
+                                         {'@': 20},
+                                         {'@': 21},
+                                         {'@': 22},
+                                         {'@': 23},
+                                         {'@': 24},
+                                         {'@': 25},
+                                         {'@': 26},
+                                         {'@': 27},
+                                         {'@': 28},
+                                         {'@': 29},
+                                         {'@': 30},
+                                         {'@': 31},
+                                         {'@': 32},
+                                         {'@': 33},
+                                         {'@': 34},
+                                         {'@': 35},
+                                         {'@': 36},
+                                         {'@': 37}],
+                           'use_bytes': False},
+            'parser': {'end_states': {'start': 95},
+                       'start_states': {'start': 96},
+                       'states': {0: {0: (0, 57),
+                                      1: (1, {'@': 89}),
+                                      2: (1, {'@': 89}),
+                                      3: (1, {'@': 83}),
+                                      4: (1, {'@': 83})},
+                                  1: {5: (0, 154)},
+                                  2: {0: (1, {'@': 50}),
+                                      5: (1, {'@': 50}),
+                                      6: (1, {'@': 50}),
+                                      7: (1, {'@': 50}),
+                                      8: (1, {'@': 50}),
+                                      9: (1, {'@': 50}),
+                                      10: (1, {'@': 50}),
+                                      11: (1, {'@': 50}),
+                                      12: (1, {'@': 50}),
+                                      13: (1, {'@': 50}),
+                                      14: (1, {'@': 50}),
+                                      15: (1, {'@': 50}),
+                                      16: (1, {'@': 50}),
+                                      17: (1, {'@': 50})},
+                                  3: {8: (0, 141),
+                                      18: (0, 119),
+                                      19: (0, 9),
+                                      20: (0, 62),
+                                      21: (0, 165),
+                                      22: (0, 50),
+                                      23: (0, 48)},
+                                  4: {8: (0, 141), 19: (0, 81)},
+                                  5: {0: (1, {'@': 108}),
+                                      6: (1, {'@': 108}),
+                                      7: (1, {'@': 108}),
+                                      8: (1, {'@': 108}),
+                                      9: (1, {'@': 108}),
+                                      10: (1, {'@': 108}),
+                                      11: (1, {'@': 108}),
+                                      12: (1, {'@': 108}),
+                                      13: (1, {'@': 108}),
+                                      14: (1, {'@': 108}),
+                                      15: (1, {'@': 108}),
+                                      16: (1, {'@': 108}),
+                                      17: (1, {'@': 108}),
+                                      24: (1, {'@': 108})},
+                                  6: {0: (1, {'@': 60}),
+                                      5: (1, {'@': 60}),
+                                      6: (1, {'@': 60}),
+                                      7: (1, {'@': 60}),
+                                      8: (1, {'@': 60}),
+                                      9: (1, {'@': 60}),
+                                      10: (1, {'@': 60}),
+                                      11: (1, {'@': 60}),
+                                      12: (1, {'@': 60}),
+                                      13: (1, {'@': 60}),
+                                      14: (1, {'@': 60}),
+                                      15: (1, {'@': 60}),
+                                      17: (1, {'@': 60})},
+                                  7: {0: (1, {'@': 107}),
+                                      1: (1, {'@': 107}),
+                                      2: (1, {'@': 107}),
+                                      7: (1, {'@': 107}),
+                                      8: (1, {'@': 107}),
+                                      9: (1, {'@': 107}),
+                                      10: (1, {'@': 107}),
+                                      12: (1, {'@': 107}),
+                                      13: (1, {'@': 107}),
+                                      14: (1, {'@': 107}),
+                                      20: (1, {'@': 107}),
+                                      22: (1, {'@': 107}),
+                                      25: (1, {'@': 107}),
+                                      26: (1, {'@': 107}),
+                                      27: (1, {'@': 107}),
+                                      28: (1, {'@': 107}),
+                                      29: (1, {'@': 107}),
+                                      30: (1, {'@': 107}),
+                                      31: (1, {'@': 107}),
+                                      32: (1, {'@': 107}),
+                                      33: (1, {'@': 107}),
+                                      34: (1, {'@': 107}),
+                                      35: (1, {'@': 107})},
+                                  8: {0: (1, {'@': 84}),
+                                      1: (1, {'@': 84}),
+                                      2: (1, {'@': 84}),
+                                      7: (1, {'@': 84}),
+                                      8: (1, {'@': 84}),
+                                      9: (0, 117),
+                                      10: (1, {'@': 84}),
+                                      12: (1, {'@': 84}),
+                                      13: (1, {'@': 84}),
+                                      14: (1, {'@': 84}),
+                                      20: (1, {'@': 84}),
+                                      22: (1, {'@': 84}),
+                                      27: (0, 112),
+                                      28: (1, {'@': 84}),
+                                      29: (1, {'@': 84}),
+                                      30: (1, {'@': 84}),
+                                      31: (1, {'@': 84}),
+                                      32: (1, {'@': 84}),
+                                      33: (1, {'@': 84}),
+                                      34: (1, {'@': 84}),
+                                      35: (1, {'@': 84})},
+                                  9: {4: (0, 118)},
+                                  10: {0: (1, {'@': 72}),
+                                       5: (1, {'@': 72}),
+                                       6: (1, {'@': 72}),
+                                       7: (1, {'@': 72}),
+                                       8: (1, {'@': 72}),
+                                       9: (1, {'@': 72}),
+                                       10: (1, {'@': 72}),
+                                       11: (1, {'@': 72}),
+                                       12: (1, {'@': 72}),
+                                       13: (1, {'@': 72}),
+                                       14: (1, {'@': 72}),
+                                       15: (1, {'@': 72}),
+                                       17: (1, {'@': 72})},
+                                  11: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 148),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  12: {29: (0, 36), 49: (0, 4)},
+                                  13: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 58),
+                                       41: (0, 38),
+                                       48: (0, 89)},
+                                  14: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 127),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  15: {0: (1, {'@': 99}),
+                                       1: (1, {'@': 99}),
+                                       2: (1, {'@': 99}),
+                                       7: (1, {'@': 99}),
+                                       8: (1, {'@': 99}),
+                                       9: (1, {'@': 99}),
+                                       10: (1, {'@': 99}),
+                                       12: (1, {'@': 99}),
+                                       13: (1, {'@': 99}),
+                                       14: (1, {'@': 99}),
+                                       20: (1, {'@': 99}),
+                                       22: (1, {'@': 99}),
+                                       25: (1, {'@': 99}),
+                                       26: (1, {'@': 99}),
+                                       27: (1, {'@': 99}),
+                                       28: (1, {'@': 99}),
+                                       29: (1, {'@': 99}),
+                                       30: (1, {'@': 99}),
+                                       31: (1, {'@': 99}),
+                                       32: (1, {'@': 99}),
+                                       33: (1, {'@': 99}),
+                                       34: (1, {'@': 99}),
+                                       35: (1, {'@': 99})},
+                                  16: {1: (1, {'@': 66}), 2: (0, 97)},
+                                  17: {8: (0, 141), 19: (0, 125)},
+                                  18: {0: (1, {'@': 45}),
+                                       6: (1, {'@': 45}),
+                                       7: (1, {'@': 45}),
+                                       8: (1, {'@': 45}),
+                                       9: (1, {'@': 45}),
+                                       10: (1, {'@': 45}),
+                                       11: (1, {'@': 45}),
+                                       12: (1, {'@': 45}),
+                                       13: (1, {'@': 45}),
+                                       14: (1, {'@': 45}),
+                                       15: (1, {'@': 45}),
+                                       16: (1, {'@': 45}),
+                                       17: (1, {'@': 45}),
+                                       24: (1, {'@': 45})},
+                                  19: {0: (1, {'@': 49}),
+                                       5: (1, {'@': 49}),
+                                       6: (1, {'@': 49}),
+                                       7: (1, {'@': 49}),
+                                       8: (1, {'@': 49}),
+                                       9: (1, {'@': 49}),
+                                       10: (1, {'@': 49}),
+                                       11: (1, {'@': 49}),
+                                       12: (1, {'@': 49}),
+                                       13: (1, {'@': 49}),
+                                       14: (1, {'@': 49}),
+                                       15: (1, {'@': 49}),
+                                       16: (1, {'@': 49}),
+                                       17: (1, {'@': 49})},
+                                  20: {8: (0, 141),
+                                       18: (0, 119),
+                                       19: (0, 9),
+                                       20: (0, 12),
+                                       21: (0, 165),
+                                       22: (0, 50),
+                                       23: (0, 48)},
+                                  21: {1: (1, {'@': 65}), 2: (0, 97)},
+                                  22: {8: (0, 141), 19: (0, 40)},
+                                  23: {28: (0, 137), 29: (0, 142), 30: (0, 73)},
+                                  24: {0: (1, {'@': 100}),
+                                       1: (1, {'@': 100}),
+                                       2: (1, {'@': 100}),
+                                       7: (1, {'@': 100}),
+                                       8: (1, {'@': 100}),
+                                       9: (1, {'@': 100}),
+                                       10: (1, {'@': 100}),
+                                       12: (1, {'@': 100}),
+                                       13: (1, {'@': 100}),
+                                       14: (1, {'@': 100}),
+                                       20: (1, {'@': 100}),
+                                       22: (1, {'@': 100}),
+                                       25: (1, {'@': 100}),
+                                       26: (1, {'@': 100}),
+                                       27: (1, {'@': 100}),
+                                       28: (1, {'@': 100}),
+                                       29: (1, {'@': 100}),
+                                       30: (1, {'@': 100}),
+                                       31: (1, {'@': 100}),
+                                       32: (1, {'@': 100}),
+                                       33: (1, {'@': 100}),
+                                       34: (1, {'@': 100}),
+                                       35: (1, {'@': 100})},
+                                  25: {0: (1, {'@': 103}),
+                                       1: (1, {'@': 103}),
+                                       2: (1, {'@': 103}),
+                                       7: (1, {'@': 103}),
+                                       8: (1, {'@': 103}),
+                                       9: (1, {'@': 103}),
+                                       10: (1, {'@': 103}),
+                                       12: (1, {'@': 103}),
+                                       13: (1, {'@': 103}),
+                                       14: (1, {'@': 103}),
+                                       20: (1, {'@': 103}),
+                                       22: (1, {'@': 103}),
+                                       25: (1, {'@': 103}),
+                                       26: (1, {'@': 103}),
+                                       27: (1, {'@': 103}),
+                                       28: (1, {'@': 103}),
+                                       29: (1, {'@': 103}),
+                                       30: (1, {'@': 103}),
+                                       31: (1, {'@': 103}),
+                                       32: (1, {'@': 103}),
+                                       33: (1, {'@': 103}),
+                                       34: (1, {'@': 103}),
+                                       35: (1, {'@': 103})},
+                                  26: {8: (0, 141),
+                                       18: (0, 119),
+                                       19: (0, 9),
+                                       20: (0, 46),
+                                       21: (0, 170),
+                                       22: (0, 50),
+                                       23: (0, 48),
+                                       50: (0, 3)},
+                                  27: {28: (1, {'@': 76}), 29: (1, {'@': 76}), 30: (1, {'@': 76})},
+                                  28: {5: (0, 10)},
+                                  29: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 64),
+                                       41: (0, 38),
+                                       48: (0, 89)},
+                                  30: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 41),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  31: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 167),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  32: {1: (0, 82)},
+                                  33: {0: (1, {'@': 121}),
+                                       7: (1, {'@': 121}),
+                                       8: (1, {'@': 121}),
+                                       9: (1, {'@': 121}),
+                                       10: (1, {'@': 121}),
+                                       12: (1, {'@': 121}),
+                                       13: (1, {'@': 121}),
+                                       14: (1, {'@': 121}),
+                                       20: (1, {'@': 121}),
+                                       22: (1, {'@': 121})},
+                                  34: {1: (1, {'@': 63}), 2: (0, 97)},
+                                  35: {28: (0, 137), 29: (0, 39), 30: (0, 73)},
+                                  36: {0: (1, {'@': 47}),
+                                       5: (1, {'@': 47}),
+                                       6: (1, {'@': 47}),
+                                       7: (1, {'@': 47}),
+                                       8: (1, {'@': 47}),
+                                       9: (1, {'@': 47}),
+                                       10: (1, {'@': 47}),
+                                       11: (1, {'@': 47}),
+                                       12: (1, {'@': 47}),
+                                       13: (1, {'@': 47}),
+                                       14: (1, {'@': 47}),
+                                       15: (1, {'@': 47}),
+                                       16: (0, 120),
+                                       51: (0, 14),
+                                       52: (0, 162),
+                                       53: (0, 136)},
+                                  37: {0: (0, 114),
+                                       1: (1, {'@': 104}),
+                                       2: (1, {'@': 104}),
+                                       3: (1, {'@': 82}),
+                                       4: (1, {'@': 82}),
+                                       9: (1, {'@': 104}),
+                                       25: (1, {'@': 104}),
+                                       26: (1, {'@': 104}),
+                                       27: (1, {'@': 104})},
+                                  38: {0: (1, {'@': 92}),
+                                       1: (1, {'@': 92}),
+                                       2: (1, {'@': 92}),
+                                       7: (1, {'@': 92}),
+                                       8: (1, {'@': 92}),
+                                       9: (1, {'@': 92}),
+                                       10: (1, {'@': 92}),
+                                       12: (1, {'@': 92}),
+                                       13: (1, {'@': 92}),
+                                       14: (1, {'@': 92}),
+                                       20: (1, {'@': 92}),
+                                       22: (1, {'@': 92}),
+                                       25: (0, 44),
+                                       26: (0, 139),
+                                       27: (1, {'@': 92}),
+                                       28: (1, {'@': 92}),
+                                       29: (1, {'@': 92}),
+                                       30: (1, {'@': 92}),
+                                       31: (1, {'@': 92}),
+                                       32: (1, {'@': 92}),
+                                       33: (1, {'@': 92}),
+                                       34: (1, {'@': 92}),
+                                       35: (1, {'@': 92})},
+                                  39: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 1),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  40: {8: (1, {'@': 57}), 20: (1, {'@': 57}), 22: (1, {'@': 57})},
+                                  41: {5: (0, 18)},
+                                  42: {29: (0, 108)},
+                                  43: {17: (1, {'@': 39})},
+                                  44: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 160),
+                                       37: (0, 86),
+                                       48: (0, 94)},
+                                  45: {1: (0, 103), 2: (0, 163)},
+                                  46: {4: (0, 56), 29: (0, 55)},
+                                  47: {5: (0, 2)},
+                                  48: {8: (1, {'@': 116}),
+                                       20: (1, {'@': 116}),
+                                       22: (1, {'@': 116})},
+                                  49: {0: (1, {'@': 71}),
+                                       5: (1, {'@': 71}),
+                                       6: (1, {'@': 71}),
+                                       7: (1, {'@': 71}),
+                                       8: (1, {'@': 71}),
+                                       9: (1, {'@': 71}),
+                                       10: (1, {'@': 71}),
+                                       11: (1, {'@': 71}),
+                                       12: (1, {'@': 71}),
+                                       13: (1, {'@': 71}),
+                                       14: (1, {'@': 71}),
+                                       15: (1, {'@': 71}),
+                                       17: (1, {'@': 71}),
+                                       54: (1, {'@': 71}),
+                                       55: (1, {'@': 71})},
+                                  50: {8: (0, 141), 19: (0, 93)},
+                                  51: {0: (1, {'@': 120}),
+                                       7: (1, {'@': 120}),
+                                       8: (1, {'@': 120}),
+                                       9: (1, {'@': 120}),
+                                       10: (1, {'@': 120}),
+                                       12: (1, {'@': 120}),
+                                       13: (1, {'@': 120}),
+                                       14: (1, {'@': 120}),
+                                       20: (1, {'@': 120}),
+                                       22: (1, {'@': 120})},
+                                  52: {8: (1, {'@': 56}), 20: (1, {'@': 56}), 22: (1, {'@': 56})},
+                                  53: {0: (1, {'@': 85}),
+                                       1: (1, {'@': 85}),
+                                       2: (1, {'@': 85}),
+                                       7: (1, {'@': 85}),
+                                       8: (1, {'@': 85}),
+                                       9: (1, {'@': 85}),
+                                       10: (1, {'@': 85}),
+                                       12: (1, {'@': 85}),
+                                       13: (1, {'@': 85}),
+                                       14: (1, {'@': 85}),
+                                       20: (1, {'@': 85}),
+                                       22: (1, {'@': 85}),
+                                       28: (1, {'@': 85}),
+                                       29: (1, {'@': 85}),
+                                       30: (1, {'@': 85}),
+                                       31: (1, {'@': 85}),
+                                       32: (1, {'@': 85}),
+                                       33: (1, {'@': 85}),
+                                       34: (1, {'@': 85}),
+                                       35: (1, {'@': 85})},
+                                  54: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 160),
+                                       37: (0, 86),
+                                       48: (0, 15)},
+                                  55: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 134),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  56: {8: (0, 141), 19: (0, 166)},
+                                  57: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       20: (0, 133),
+                                       22: (0, 79),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 138),
+                                       41: (0, 38),
+                                       48: (0, 89),
+                                       56: (0, 153),
+                                       57: (0, 51)},
+                                  58: {2: (0, 97),
+                                       28: (1, {'@': 79}),
+                                       29: (1, {'@': 79}),
+                                       30: (1, {'@': 79})},
+                                  59: {2: (0, 97),
+                                       28: (1, {'@': 78}),
+                                       29: (1, {'@': 78}),
+                                       30: (1, {'@': 78})},
+                                  60: {8: (0, 141), 19: (0, 157)},
+                                  61: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 21),
+                                       41: (0, 38),
+                                       48: (0, 89)},
+                                  62: {4: (0, 17), 29: (0, 31)},
+                                  63: {8: (0, 141), 19: (0, 42)},
+                                  64: {2: (0, 97),
+                                       28: (1, {'@': 77}),
+                                       29: (1, {'@': 77}),
+                                       30: (1, {'@': 77})},
+                                  65: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 90),
+                                       41: (0, 38),
+                                       48: (0, 89),
+                                       58: (0, 115),
+                                       59: (0, 27),
+                                       60: (0, 23)},
+                                  66: {28: (1, {'@': 73}), 29: (1, {'@': 73}), 30: (1, {'@': 73})},
+                                  67: {0: (1, {'@': 115}),
+                                       5: (1, {'@': 115}),
+                                       6: (1, {'@': 115}),
+                                       7: (1, {'@': 115}),
+                                       8: (1, {'@': 115}),
+                                       9: (1, {'@': 115}),
+                                       10: (1, {'@': 115}),
+                                       11: (1, {'@': 115}),
+                                       12: (1, {'@': 115}),
+                                       13: (1, {'@': 115}),
+                                       14: (1, {'@': 115}),
+                                       15: (1, {'@': 115}),
+                                       17: (1, {'@': 115})},
+                                  68: {0: (0, 57),
+                                       1: (1, {'@': 89}),
+                                       2: (1, {'@': 89}),
+                                       7: (1, {'@': 89}),
+                                       8: (1, {'@': 89}),
+                                       9: (1, {'@': 89}),
+                                       10: (1, {'@': 89}),
+                                       12: (1, {'@': 89}),
+                                       13: (1, {'@': 89}),
+                                       14: (1, {'@': 89}),
+                                       20: (1, {'@': 89}),
+                                       22: (1, {'@': 89}),
+                                       28: (1, {'@': 89}),
+                                       29: (1, {'@': 89}),
+                                       30: (1, {'@': 89}),
+                                       31: (1, {'@': 89}),
+                                       32: (1, {'@': 89}),
+                                       33: (1, {'@': 89}),
+                                       34: (1, {'@': 89}),
+                                       35: (1, {'@': 89})},
+                                  69: {3: (0, 123), 4: (0, 113)},
+                                  70: {28: (1, {'@': 74}), 29: (1, {'@': 74}), 30: (1, {'@': 74})},
+                                  71: {28: (1, {'@': 75}), 29: (1, {'@': 75}), 30: (1, {'@': 75})},
+                                  72: {2: (0, 97),
+                                       28: (1, {'@': 80}),
+                                       29: (1, {'@': 80}),
+                                       30: (1, {'@': 80})},
+                                  73: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 90),
+                                       41: (0, 38),
+                                       48: (0, 89),
+                                       59: (0, 66)},
+                                  74: {2: (0, 97),
+                                       28: (1, {'@': 81}),
+                                       29: (1, {'@': 81}),
+                                       30: (1, {'@': 81})},
+                                  75: {0: (1, {'@': 97}),
+                                       1: (1, {'@': 97}),
+                                       2: (1, {'@': 97}),
+                                       7: (1, {'@': 97}),
+                                       8: (1, {'@': 97}),
+                                       9: (1, {'@': 97}),
+                                       10: (1, {'@': 97}),
+                                       12: (1, {'@': 97}),
+                                       13: (1, {'@': 97}),
+                                       14: (1, {'@': 97}),
+                                       20: (1, {'@': 97}),
+                                       22: (1, {'@': 97}),
+                                       25: (1, {'@': 97}),
+                                       26: (1, {'@': 97}),
+                                       27: (1, {'@': 97}),
+                                       28: (1, {'@': 97}),
+                                       29: (1, {'@': 97}),
+                                       30: (1, {'@': 97}),
+                                       31: (1, {'@': 97}),
+                                       32: (1, {'@': 97}),
+                                       33: (1, {'@': 97}),
+                                       34: (1, {'@': 97}),
+                                       35: (1, {'@': 97})},
+                                  76: {0: (1, {'@': 118}),
+                                       5: (1, {'@': 118}),
+                                       6: (1, {'@': 118}),
+                                       7: (1, {'@': 118}),
+                                       8: (1, {'@': 118}),
+                                       9: (1, {'@': 118}),
+                                       10: (1, {'@': 118}),
+                                       11: (1, {'@': 118}),
+                                       12: (1, {'@': 118}),
+                                       13: (1, {'@': 118}),
+                                       14: (1, {'@': 118}),
+                                       15: (1, {'@': 118}),
+                                       17: (1, {'@': 118}),
+                                       54: (1, {'@': 118}),
+                                       55: (1, {'@': 118})},
+                                  77: {0: (1, {'@': 43}),
+                                       6: (1, {'@': 43}),
+                                       7: (1, {'@': 43}),
+                                       8: (1, {'@': 43}),
+                                       9: (1, {'@': 43}),
+                                       10: (1, {'@': 43}),
+                                       11: (1, {'@': 43}),
+                                       12: (1, {'@': 43}),
+                                       13: (1, {'@': 43}),
+                                       14: (1, {'@': 43}),
+                                       15: (1, {'@': 43}),
+                                       16: (1, {'@': 43}),
+                                       17: (1, {'@': 43}),
+                                       24: (1, {'@': 43})},
+                                  78: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 90),
+                                       41: (0, 38),
+                                       48: (0, 89),
+                                       58: (0, 115),
+                                       59: (0, 27),
+                                       60: (0, 161)},
+                                  79: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 80),
+                                       41: (0, 38),
+                                       48: (0, 89)},
+                                  80: {0: (1, {'@': 91}),
+                                       2: (0, 97),
+                                       7: (1, {'@': 91}),
+                                       8: (1, {'@': 91}),
+                                       9: (1, {'@': 91}),
+                                       10: (1, {'@': 91}),
+                                       12: (1, {'@': 91}),
+                                       13: (1, {'@': 91}),
+                                       14: (1, {'@': 91}),
+                                       20: (1, {'@': 91}),
+                                       22: (1, {'@': 91})},
+                                  81: {29: (0, 146)},
+                                  82: {0: (1, {'@': 59}),
+                                       5: (1, {'@': 59}),
+                                       6: (1, {'@': 59}),
+                                       7: (1, {'@': 59}),
+                                       8: (1, {'@': 59}),
+                                       9: (1, {'@': 59}),
+                                       10: (1, {'@': 59}),
+                                       11: (1, {'@': 59}),
+                                       12: (1, {'@': 59}),
+                                       13: (1, {'@': 59}),
+                                       14: (1, {'@': 59}),
+                                       15: (1, {'@': 59}),
+                                       17: (1, {'@': 59})},
+                                  83: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 84),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  84: {5: (0, 85)},
+                                  85: {0: (1, {'@': 42}),
+                                       6: (1, {'@': 42}),
+                                       7: (1, {'@': 42}),
+                                       8: (1, {'@': 42}),
+                                       9: (1, {'@': 42}),
+                                       10: (1, {'@': 42}),
+                                       11: (1, {'@': 42}),
+                                       12: (1, {'@': 42}),
+                                       13: (1, {'@': 42}),
+                                       14: (1, {'@': 42}),
+                                       15: (1, {'@': 42}),
+                                       16: (1, {'@': 42}),
+                                       17: (1, {'@': 42}),
+                                       24: (1, {'@': 42})},
+                                  86: {0: (1, {'@': 102}),
+                                       1: (1, {'@': 102}),
+                                       2: (1, {'@': 102}),
+                                       7: (1, {'@': 102}),
+                                       8: (1, {'@': 102}),
+                                       9: (1, {'@': 102}),
+                                       10: (1, {'@': 102}),
+                                       12: (1, {'@': 102}),
+                                       13: (1, {'@': 102}),
+                                       14: (1, {'@': 102}),
+                                       20: (1, {'@': 102}),
+                                       22: (1, {'@': 102}),
+                                       25: (1, {'@': 102}),
+                                       26: (1, {'@': 102}),
+                                       27: (1, {'@': 102}),
+                                       28: (1, {'@': 102}),
+                                       29: (1, {'@': 102}),
+                                       30: (1, {'@': 102}),
+                                       31: (1, {'@': 102}),
+                                       32: (1, {'@': 102}),
+                                       33: (1, {'@': 102}),
+                                       34: (1, {'@': 102}),
+                                       35: (1, {'@': 102})},
+                                  87: {0: (1, {'@': 119}),
+                                       5: (1, {'@': 119}),
+                                       6: (1, {'@': 119}),
+                                       7: (1, {'@': 119}),
+                                       8: (1, {'@': 119}),
+                                       9: (1, {'@': 119}),
+                                       10: (1, {'@': 119}),
+                                       11: (1, {'@': 119}),
+                                       12: (1, {'@': 119}),
+                                       13: (1, {'@': 119}),
+                                       14: (1, {'@': 119}),
+                                       15: (1, {'@': 119}),
+                                       17: (1, {'@': 119}),
+                                       54: (1, {'@': 119}),
+                                       55: (1, {'@': 119})},
+                                  88: {0: (1, {'@': 44}),
+                                       6: (1, {'@': 44}),
+                                       7: (1, {'@': 44}),
+                                       8: (1, {'@': 44}),
+                                       9: (1, {'@': 44}),
+                                       10: (1, {'@': 44}),
+                                       11: (1, {'@': 44}),
+                                       12: (1, {'@': 44}),
+                                       13: (1, {'@': 44}),
+                                       14: (1, {'@': 44}),
+                                       15: (1, {'@': 44}),
+                                       16: (1, {'@': 44}),
+                                       17: (1, {'@': 44}),
+                                       24: (1, {'@': 44})},
+                                  89: {0: (1, {'@': 95}),
+                                       1: (1, {'@': 95}),
+                                       2: (1, {'@': 95}),
+                                       7: (1, {'@': 95}),
+                                       8: (1, {'@': 95}),
+                                       9: (1, {'@': 95}),
+                                       10: (1, {'@': 95}),
+                                       12: (1, {'@': 95}),
+                                       13: (1, {'@': 95}),
+                                       14: (1, {'@': 95}),
+                                       20: (1, {'@': 95}),
+                                       22: (1, {'@': 95}),
+                                       25: (1, {'@': 95}),
+                                       26: (1, {'@': 95}),
+                                       27: (1, {'@': 95}),
+                                       28: (1, {'@': 95}),
+                                       29: (1, {'@': 95}),
+                                       30: (1, {'@': 95}),
+                                       31: (1, {'@': 95}),
+                                       32: (1, {'@': 95}),
+                                       33: (1, {'@': 95}),
+                                       34: (1, {'@': 95}),
+                                       35: (1, {'@': 95})},
+                                  90: {2: (0, 97),
+                                       31: (0, 132),
+                                       32: (0, 29),
+                                       33: (0, 13),
+                                       34: (0, 106),
+                                       35: (0, 109)},
+                                  91: {0: (1, {'@': 67}),
+                                       5: (1, {'@': 67}),
+                                       6: (1, {'@': 67}),
+                                       7: (1, {'@': 67}),
+                                       8: (1, {'@': 67}),
+                                       9: (1, {'@': 67}),
+                                       10: (1, {'@': 67}),
+                                       11: (1, {'@': 67}),
+                                       12: (1, {'@': 67}),
+                                       13: (1, {'@': 67}),
+                                       14: (1, {'@': 67}),
+                                       15: (1, {'@': 67}),
+                                       17: (1, {'@': 67}),
+                                       54: (0, 158),
+                                       55: (0, 78),
+                                       61: (0, 87)},
+                                  92: {0: (0, 107),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       19: (0, 145),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 90),
+                                       41: (0, 38),
+                                       48: (0, 89),
+                                       58: (0, 115),
+                                       59: (0, 27),
+                                       60: (0, 35)},
+                                  93: {4: (0, 22)},
+                                  94: {0: (1, {'@': 96}),
+                                       1: (1, {'@': 96}),
+                                       2: (1, {'@': 96}),
+                                       7: (1, {'@': 96}),
+                                       8: (1, {'@': 96}),
+                                       9: (1, {'@': 96}),
+                                       10: (1, {'@': 96}),
+                                       12: (1, {'@': 96}),
+                                       13: (1, {'@': 96}),
+                                       14: (1, {'@': 96}),
+                                       20: (1, {'@': 96}),
+                                       22: (1, {'@': 96}),
+                                       25: (1, {'@': 96}),
+                                       26: (1, {'@': 96}),
+                                       27: (1, {'@': 96}),
+                                       28: (1, {'@': 96}),
+                                       29: (1, {'@': 96}),
+                                       30: (1, {'@': 96}),
+                                       31: (1, {'@': 96}),
+                                       32: (1, {'@': 96}),
+                                       33: (1, {'@': 96}),
+                                       34: (1, {'@': 96}),
+                                       35: (1, {'@': 96})},
+                                  95: {},
+                                  96: {0: (1, {'@': 41}),
+                                       6: (1, {'@': 41}),
+                                       7: (1, {'@': 41}),
+                                       8: (1, {'@': 41}),
+                                       9: (1, {'@': 41}),
+                                       10: (1, {'@': 41}),
+                                       11: (1, {'@': 41}),
+                                       12: (1, {'@': 41}),
+                                       13: (1, {'@': 41}),
+                                       14: (1, {'@': 41}),
+                                       15: (1, {'@': 41}),
+                                       16: (1, {'@': 41}),
+                                       17: (1, {'@': 41}),
+                                       24: (0, 60),
+                                       62: (0, 95),
+                                       63: (0, 135),
+                                       64: (0, 169),
+                                       65: (0, 175),
+                                       66: (0, 5)},
+                                  97: {8: (0, 141), 19: (0, 68)},
+                                  98: {0: (1, {'@': 61}),
+                                       5: (1, {'@': 61}),
+                                       6: (1, {'@': 61}),
+                                       7: (1, {'@': 61}),
+                                       8: (1, {'@': 61}),
+                                       9: (1, {'@': 61}),
+                                       10: (1, {'@': 61}),
+                                       11: (1, {'@': 61}),
+                                       12: (1, {'@': 61}),
+                                       13: (1, {'@': 61}),
+                                       14: (1, {'@': 61}),
+                                       15: (1, {'@': 61}),
+                                       17: (1, {'@': 61})},
+                                  99: {0: (0, 107),
+                                       5: (1, {'@': 53}),
+                                       6: (0, 65),
+                                       7: (0, 147),
+                                       8: (0, 141),
+                                       9: (0, 54),
+                                       10: (0, 100),
+                                       11: (0, 105),
+                                       12: (0, 25),
+                                       13: (0, 122),
+                                       14: (0, 7),
+                                       15: (0, 92),
+                                       19: (0, 37),
+                                       36: (0, 98),
+                                       37: (0, 86),
+                                       38: (0, 8),
+                                       39: (0, 45),
+                                       40: (0, 159),
+                                       41: (0, 38),
+                                       42: (0, 32),
+                                       43: (0, 69),
+                                       44: (0, 150),
+                                       45: (0, 121),
+                                       46: (0, 156),
+                                       47: (0, 111),
+                                       48: (0, 89)},
+                                  100: {0: (1, {'@': 101}),
+                                        1: (1, {'@': 101}),
+                                        2: (1, {'@': 101}),
+                                        7: (1, {'@': 101}),
+                                        8: (1, {'@': 101}),
+                                        9: (1, {'@': 101}),
+                                        10: (1, {'@': 101}),
+                                        12: (1, {'@': 101}),
+                                        13: (1, {'@': 101}),
+                                        14: (1, {'@': 101}),
+                                        20: (1, {'@': 101}),
+                                        22: (1, {'@': 101}),
+                                        25: (1, {'@': 101}),
+                                        26: (1, {'@': 101}),
+                                        27: (1, {'@': 101}),
+                                        28: (1, {'@': 101}),
+                                        29: (1, {'@': 101}),
+                                        30: (1, {'@': 101}),
+                                        31: (1, {'@': 101}),
+                                        32: (1, {'@': 101}),
+                                        33: (1, {'@': 101}),
+                                        34: (1, {'@': 101}),
+                                        35: (1, {'@': 101})},
+                                  101: {0: (1, {'@': 94}),
+                                        1: (1, {'@': 94}),
+                                        2: (1, {'@': 94}),
+                                        7: (1, {'@': 94}),
+                                        8: (1, {'@': 94}),
+                                        9: (1, {'@': 94}),
+                                        10: (1, {'@': 94}),
+                                        12: (1, {'@': 94}),
+                                        13: (1, {'@': 94}),
+                                        14: (1, {'@': 94}),
+                                        20: (1, {'@': 94}),
+                                        22: (1, {'@': 94}),
+                                        25: (0, 44),
+                                        26: (0, 139),
+                                        27: (1, {'@': 94}),
+                                        28: (1, {'@': 94}),
+                                        29: (1, {'@': 94}),
+                                        30: (1, {'@': 94}),
+                                        31: (1, {'@': 94}),
+                                        32: (1, {'@': 94}),
+                                        33: (1, {'@': 94}),
+                                        34: (1, {'@': 94}),
+                                        35: (1, {'@': 94})},
+                                  102: {3: (0, 61)},
+                                  103: {0: (1, {'@': 58}),
+                                        5: (1, {'@': 58}),
+                                        6: (1, {'@': 58}),
+                                        7: (1, {'@': 58}),
+                                        8: (1, {'@': 58}),
+                                        9: (1, {'@': 58}),
+                                        10: (1, {'@': 58}),
+                                        11: (1, {'@': 58}),
+                                        12: (1, {'@': 58}),
+                                        13: (1, {'@': 58}),
+                                        14: (1, {'@': 58}),
+                                        15: (1, {'@': 58}),
+                                        17: (1, {'@': 58})},
+                                  104: {0: (1, {'@': 86}),
+                                        1: (1, {'@': 86}),
+                                        2: (1, {'@': 86}),
+                                        7: (1, {'@': 86}),
+                                        8: (1, {'@': 86}),
+                                        9: (1, {'@': 86}),
+                                        10: (1, {'@': 86}),
+                                        12: (1, {'@': 86}),
+                                        13: (1, {'@': 86}),
+                                        14: (1, {'@': 86}),
+                                        20: (1, {'@': 86}),
+                                        22: (1, {'@': 86}),
+                                        28: (1, {'@': 86}),
+                                        29: (1, {'@': 86}),
+                                        30: (1, {'@': 86}),
+                                        31: (1, {'@': 86}),
+                                        32: (1, {'@': 86}),
+                                        33: (1, {'@': 86}),
+                                        34: (1, {'@': 86}),
+                                        35: (1, {'@': 86})},
+                                  105: {0: (0, 107),
+                                        1: (1, {'@': 64}),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 34),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  106: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 59),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  107: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 160),
+                                        37: (0, 86),
+                                        38: (0, 126),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  108: {0: (1, {'@': 47}),
+                                        5: (1, {'@': 47}),
+                                        6: (1, {'@': 47}),
+                                        7: (1, {'@': 47}),
+                                        8: (1, {'@': 47}),
+                                        9: (1, {'@': 47}),
+                                        10: (1, {'@': 47}),
+                                        11: (1, {'@': 47}),
+                                        12: (1, {'@': 47}),
+                                        13: (1, {'@': 47}),
+                                        14: (1, {'@': 47}),
+                                        15: (1, {'@': 47}),
+                                        16: (0, 120),
+                                        51: (0, 11),
+                                        52: (0, 162),
+                                        53: (0, 136)},
+                                  109: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 74),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  110: {5: (0, 49)},
+                                  111: {1: (0, 6)},
+                                  112: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 160),
+                                        37: (0, 86),
+                                        41: (0, 124),
+                                        48: (0, 89)},
+                                  113: {8: (0, 141), 19: (0, 102)},
+                                  114: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        20: (0, 104),
+                                        22: (0, 79),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 138),
+                                        41: (0, 38),
+                                        48: (0, 89),
+                                        56: (0, 130),
+                                        57: (0, 51)},
+                                  115: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 90),
+                                        41: (0, 38),
+                                        48: (0, 89),
+                                        59: (0, 71)},
+                                  116: {0: (1, {'@': 70}),
+                                        5: (1, {'@': 70}),
+                                        6: (1, {'@': 70}),
+                                        7: (1, {'@': 70}),
+                                        8: (1, {'@': 70}),
+                                        9: (1, {'@': 70}),
+                                        10: (1, {'@': 70}),
+                                        11: (1, {'@': 70}),
+                                        12: (1, {'@': 70}),
+                                        13: (1, {'@': 70}),
+                                        14: (1, {'@': 70}),
+                                        15: (1, {'@': 70}),
+                                        17: (1, {'@': 70}),
+                                        54: (0, 158),
+                                        55: (0, 78),
+                                        61: (0, 76),
+                                        67: (0, 131)},
+                                  117: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 160),
+                                        37: (0, 86),
+                                        41: (0, 101),
+                                        48: (0, 89)},
+                                  118: {8: (0, 141), 19: (0, 52)},
+                                  119: {8: (0, 141),
+                                        19: (0, 9),
+                                        20: (1, {'@': 54}),
+                                        22: (0, 50),
+                                        23: (0, 152)},
+                                  120: {8: (0, 141), 19: (0, 173)},
+                                  121: {0: (1, {'@': 62}),
+                                        5: (1, {'@': 62}),
+                                        6: (1, {'@': 62}),
+                                        7: (1, {'@': 62}),
+                                        8: (1, {'@': 62}),
+                                        9: (1, {'@': 62}),
+                                        10: (1, {'@': 62}),
+                                        11: (1, {'@': 62}),
+                                        12: (1, {'@': 62}),
+                                        13: (1, {'@': 62}),
+                                        14: (1, {'@': 62}),
+                                        15: (1, {'@': 62}),
+                                        17: (1, {'@': 62})},
+                                  122: {0: (1, {'@': 98}),
+                                        1: (1, {'@': 98}),
+                                        2: (1, {'@': 98}),
+                                        7: (1, {'@': 98}),
+                                        8: (1, {'@': 98}),
+                                        9: (1, {'@': 98}),
+                                        10: (1, {'@': 98}),
+                                        12: (1, {'@': 98}),
+                                        13: (1, {'@': 98}),
+                                        14: (1, {'@': 98}),
+                                        20: (1, {'@': 98}),
+                                        22: (1, {'@': 98}),
+                                        25: (1, {'@': 98}),
+                                        26: (1, {'@': 98}),
+                                        27: (1, {'@': 98}),
+                                        28: (1, {'@': 98}),
+                                        29: (1, {'@': 98}),
+                                        30: (1, {'@': 98}),
+                                        31: (1, {'@': 98}),
+                                        32: (1, {'@': 98}),
+                                        33: (1, {'@': 98}),
+                                        34: (1, {'@': 98}),
+                                        35: (1, {'@': 98})},
+                                  123: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 16),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  124: {0: (1, {'@': 93}),
+                                        1: (1, {'@': 93}),
+                                        2: (1, {'@': 93}),
+                                        7: (1, {'@': 93}),
+                                        8: (1, {'@': 93}),
+                                        9: (1, {'@': 93}),
+                                        10: (1, {'@': 93}),
+                                        12: (1, {'@': 93}),
+                                        13: (1, {'@': 93}),
+                                        14: (1, {'@': 93}),
+                                        20: (1, {'@': 93}),
+                                        22: (1, {'@': 93}),
+                                        25: (0, 44),
+                                        26: (0, 139),
+                                        27: (1, {'@': 93}),
+                                        28: (1, {'@': 93}),
+                                        29: (1, {'@': 93}),
+                                        30: (1, {'@': 93}),
+                                        31: (1, {'@': 93}),
+                                        32: (1, {'@': 93}),
+                                        33: (1, {'@': 93}),
+                                        34: (1, {'@': 93}),
+                                        35: (1, {'@': 93})},
+                                  125: {29: (0, 155)},
+                                  126: {9: (0, 117), 20: (0, 24), 27: (0, 112)},
+                                  127: {5: (0, 77)},
+                                  128: {0: (1, {'@': 109}),
+                                        6: (1, {'@': 109}),
+                                        7: (1, {'@': 109}),
+                                        8: (1, {'@': 109}),
+                                        9: (1, {'@': 109}),
+                                        10: (1, {'@': 109}),
+                                        11: (1, {'@': 109}),
+                                        12: (1, {'@': 109}),
+                                        13: (1, {'@': 109}),
+                                        14: (1, {'@': 109}),
+                                        15: (1, {'@': 109}),
+                                        16: (1, {'@': 109}),
+                                        17: (1, {'@': 109}),
+                                        24: (1, {'@': 109})},
+                                  129: {0: (1, {'@': 47}),
+                                        5: (1, {'@': 47}),
+                                        6: (1, {'@': 47}),
+                                        7: (1, {'@': 47}),
+                                        8: (1, {'@': 47}),
+                                        9: (1, {'@': 47}),
+                                        10: (1, {'@': 47}),
+                                        11: (1, {'@': 47}),
+                                        12: (1, {'@': 47}),
+                                        13: (1, {'@': 47}),
+                                        14: (1, {'@': 47}),
+                                        15: (1, {'@': 47}),
+                                        16: (0, 120),
+                                        51: (0, 30),
+                                        52: (0, 162),
+                                        53: (0, 136)},
+                                  130: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        20: (0, 53),
+                                        22: (0, 79),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 138),
+                                        41: (0, 38),
+                                        48: (0, 89),
+                                        57: (0, 33)},
+                                  131: {0: (1, {'@': 69}),
+                                        5: (1, {'@': 69}),
+                                        6: (1, {'@': 69}),
+                                        7: (1, {'@': 69}),
+                                        8: (1, {'@': 69}),
+                                        9: (1, {'@': 69}),
+                                        10: (1, {'@': 69}),
+                                        11: (1, {'@': 69}),
+                                        12: (1, {'@': 69}),
+                                        13: (1, {'@': 69}),
+                                        14: (1, {'@': 69}),
+                                        15: (1, {'@': 69}),
+                                        17: (1, {'@': 69}),
+                                        54: (0, 158),
+                                        55: (0, 78),
+                                        61: (0, 87)},
+                                  132: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 72),
+                                        41: (0, 38),
+                                        48: (0, 89)},
+                                  133: {0: (1, {'@': 88}),
+                                        1: (1, {'@': 88}),
+                                        2: (1, {'@': 88}),
+                                        7: (1, {'@': 88}),
+                                        8: (1, {'@': 88}),
+                                        9: (1, {'@': 88}),
+                                        10: (1, {'@': 88}),
+                                        12: (1, {'@': 88}),
+                                        13: (1, {'@': 88}),
+                                        14: (1, {'@': 88}),
+                                        20: (1, {'@': 88}),
+                                        22: (1, {'@': 88}),
+                                        28: (1, {'@': 88}),
+                                        29: (1, {'@': 88}),
+                                        30: (1, {'@': 88}),
+                                        31: (1, {'@': 88}),
+                                        32: (1, {'@': 88}),
+                                        33: (1, {'@': 88}),
+                                        34: (1, {'@': 88}),
+                                        35: (1, {'@': 88})},
+                                  134: {5: (0, 164)},
+                                  135: {17: (1, {'@': 38})},
+                                  136: {0: (1, {'@': 112}),
+                                        5: (1, {'@': 112}),
+                                        6: (1, {'@': 112}),
+                                        7: (1, {'@': 112}),
+                                        8: (1, {'@': 112}),
+                                        9: (1, {'@': 112}),
+                                        10: (1, {'@': 112}),
+                                        11: (1, {'@': 112}),
+                                        12: (1, {'@': 112}),
+                                        13: (1, {'@': 112}),
+                                        14: (1, {'@': 112}),
+                                        15: (1, {'@': 112}),
+                                        16: (1, {'@': 112}),
+                                        17: (1, {'@': 112})},
+                                  137: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 90),
+                                        41: (0, 38),
+                                        48: (0, 89),
+                                        59: (0, 70)},
+                                  138: {0: (1, {'@': 90}),
+                                        2: (0, 97),
+                                        7: (1, {'@': 90}),
+                                        8: (1, {'@': 90}),
+                                        9: (1, {'@': 90}),
+                                        10: (1, {'@': 90}),
+                                        12: (1, {'@': 90}),
+                                        13: (1, {'@': 90}),
+                                        14: (1, {'@': 90}),
+                                        20: (1, {'@': 90}),
+                                        22: (1, {'@': 90})},
+                                  139: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 160),
+                                        37: (0, 86),
+                                        48: (0, 75)},
+                                  140: {5: (0, 168)},
+                                  141: {0: (1, {'@': 105}),
+                                        1: (1, {'@': 105}),
+                                        2: (1, {'@': 105}),
+                                        3: (1, {'@': 105}),
+                                        4: (1, {'@': 105}),
+                                        7: (1, {'@': 105}),
+                                        8: (1, {'@': 105}),
+                                        9: (1, {'@': 105}),
+                                        10: (1, {'@': 105}),
+                                        12: (1, {'@': 105}),
+                                        13: (1, {'@': 105}),
+                                        14: (1, {'@': 105}),
+                                        20: (1, {'@': 105}),
+                                        22: (1, {'@': 105}),
+                                        25: (1, {'@': 105}),
+                                        26: (1, {'@': 105}),
+                                        27: (1, {'@': 105}),
+                                        28: (1, {'@': 105}),
+                                        29: (1, {'@': 105}),
+                                        30: (1, {'@': 105}),
+                                        31: (1, {'@': 105}),
+                                        32: (1, {'@': 105}),
+                                        33: (1, {'@': 105}),
+                                        34: (1, {'@': 105}),
+                                        35: (1, {'@': 105})},
+                                  142: {0: (0, 107),
+                                        5: (1, {'@': 53}),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        40: (0, 159),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 150),
+                                        45: (0, 121),
+                                        46: (0, 28),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  143: {8: (0, 141),
+                                        18: (0, 119),
+                                        19: (0, 9),
+                                        20: (0, 174),
+                                        21: (0, 170),
+                                        22: (0, 50),
+                                        23: (0, 48),
+                                        50: (0, 20)},
+                                  144: {0: (1, {'@': 87}),
+                                        1: (1, {'@': 87}),
+                                        2: (1, {'@': 87}),
+                                        7: (1, {'@': 87}),
+                                        8: (1, {'@': 87}),
+                                        9: (1, {'@': 87}),
+                                        10: (1, {'@': 87}),
+                                        12: (1, {'@': 87}),
+                                        13: (1, {'@': 87}),
+                                        14: (1, {'@': 87}),
+                                        20: (1, {'@': 87}),
+                                        22: (1, {'@': 87}),
+                                        28: (1, {'@': 87}),
+                                        29: (1, {'@': 87}),
+                                        30: (1, {'@': 87}),
+                                        31: (1, {'@': 87}),
+                                        32: (1, {'@': 87}),
+                                        33: (1, {'@': 87}),
+                                        34: (1, {'@': 87}),
+                                        35: (1, {'@': 87})},
+                                  145: {0: (0, 114),
+                                        1: (1, {'@': 104}),
+                                        2: (1, {'@': 104}),
+                                        7: (1, {'@': 104}),
+                                        8: (1, {'@': 104}),
+                                        9: (1, {'@': 104}),
+                                        10: (1, {'@': 104}),
+                                        12: (1, {'@': 104}),
+                                        13: (1, {'@': 104}),
+                                        14: (1, {'@': 104}),
+                                        20: (1, {'@': 104}),
+                                        22: (1, {'@': 104}),
+                                        25: (1, {'@': 104}),
+                                        26: (1, {'@': 104}),
+                                        27: (1, {'@': 104}),
+                                        28: (1, {'@': 104}),
+                                        29: (1, {'@': 104}),
+                                        30: (1, {'@': 104}),
+                                        31: (1, {'@': 104}),
+                                        32: (1, {'@': 104}),
+                                        33: (1, {'@': 104}),
+                                        34: (1, {'@': 104}),
+                                        35: (1, {'@': 104})},
+                                  146: {0: (1, {'@': 47}),
+                                        5: (1, {'@': 47}),
+                                        6: (1, {'@': 47}),
+                                        7: (1, {'@': 47}),
+                                        8: (1, {'@': 47}),
+                                        9: (1, {'@': 47}),
+                                        10: (1, {'@': 47}),
+                                        11: (1, {'@': 47}),
+                                        12: (1, {'@': 47}),
+                                        13: (1, {'@': 47}),
+                                        14: (1, {'@': 47}),
+                                        15: (1, {'@': 47}),
+                                        16: (0, 120),
+                                        51: (0, 83),
+                                        52: (0, 162),
+                                        53: (0, 136)},
+                                  147: {0: (1, {'@': 106}),
+                                        1: (1, {'@': 106}),
+                                        2: (1, {'@': 106}),
+                                        7: (1, {'@': 106}),
+                                        8: (1, {'@': 106}),
+                                        9: (1, {'@': 106}),
+                                        10: (1, {'@': 106}),
+                                        12: (1, {'@': 106}),
+                                        13: (1, {'@': 106}),
+                                        14: (1, {'@': 106}),
+                                        20: (1, {'@': 106}),
+                                        22: (1, {'@': 106}),
+                                        25: (1, {'@': 106}),
+                                        26: (1, {'@': 106}),
+                                        27: (1, {'@': 106}),
+                                        28: (1, {'@': 106}),
+                                        29: (1, {'@': 106}),
+                                        30: (1, {'@': 106}),
+                                        31: (1, {'@': 106}),
+                                        32: (1, {'@': 106}),
+                                        33: (1, {'@': 106}),
+                                        34: (1, {'@': 106}),
+                                        35: (1, {'@': 106})},
+                                  148: {5: (0, 88)},
+                                  149: {0: (0, 107),
+                                        5: (1, {'@': 53}),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        40: (0, 159),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 150),
+                                        45: (0, 121),
+                                        46: (0, 110),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  150: {0: (1, {'@': 114}),
+                                        5: (1, {'@': 114}),
+                                        6: (1, {'@': 114}),
+                                        7: (1, {'@': 114}),
+                                        8: (1, {'@': 114}),
+                                        9: (1, {'@': 114}),
+                                        10: (1, {'@': 114}),
+                                        11: (1, {'@': 114}),
+                                        12: (1, {'@': 114}),
+                                        13: (1, {'@': 114}),
+                                        14: (1, {'@': 114}),
+                                        15: (1, {'@': 114}),
+                                        17: (1, {'@': 114})},
+                                  151: {0: (0, 107),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        17: (1, {'@': 53}),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        40: (0, 159),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 150),
+                                        45: (0, 121),
+                                        46: (0, 43),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  152: {8: (1, {'@': 117}),
+                                        20: (1, {'@': 117}),
+                                        22: (1, {'@': 117})},
+                                  153: {0: (0, 107),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        19: (0, 145),
+                                        20: (0, 144),
+                                        22: (0, 79),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 138),
+                                        41: (0, 38),
+                                        48: (0, 89),
+                                        57: (0, 33)},
+                                  154: {0: (1, {'@': 68}),
+                                        5: (1, {'@': 68}),
+                                        6: (1, {'@': 68}),
+                                        7: (1, {'@': 68}),
+                                        8: (1, {'@': 68}),
+                                        9: (1, {'@': 68}),
+                                        10: (1, {'@': 68}),
+                                        11: (1, {'@': 68}),
+                                        12: (1, {'@': 68}),
+                                        13: (1, {'@': 68}),
+                                        14: (1, {'@': 68}),
+                                        15: (1, {'@': 68}),
+                                        17: (1, {'@': 68}),
+                                        54: (0, 158),
+                                        55: (0, 78),
+                                        61: (0, 76),
+                                        67: (0, 91)},
+                                  155: {0: (0, 107),
+                                        5: (1, {'@': 53}),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        40: (0, 159),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 150),
+                                        45: (0, 121),
+                                        46: (0, 140),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  156: {5: (0, 116)},
+                                  157: {0: (0, 143)},
+                                  158: {29: (0, 149)},
+                                  159: {0: (0, 107),
+                                        5: (1, {'@': 52}),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        17: (1, {'@': 52}),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 67),
+                                        45: (0, 121),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  160: {0: (1, {'@': 104}),
+                                        1: (1, {'@': 104}),
+                                        2: (1, {'@': 104}),
+                                        7: (1, {'@': 104}),
+                                        8: (1, {'@': 104}),
+                                        9: (1, {'@': 104}),
+                                        10: (1, {'@': 104}),
+                                        12: (1, {'@': 104}),
+                                        13: (1, {'@': 104}),
+                                        14: (1, {'@': 104}),
+                                        20: (1, {'@': 104}),
+                                        22: (1, {'@': 104}),
+                                        25: (1, {'@': 104}),
+                                        26: (1, {'@': 104}),
+                                        27: (1, {'@': 104}),
+                                        28: (1, {'@': 104}),
+                                        29: (1, {'@': 104}),
+                                        30: (1, {'@': 104}),
+                                        31: (1, {'@': 104}),
+                                        32: (1, {'@': 104}),
+                                        33: (1, {'@': 104}),
+                                        34: (1, {'@': 104}),
+                                        35: (1, {'@': 104})},
+                                  161: {28: (0, 137), 29: (0, 99), 30: (0, 73)},
+                                  162: {0: (1, {'@': 46}),
+                                        5: (1, {'@': 46}),
+                                        6: (1, {'@': 46}),
+                                        7: (1, {'@': 46}),
+                                        8: (1, {'@': 46}),
+                                        9: (1, {'@': 46}),
+                                        10: (1, {'@': 46}),
+                                        11: (1, {'@': 46}),
+                                        12: (1, {'@': 46}),
+                                        13: (1, {'@': 46}),
+                                        14: (1, {'@': 46}),
+                                        15: (1, {'@': 46}),
+                                        16: (0, 120),
+                                        17: (1, {'@': 46}),
+                                        53: (0, 172)},
+                                  163: {8: (0, 141), 19: (0, 0)},
+                                  164: {0: (1, {'@': 51}),
+                                        5: (1, {'@': 51}),
+                                        6: (1, {'@': 51}),
+                                        7: (1, {'@': 51}),
+                                        8: (1, {'@': 51}),
+                                        9: (1, {'@': 51}),
+                                        10: (1, {'@': 51}),
+                                        11: (1, {'@': 51}),
+                                        12: (1, {'@': 51}),
+                                        13: (1, {'@': 51}),
+                                        14: (1, {'@': 51}),
+                                        15: (1, {'@': 51}),
+                                        16: (1, {'@': 51}),
+                                        17: (1, {'@': 51})},
+                                  165: {8: (1, {'@': 111}),
+                                        20: (1, {'@': 111}),
+                                        22: (1, {'@': 111})},
+                                  166: {29: (0, 171)},
+                                  167: {5: (0, 19)},
+                                  168: {0: (1, {'@': 48}),
+                                        5: (1, {'@': 48}),
+                                        6: (1, {'@': 48}),
+                                        7: (1, {'@': 48}),
+                                        8: (1, {'@': 48}),
+                                        9: (1, {'@': 48}),
+                                        10: (1, {'@': 48}),
+                                        11: (1, {'@': 48}),
+                                        12: (1, {'@': 48}),
+                                        13: (1, {'@': 48}),
+                                        14: (1, {'@': 48}),
+                                        15: (1, {'@': 48}),
+                                        16: (1, {'@': 48}),
+                                        17: (1, {'@': 48})},
+                                  169: {0: (1, {'@': 40}),
+                                        6: (1, {'@': 40}),
+                                        7: (1, {'@': 40}),
+                                        8: (1, {'@': 40}),
+                                        9: (1, {'@': 40}),
+                                        10: (1, {'@': 40}),
+                                        11: (1, {'@': 40}),
+                                        12: (1, {'@': 40}),
+                                        13: (1, {'@': 40}),
+                                        14: (1, {'@': 40}),
+                                        15: (1, {'@': 40}),
+                                        16: (1, {'@': 40}),
+                                        17: (1, {'@': 40}),
+                                        24: (0, 60),
+                                        66: (0, 128)},
+                                  170: {8: (1, {'@': 110}),
+                                        20: (1, {'@': 110}),
+                                        22: (1, {'@': 110})},
+                                  171: {0: (0, 107),
+                                        5: (1, {'@': 53}),
+                                        6: (0, 65),
+                                        7: (0, 147),
+                                        8: (0, 141),
+                                        9: (0, 54),
+                                        10: (0, 100),
+                                        11: (0, 105),
+                                        12: (0, 25),
+                                        13: (0, 122),
+                                        14: (0, 7),
+                                        15: (0, 92),
+                                        19: (0, 37),
+                                        36: (0, 98),
+                                        37: (0, 86),
+                                        38: (0, 8),
+                                        39: (0, 45),
+                                        40: (0, 159),
+                                        41: (0, 38),
+                                        42: (0, 32),
+                                        43: (0, 69),
+                                        44: (0, 150),
+                                        45: (0, 121),
+                                        46: (0, 47),
+                                        47: (0, 111),
+                                        48: (0, 89)},
+                                  172: {0: (1, {'@': 113}),
+                                        5: (1, {'@': 113}),
+                                        6: (1, {'@': 113}),
+                                        7: (1, {'@': 113}),
+                                        8: (1, {'@': 113}),
+                                        9: (1, {'@': 113}),
+                                        10: (1, {'@': 113}),
+                                        11: (1, {'@': 113}),
+                                        12: (1, {'@': 113}),
+                                        13: (1, {'@': 113}),
+                                        14: (1, {'@': 113}),
+                                        15: (1, {'@': 113}),
+                                        16: (1, {'@': 113}),
+                                        17: (1, {'@': 113})},
+                                  173: {0: (0, 26)},
+                                  174: {29: (0, 129), 49: (0, 63)},
+                                  175: {0: (1, {'@': 47}),
+                                        6: (1, {'@': 47}),
+                                        7: (1, {'@': 47}),
+                                        8: (1, {'@': 47}),
+                                        9: (1, {'@': 47}),
+                                        10: (1, {'@': 47}),
+                                        11: (1, {'@': 47}),
+                                        12: (1, {'@': 47}),
+                                        13: (1, {'@': 47}),
+                                        14: (1, {'@': 47}),
+                                        15: (1, {'@': 47}),
+                                        16: (0, 120),
+                                        17: (1, {'@': 47}),
+                                        51: (0, 151),
+                                        52: (0, 162),
+                                        53: (0, 136)}},
+                       'tokens': {0: 'LPAR',
+                                  1: 'SEMICOLON',
+                                  2: 'DOT',
+                                  3: 'EQUAL',
+                                  4: 'COLON',
+                                  5: 'RBRACE',
+                                  6: 'WHILE',
+                                  7: 'TRUE',
+                                  8: '__ANON_3',
+                                  9: 'MINUS',
+                                  10: 'NONE',
+                                  11: 'RETURN',
+                                  12: 'ESCAPED_STRING',
+                                  13: 'NUMBER',
+                                  14: 'FALSE',
+                                  15: 'IF',
+                                  16: 'DEF',
+                                  17: '$END',
+                                  18: '__formals_star_4',
+                                  19: 'ident',
+                                  20: 'RPAR',
+                                  21: 'formals',
+                                  22: 'COMMA',
+                                  23: 'formal',
+                                  24: 'CLASS',
+                                  25: 'STAR',
+                                  26: 'SLASH',
+                                  27: 'PLUS',
+                                  28: 'OR',
+                                  29: 'LBRACE',
+                                  30: 'AND',
+                                  31: '__ANON_1',
+                                  32: 'LESSTHAN',
+                                  33: '__ANON_0',
+                                  34: 'MORETHAN',
+                                  35: '__ANON_2',
+                                  36: 'if_stmt',
+                                  37: 'bool',
+                                  38: 'calc',
+                                  39: 'r_exp',
+                                  40: '__stmt_block_star_3',
+                                  41: 'product',
+                                  42: 'assignment',
+                                  43: 'l_exp',
+                                  44: 'statement',
+                                  45: 'while_stmt',
+                                  46: 'stmt_block',
+                                  47: 'returns',
+                                  48: 'atom',
+                                  49: 'EXTENDS',
+                                  50: '__clazz_star_1',
+                                  51: 'methods',
+                                  52: '__methods_star_2',
+                                  53: 'method',
+                                  54: 'ELSE',
+                                  55: 'ELIF',
+                                  56: '__r_exp_star_6',
+                                  57: 'args',
+                                  58: 'NOT',
+                                  59: 'logic_exp',
+                                  60: 'condition',
+                                  61: 'otherwise',
+                                  62: 'start',
+                                  63: 'program',
+                                  64: '__classes_star_0',
+                                  65: 'classes',
+                                  66: 'clazz',
+                                  67: '__if_stmt_star_5'}},
+            'parser_conf': {'__type__': 'ParserConf',
+                            'parser_type': 'lalr',
+                            'rules': [{'@': 38},
+                                      {'@': 39},
+                                      {'@': 40},
+                                      {'@': 41},
+                                      {'@': 42},
+                                      {'@': 43},
+                                      {'@': 44},
+                                      {'@': 45},
+                                      {'@': 46},
+                                      {'@': 47},
+                                      {'@': 48},
+                                      {'@': 49},
+                                      {'@': 50},
+                                      {'@': 51},
+                                      {'@': 52},
+                                      {'@': 53},
+                                      {'@': 54},
+                                      {'@': 55},
+                                      {'@': 56},
+                                      {'@': 57},
+                                      {'@': 58},
+                                      {'@': 59},
+                                      {'@': 60},
+                                      {'@': 61},
+                                      {'@': 62},
+                                      {'@': 63},
+                                      {'@': 64},
+                                      {'@': 65},
+                                      {'@': 66},
+                                      {'@': 67},
+                                      {'@': 68},
+                                      {'@': 69},
+                                      {'@': 70},
+                                      {'@': 71},
+                                      {'@': 72},
+                                      {'@': 73},
+                                      {'@': 74},
+                                      {'@': 75},
+                                      {'@': 76},
+                                      {'@': 77},
+                                      {'@': 78},
+                                      {'@': 79},
+                                      {'@': 80},
+                                      {'@': 81},
+                                      {'@': 82},
+                                      {'@': 83},
+                                      {'@': 84},
+                                      {'@': 85},
+                                      {'@': 86},
+                                      {'@': 87},
+                                      {'@': 88},
+                                      {'@': 89},
+                                      {'@': 90},
+                                      {'@': 91},
+                                      {'@': 92},
+                                      {'@': 93},
+                                      {'@': 94},
+                                      {'@': 95},
+                                      {'@': 96},
+                                      {'@': 97},
+                                      {'@': 98},
+                                      {'@': 99},
+                                      {'@': 100},
+                                      {'@': 101},
+                                      {'@': 102},
+                                      {'@': 103},
+                                      {'@': 104},
+                                      {'@': 105},
+                                      {'@': 106},
+                                      {'@': 107},
+                                      {'@': 108},
+                                      {'@': 109},
+                                      {'@': 110},
+                                      {'@': 111},
+                                      {'@': 112},
+                                      {'@': 113},
+                                      {'@': 114},
+                                      {'@': 115},
+                                      {'@': 116},
+                                      {'@': 117},
+                                      {'@': 118},
+                                      {'@': 119},
+                                      {'@': 120},
+                                      {'@': 121}],
+                            'start': ['start']}},
+ 'rules': [{'@': 38},
+           {'@': 39},
+           {'@': 40},
+           {'@': 41},
+           {'@': 42},
+           {'@': 43},
+           {'@': 44},
+           {'@': 45},
+           {'@': 46},
+           {'@': 47},
+           {'@': 48},
+           {'@': 49},
+           {'@': 50},
+           {'@': 51},
+           {'@': 52},
+           {'@': 53},
+           {'@': 54},
+           {'@': 55},
+           {'@': 56},
+           {'@': 57},
+           {'@': 58},
+           {'@': 59},
+           {'@': 60},
+           {'@': 61},
+           {'@': 62},
+           {'@': 63},
+           {'@': 64},
+           {'@': 65},
+           {'@': 66},
+           {'@': 67},
+           {'@': 68},
+           {'@': 69},
+           {'@': 70},
+           {'@': 71},
+           {'@': 72},
+           {'@': 73},
+           {'@': 74},
+           {'@': 75},
+           {'@': 76},
+           {'@': 77},
+           {'@': 78},
+           {'@': 79},
+           {'@': 80},
+           {'@': 81},
+           {'@': 82},
+           {'@': 83},
+           {'@': 84},
+           {'@': 85},
+           {'@': 86},
+           {'@': 87},
+           {'@': 88},
+           {'@': 89},
+           {'@': 90},
+           {'@': 91},
+           {'@': 92},
+           {'@': 93},
+           {'@': 94},
+           {'@': 95},
+           {'@': 96},
+           {'@': 97},
+           {'@': 98},
+           {'@': 99},
+           {'@': 100},
+           {'@': 101},
+           {'@': 102},
+           {'@': 103},
+           {'@': 104},
+           {'@': 105},
+           {'@': 106},
+           {'@': 107},
+           {'@': 108},
+           {'@': 109},
+           {'@': 110},
+           {'@': 111},
+           {'@': 112},
+           {'@': 113},
+           {'@': 114},
+           {'@': 115},
+           {'@': 116},
+           {'@': 117},
+           {'@': 118},
+           {'@': 119},
+           {'@': 120},
+           {'@': 121}]}
+
+MEMO = {0: {'__type__': 'TerminalDef',
+     'name': 'NUMBER',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)'},
+     'priority': 0},
+ 1: {'__type__': 'TerminalDef',
+     'name': 'ESCAPED_STRING',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [2, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '".*?(?<!\\\\)(\\\\\\\\)*?"'},
+     'priority': 0},
+ 2: {'__type__': 'TerminalDef',
+     'name': 'WS',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [1, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '(?:[ \t\x0c\r\n])+'},
+     'priority': 0},
+ 3: {'__type__': 'TerminalDef',
+     'name': 'CPP_COMMENT',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [2, 18446744073709551616],
+                 'flags': [],
+                 'raw': '/\\/\\/[^\\n]*/',
+                 'value': '\\/\\/[^\n]*'},
+     'priority': 0},
+ 4: {'__type__': 'TerminalDef',
+     'name': 'C_COMMENT',
+     'pattern': {'__type__': 'PatternRE',
+                 '_width': [4, 18446744073709551616],
+                 'flags': [],
+                 'raw': None,
+                 'value': '/\\*(.|\n)*?\\*/'},
+     'priority': 0},
+ 5: {'__type__': 'TerminalDef',
+     'name': 'EXTENDS',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"extends"', 'value': 'extends'},
+     'priority': 0},
+ 6: {'__type__': 'TerminalDef',
+     'name': 'CLASS',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"class"', 'value': 'class'},
+     'priority': 0},
+ 7: {'__type__': 'TerminalDef',
+     'name': 'LPAR',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"("', 'value': '('},
+     'priority': 0},
+ 8: {'__type__': 'TerminalDef',
+     'name': 'RPAR',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '")"', 'value': ')'},
+     'priority': 0},
+ 9: {'__type__': 'TerminalDef',
+     'name': 'LBRACE',
+     'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"{"', 'value': '{'},
+     'priority': 0},
+ 10: {'__type__': 'TerminalDef',
+      'name': 'RBRACE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"}"', 'value': '}'},
+      'priority': 0},
+ 11: {'__type__': 'TerminalDef',
+      'name': 'COLON',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '":"', 'value': ':'},
+      'priority': 0},
+ 12: {'__type__': 'TerminalDef',
+      'name': 'DEF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"def"', 'value': 'def'},
+      'priority': 0},
+ 13: {'__type__': 'TerminalDef',
+      'name': 'COMMA',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '","', 'value': ','},
+      'priority': 0},
+ 14: {'__type__': 'TerminalDef',
+      'name': 'SEMICOLON',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '";"', 'value': ';'},
+      'priority': 0},
+ 15: {'__type__': 'TerminalDef',
+      'name': 'RETURN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"return"', 'value': 'return'},
+      'priority': 0},
+ 16: {'__type__': 'TerminalDef',
+      'name': 'EQUAL',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"="', 'value': '='},
+      'priority': 0},
+ 17: {'__type__': 'TerminalDef',
+      'name': 'IF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"if"', 'value': 'if'},
+      'priority': 0},
+ 18: {'__type__': 'TerminalDef',
+      'name': 'ELIF',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"elif"', 'value': 'elif'},
+      'priority': 0},
+ 19: {'__type__': 'TerminalDef',
+      'name': 'ELSE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"else"', 'value': 'else'},
+      'priority': 0},
+ 20: {'__type__': 'TerminalDef',
+      'name': 'WHILE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"while"', 'value': 'while'},
+      'priority': 0},
+ 21: {'__type__': 'TerminalDef',
+      'name': 'AND',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"and"', 'value': 'and'},
+      'priority': 0},
+ 22: {'__type__': 'TerminalDef',
+      'name': 'OR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"or"', 'value': 'or'},
+      'priority': 0},
+ 23: {'__type__': 'TerminalDef',
+      'name': 'NOT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"not"', 'value': 'not'},
+      'priority': 0},
+ 24: {'__type__': 'TerminalDef',
+      'name': 'LESSTHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"<"', 'value': '<'},
+      'priority': 0},
+ 25: {'__type__': 'TerminalDef',
+      'name': 'MORETHAN',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '">"', 'value': '>'},
+      'priority': 0},
+ 26: {'__type__': 'TerminalDef',
+      'name': '__ANON_0',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"<="', 'value': '<='},
+      'priority': 0},
+ 27: {'__type__': 'TerminalDef',
+      'name': '__ANON_1',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '">="', 'value': '>='},
+      'priority': 0},
+ 28: {'__type__': 'TerminalDef',
+      'name': '__ANON_2',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"=="', 'value': '=='},
+      'priority': 0},
+ 29: {'__type__': 'TerminalDef',
+      'name': 'DOT',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"."', 'value': '.'},
+      'priority': 0},
+ 30: {'__type__': 'TerminalDef',
+      'name': 'PLUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"+"', 'value': '+'},
+      'priority': 0},
+ 31: {'__type__': 'TerminalDef',
+      'name': 'MINUS',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"-"', 'value': '-'},
+      'priority': 0},
+ 32: {'__type__': 'TerminalDef',
+      'name': 'STAR',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"*"', 'value': '*'},
+      'priority': 0},
+ 33: {'__type__': 'TerminalDef',
+      'name': 'SLASH',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"/"', 'value': '/'},
+      'priority': 0},
+ 34: {'__type__': 'TerminalDef',
+      'name': 'NONE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"none"', 'value': 'none'},
+      'priority': 0},
+ 35: {'__type__': 'TerminalDef',
+      'name': '__ANON_3',
+      'pattern': {'__type__': 'PatternRE',
+                  '_width': [1, 18446744073709551616],
+                  'flags': [],
+                  'raw': '/[_a-zA-Z][_a-zA-Z0-9]*/',
+                  'value': '[_a-zA-Z][_a-zA-Z0-9]*'},
+      'priority': 0},
+ 36: {'__type__': 'TerminalDef',
+      'name': 'TRUE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"true"', 'value': 'true'},
+      'priority': 0},
+ 37: {'__type__': 'TerminalDef',
+      'name': 'FALSE',
+      'pattern': {'__type__': 'PatternStr', 'flags': [], 'raw': '"false"', 'value': 'false'},
+      'priority': 0},
+ 38: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'program'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'start'}},
+ 39: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'classes'},
+                    {'__type__': 'NonTerminal', 'name': 'methods'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'program'}},
+ 40: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__classes_star_0'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'classes'}},
+ 41: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'classes'}},
+ 42: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'CLASS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__clazz_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EXTENDS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'methods'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'clazz'}},
+ 43: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'CLASS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__clazz_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'methods'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False,
+                                    False,
+                                    False,
+                                    False,
+                                    False,
+                                    True,
+                                    False,
+                                    False,
+                                    False,
+                                    False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'clazz'}},
+ 44: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'CLASS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EXTENDS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'methods'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'clazz'}},
+ 45: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'CLASS'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'methods'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, False, False, False, True, False, False, False, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'clazz'}},
+ 46: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__methods_star_2'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'methods'}},
+ 47: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'methods'}},
+ 48: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DEF'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__clazz_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'method'}},
+ 49: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DEF'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__clazz_star_1'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, False, False, False, False, True, False, False, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'method'}},
+ 50: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DEF'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'method'}},
+ 51: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'DEF'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, False, False, False, True, False, False, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'method'}},
+ 52: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__stmt_block_star_3'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt_block'}},
+ 53: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'stmt_block'}},
+ 54: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': '__formals_star_4'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'formals'}},
+ 55: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'formals'}},
+ 56: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'formal'}},
+ 57: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'formal'}},
+ 58: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'statement'}},
+ 59: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'assignment'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'statement'}},
+ 60: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'returns'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SEMICOLON'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'statement'}},
+ 61: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'if_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'statement'}},
+ 62: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'while_stmt'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'statement'}},
+ 63: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'RETURN'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'returns'}},
+ 64: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'RETURN'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, True),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'returns'}},
+ 65: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'l_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'COLON'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assignment'}},
+ 66: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'l_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'EQUAL'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (False, True, False, False),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'assignment'}},
+ 67: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IF'},
+                    {'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'},
+                    {'__type__': 'NonTerminal', 'name': '__if_stmt_star_5'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'if_stmt'}},
+ 68: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'IF'},
+                    {'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'if_stmt'}},
+ 69: {'__type__': 'Rule',
+      'alias': 'if_stmt',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'ELIF'},
+                    {'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'},
+                    {'__type__': 'NonTerminal', 'name': '__if_stmt_star_5'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'otherwise'}},
+ 70: {'__type__': 'Rule',
+      'alias': 'if_stmt',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'ELIF'},
+                    {'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'otherwise'}},
+ 71: {'__type__': 'Rule',
+      'alias': 'else_stmt',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'ELSE'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'otherwise'}},
+ 72: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'WHILE'},
+                    {'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LBRACE'},
+                    {'__type__': 'NonTerminal', 'name': 'stmt_block'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RBRACE'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'while_stmt'}},
+ 73: {'__type__': 'Rule',
+      'alias': 'bool_and',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'AND'},
+                    {'__type__': 'NonTerminal', 'name': 'logic_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'condition'}},
+ 74: {'__type__': 'Rule',
+      'alias': 'bool_or',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'condition'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'OR'},
+                    {'__type__': 'NonTerminal', 'name': 'logic_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'condition'}},
+ 75: {'__type__': 'Rule',
+      'alias': 'nots',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'NOT'},
+                    {'__type__': 'NonTerminal', 'name': 'logic_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'condition'}},
+ 76: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'logic_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'condition'}},
+ 77: {'__type__': 'Rule',
+      'alias': 'less_than',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LESSTHAN'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'logic_exp'}},
+ 78: {'__type__': 'Rule',
+      'alias': 'greater_than',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'MORETHAN'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'logic_exp'}},
+ 79: {'__type__': 'Rule',
+      'alias': 'less_equal',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_0'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'logic_exp'}},
+ 80: {'__type__': 'Rule',
+      'alias': 'greater_equal',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_1'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'logic_exp'}},
+ 81: {'__type__': 'Rule',
+      'alias': 'equals',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': '__ANON_2'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'logic_exp'}},
+ 82: {'__type__': 'Rule',
+      'alias': 'store',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ident'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'l_exp'}},
+ 83: {'__type__': 'Rule',
+      'alias': 'store_field',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'l_exp'}},
+ 84: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'calc'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 85: {'__type__': 'Rule',
+      'alias': 'new',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__r_exp_star_6'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 86: {'__type__': 'Rule',
+      'alias': 'new',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 87: {'__type__': 'Rule',
+      'alias': 'method_call',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'NonTerminal', 'name': '__r_exp_star_6'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 3,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 88: {'__type__': 'Rule',
+      'alias': 'method_call',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 4,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 89: {'__type__': 'Rule',
+      'alias': 'load_field',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'DOT'},
+                    {'__type__': 'NonTerminal', 'name': 'ident'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 5,
+      'origin': {'__type__': 'NonTerminal', 'name': 'r_exp'}},
+ 90: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'args'}},
+ 91: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'COMMA'},
+                    {'__type__': 'NonTerminal', 'name': 'r_exp'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': False,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'args'}},
+ 92: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'product'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'calc'}},
+ 93: {'__type__': 'Rule',
+      'alias': 'plus',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'calc'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'PLUS'},
+                    {'__type__': 'NonTerminal', 'name': 'product'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'calc'}},
+ 94: {'__type__': 'Rule',
+      'alias': 'sub',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'calc'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                    {'__type__': 'NonTerminal', 'name': 'product'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'calc'}},
+ 95: {'__type__': 'Rule',
+      'alias': None,
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'atom'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'product'}},
+ 96: {'__type__': 'Rule',
+      'alias': 'mult',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'product'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'STAR'},
+                    {'__type__': 'NonTerminal', 'name': 'atom'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'product'}},
+ 97: {'__type__': 'Rule',
+      'alias': 'div',
+      'expansion': [{'__type__': 'NonTerminal', 'name': 'product'},
+                    {'__type__': 'Terminal', 'filter_out': True, 'name': 'SLASH'},
+                    {'__type__': 'NonTerminal', 'name': 'atom'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 2,
+      'origin': {'__type__': 'NonTerminal', 'name': 'product'}},
+ 98: {'__type__': 'Rule',
+      'alias': 'const',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'NUMBER'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 0,
+      'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 99: {'__type__': 'Rule',
+      'alias': 'neg',
+      'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'MINUS'},
+                    {'__type__': 'NonTerminal', 'name': 'atom'}],
+      'options': {'__type__': 'RuleOptions',
+                  'empty_indices': (),
+                  'expand1': True,
+                  'keep_all_tokens': False,
+                  'priority': None,
+                  'template_source': None},
+      'order': 1,
+      'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 100: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'LPAR'},
+                     {'__type__': 'NonTerminal', 'name': 'calc'},
+                     {'__type__': 'Terminal', 'filter_out': True, 'name': 'RPAR'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 2,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 101: {'__type__': 'Rule',
+       'alias': 'lit_not',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'NONE'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 3,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 102: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'bool'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 4,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 103: {'__type__': 'Rule',
+       'alias': 'strconst',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': 'ESCAPED_STRING'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 5,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 104: {'__type__': 'Rule',
+       'alias': 'load',
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'ident'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 6,
+       'origin': {'__type__': 'NonTerminal', 'name': 'atom'}},
+ 105: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'Terminal', 'filter_out': False, 'name': '__ANON_3'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'ident'}},
+ 106: {'__type__': 'Rule',
+       'alias': 'lit_true',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'TRUE'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': 'bool'}},
+ 107: {'__type__': 'Rule',
+       'alias': 'lit_false',
+       'expansion': [{'__type__': 'Terminal', 'filter_out': True, 'name': 'FALSE'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': True,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': 'bool'}},
+ 108: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'clazz'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__classes_star_0'}},
+ 109: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__classes_star_0'},
+                     {'__type__': 'NonTerminal', 'name': 'clazz'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__classes_star_0'}},
+ 110: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'formals'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__clazz_star_1'}},
+ 111: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__clazz_star_1'},
+                     {'__type__': 'NonTerminal', 'name': 'formals'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__clazz_star_1'}},
+ 112: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'method'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__methods_star_2'}},
+ 113: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__methods_star_2'},
+                     {'__type__': 'NonTerminal', 'name': 'method'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__methods_star_2'}},
+ 114: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'statement'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__stmt_block_star_3'}},
+ 115: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__stmt_block_star_3'},
+                     {'__type__': 'NonTerminal', 'name': 'statement'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__stmt_block_star_3'}},
+ 116: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'formal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__formals_star_4'}},
+ 117: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__formals_star_4'},
+                     {'__type__': 'NonTerminal', 'name': 'formal'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__formals_star_4'}},
+ 118: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'otherwise'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__if_stmt_star_5'}},
+ 119: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__if_stmt_star_5'},
+                     {'__type__': 'NonTerminal', 'name': 'otherwise'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__if_stmt_star_5'}},
+ 120: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': 'args'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 0,
+       'origin': {'__type__': 'NonTerminal', 'name': '__r_exp_star_6'}},
+ 121: {'__type__': 'Rule',
+       'alias': None,
+       'expansion': [{'__type__': 'NonTerminal', 'name': '__r_exp_star_6'},
+                     {'__type__': 'NonTerminal', 'name': 'args'}],
+       'options': {'__type__': 'RuleOptions',
+                   'empty_indices': (),
+                   'expand1': False,
+                   'keep_all_tokens': False,
+                   'priority': None,
+                   'template_source': None},
+       'order': 1,
+       'origin': {'__type__': 'NonTerminal', 'name': '__r_exp_star_6'}}}
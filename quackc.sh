@@ -1,4 +1,4 @@
 #!/bin/zsh
 
-python3 new_translator.py $1 > ./tests/src/Main.asm
-python3 assemble.py ./tests/src/Main.asm ./tests/OBJ/Main.json
+# quackd (started on first use) translates and assembles
+python3 quack_client.py build $1 ./tests/OBJ/Main.tvm --asm ./tests/src/Main.asm
@@ -0,0 +1,332 @@
+"""Resident compile server for the Quack toolchain.
+
+Translating and assembling a small program takes a fraction of the
+time Python needs to start, import lark, build the LALR parser for
+the Quack grammar and read the library metadata.  quackd does that
+warm-up once and then serves requests, each a JSON object on one
+line, on a Unix socket (or on stdin, answering on stdout).  It runs
+requests concurrently; every reply carries the "id" of its request,
+since replies on stdout may come back in a different order.
+
+Requests ("source", "asm", and "target" are file names; a
+translate or assemble request may give "text" instead of "source"):
+    {"op": "translate", "source": F, ["asm": F]}
+        -> {"asm": assembly code}, unless written to "asm"
+    {"op": "assemble", "source": F, ["target": F], ["optimize": true],
+     ["fuse": true], ["map": true], ["verify": bool]}
+        -> {"object": JSON object code}, unless written to "target"
+           (in the format its suffix calls for, with its source map
+           beside it if asked).  Source of several classes puts each
+           in Class.tvm (or .json) beside "target", -> {"objects": [F...]}
+    {"op": "build", "source": F, "target": F, ["asm": F], ...}
+        translate, then assemble
+    {"op": "ping"}, {"op": "shutdown"}
+Every reply has "ok" (false if anything was logged as an error or
+the request failed) and "diagnostics", the warnings and errors
+logged while serving it.
+
+quack_client.py starts quackd when nobody is listening on its socket.
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+# assemble first:  it points logging at stderr, while the translator
+# would point it at stdout, which may be where we answer.
+import assemble         # noqa: E402
+import new_translator   # noqa: E402
+from asm_cache import AssemblyCache     # noqa: E402
+from quack_client import default_socket     # noqa: E402
+
+import logging  # noqa: E402
+log = logging.getLogger(__name__)
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(
+        description="Serve Quack translate and assemble requests")
+    parser.add_argument("--socket", type=Path, default=None,
+                        help=f"Unix socket to listen on (default {default_socket()})")
+    parser.add_argument("--stdio", action="store_true",
+                        help="Read requests from stdin and answer on stdout")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Requests served at once on stdin "
+                             "(default: number of CPUs)")
+    parser.add_argument("--idle", type=float, default=0,
+                        help="Exit after this many seconds without "
+                             "a request (default: never)")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="Do not use the cache of assembled classes")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Log everything the translator and "
+                             "assembler log to stderr")
+    return parser.parse_args()
+
+
+class Diagnostics(logging.Handler):
+    """Collects the warnings and errors logged by the thread
+    serving a request, to send back with the reply
+    """
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.local = threading.local()
+
+    def emit(self, record: logging.LogRecord):
+        records = getattr(self.local, "records", None)
+        if records is not None:
+            records.append({"level": record.levelname,
+                            "message": record.getMessage()})
+
+    def start(self) -> List[dict]:
+        self.local.records = []
+        return self.local.records
+
+    def stop(self):
+        self.local.records = None
+
+
+class CompileServer:
+    """What every request shares:  the parser, the library
+    metadata, and an Assembler for each set of options
+    """
+    def __init__(self, cache: bool = True):
+        self.config = assemble.Configuration(ROOT.joinpath("asm.conf"))
+        self.cache = AssemblyCache(self.config.asmcache) if cache else None
+        self.diagnostics = Diagnostics()
+        logging.getLogger().addHandler(self.diagnostics)
+        self.assemblers: Dict[Tuple[bool, bool, bool], assemble.Assembler] = {}
+        self.lock = threading.Lock()
+        # The translator keeps state in module globals
+        self.translator_lock = threading.Lock()
+        self.last_request = time.monotonic()
+        self.stopping = threading.Event()
+
+    def warm_up(self):
+        started = time.perf_counter()
+        new_translator.quack_parser()
+        new_translator.LIBRARY.symtab()
+        self.assembler(False, False, self.config.verify).library.classes
+        log.info(f"Ready in {time.perf_counter() - started:.3f} s")
+
+    def assembler(self, optimize: bool, fuse: bool,
+                  verify: bool) -> assemble.Assembler:
+        """An Assembler with these options, replaced when the
+        library has changed under it
+        """
+        with self.lock:
+            current = self.assemblers.get((optimize, fuse, verify))
+            if current is None or current.library.changed():
+                current = assemble.Assembler(self.config, cache=self.cache,
+                                             optimize=optimize, fuse=fuse,
+                                             verify=verify)
+                self.assemblers[(optimize, fuse, verify)] = current
+            return current
+
+    def handle(self, request: dict) -> dict:
+        """The reply to one request"""
+        self.last_request = time.monotonic()
+        reply = {"id": request.get("id")}
+        records = self.diagnostics.start()
+        try:
+            if "malformed" in request:
+                raise ValueError(f"Malformed request '{request['malformed']}'")
+            action = REQUESTS.get(request.get("op"))
+            if action is None:
+                raise ValueError(f"Unknown request '{request.get('op')}'")
+            reply.update(action(self, request))
+            reply["ok"] = not any(r["level"] in ["ERROR", "CRITICAL"]
+                                  for r in records)
+        except Exception as e:
+            records.append({"level": "ERROR",
+                            "message": f"{type(e).__name__}: {e}"})
+            reply["ok"] = False
+        finally:
+            self.diagnostics.stop()
+        reply["diagnostics"] = records
+        return reply
+
+    def translate(self, request: dict) -> dict:
+        text = _text(request)
+        with self.translator_lock:
+            asm = str(new_translator.translate(text)) + "\n"
+        if request.get("asm"):
+            Path(request["asm"]).write_text(asm)
+            return {"asm": request["asm"]}
+        return {"asm": asm}
+
+    def assemble(self, request: dict, lines: Optional[List[str]] = None) -> dict:
+        if lines is None:
+            lines = _text(request).splitlines(keepends=True)
+        assembler = self.assembler(bool(request.get("optimize")),
+                                   bool(request.get("fuse")),
+                                   bool(request.get("verify", self.config.verify)))
+        target = request.get("target")
+        if target is None:
+            return {"object": assembler.assemble_bytes(lines, False).decode("utf-8")}
+        binary = Path(target).suffix != ".json"
+        if len(assemble.class_sections(lines)) > 1:
+            # A whole program:  each class beside the target
+            objects = assembler.assemble_unit(
+                lambda: lines, Path(target).parent, binary,
+                mapped=bool(request.get("map")),
+                asm=request.get("asm") or request.get("source"))
+            return {"target": target, "objects": [str(path) for path in objects]}
+        if request.get("map"):
+            data, source_map = assembler.assemble_mapped(
+                lines, binary, asm=request.get("asm") or request.get("source"))
+            assemble.write_map(source_map, Path(target))
+        else:
+            data = assembler.assemble_bytes(lines, binary)
+        assemble.write_bytes(data, Path(target))
+        return {"target": target}
+
+    def build(self, request: dict) -> dict:
+        if not request.get("target"):
+            raise ValueError("build needs a target")
+        translated = self.translate(dict(request, asm=None))
+        asm = translated["asm"]
+        if request.get("asm"):
+            Path(request["asm"]).write_text(asm)
+        reply = self.assemble(request, asm.splitlines(keepends=True))
+        reply["asm"] = request.get("asm")
+        return reply
+
+    def ping(self, request: dict) -> dict:
+        return {"pid": os.getpid()}
+
+    def shutdown(self, request: dict) -> dict:
+        self.stopping.set()
+        return {}
+
+
+def _text(request: dict) -> str:
+    if "text" in request:
+        return request["text"]
+    with open(request["source"], "r") as f:
+        return f.read()
+
+
+# Request "op" -> what to do
+REQUESTS: Dict[str, Callable[[CompileServer, dict], dict]] = {
+    "translate": CompileServer.translate,
+    "assemble": CompileServer.assemble,
+    "build": CompileServer.build,
+    "ping": CompileServer.ping,
+    "shutdown": CompileServer.shutdown,
+}
+
+
+def _decode(line: str) -> dict:
+    try:
+        request = json.loads(line)
+        if isinstance(request, dict):
+            return request
+    except ValueError:
+        pass
+    return {"op": None, "malformed": line.strip()}
+
+
+# ----------------
+#  Transports:  A Unix socket, on which each connection may send
+#  any number of requests (answered in order), or stdin/stdout.
+#
+
+class _Connection(socketserver.StreamRequestHandler):
+    def handle(self):
+        compiler: CompileServer = self.server.compiler
+        for line in self.rfile:
+            reply = compiler.handle(_decode(line.decode("utf-8")))
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if compiler.stopping.is_set():
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+def _listening(path: Path) -> bool:
+    """Is another server answering on this socket?"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(path))
+            return True
+        except OSError:
+            return False
+
+
+def serve_socket(compiler: CompileServer, path: Path, idle: float):
+    if path.exists():
+        if _listening(path):
+            log.info(f"Already serving on {path}")
+            return
+        path.unlink()
+    server = socketserver.ThreadingUnixStreamServer(str(path), _Connection)
+    server.daemon_threads = True
+    server.compiler = compiler
+    if idle:
+        def watch():
+            while not compiler.stopping.wait(min(idle, 10)):
+                if time.monotonic() - compiler.last_request > idle:
+                    compiler.stopping.set()
+            server.shutdown()
+        threading.Thread(target=watch, daemon=True).start()
+    log.info(f"Serving on {path}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+
+def serve_stdio(compiler: CompileServer, jobs: Optional[int]):
+    out = sys.stdout
+    sys.stdout = sys.stderr     # Stray prints must not garble replies
+    write_lock = threading.Lock()
+
+    def answer(request: dict):
+        reply = compiler.handle(request)
+        with write_lock:
+            out.write(json.dumps(reply) + "\n")
+            out.flush()
+
+    with concurrent.futures.ThreadPoolExecutor(jobs) as pool:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            request = _decode(line)
+            if request.get("op") == "shutdown":
+                answer(request)
+                break
+            pool.submit(answer, request)
+
+
+def main():
+    args = cli()
+    if not args.verbose:
+        # Records below WARNING are neither diagnostics nor shown,
+        # so do not spend time creating them
+        assemble.log.setLevel(logging.WARNING)
+        new_translator.log.setLevel(logging.WARNING)
+    log.setLevel(logging.INFO)
+    compiler = CompileServer(args.cache)
+    compiler.warm_up()
+    if args.stdio:
+        serve_stdio(compiler, args.jobs)
+    else:
+        serve_socket(compiler, args.socket or default_socket(), args.idle)
+
+
+if __name__ == "__main__":
+    main()
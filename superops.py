@@ -0,0 +1,65 @@
+"""Superinstructions:  sequences of VM operations dispatched as one.
+
+superops.txt lists them, one per line, as
+    name,operation,operation[,...]   # comment
+where each operation is defined in opdefs.txt.  The generated
+bytecode table (build_bytecode_table.py) numbers them after the
+operations of opdefs.txt, in order, and gives each a handler that
+runs its parts in sequence, each fetching its own operand from the
+instruction stream, and lists them in opcodes.py for the assembler,
+which replaces matching instruction sequences with them (--fuse).
+
+tools/opcode_freq.py suggests sequences worth fusing.
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+# Operations that send control elsewhere.  The parts after one of
+# these would run in the wrong place, so it may only be the last
+# part of a superinstruction.
+CONTROL_OPS = {"halt", "call", "return", "jump", "jump_if", "jump_ifnot"}
+
+# Must match MAX_SUPEROP_PARTS in vm_code_table.h
+MAX_PARTS = 4
+
+
+def parse_superops(lines: Iterable[str],
+                   operations: Iterable[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+    """(name, parts) for each superinstruction, checked against
+    the names of the base operations.  Raises ValueError on a
+    definition the VM could not execute correctly.
+    """
+    operations = set(operations)
+    superops = []
+    names = set()
+    for line in lines:
+        line = line.split("#")[0].strip()
+        if not line:
+            continue
+        name, *parts = [part.strip() for part in line.split(",")]
+        if not 2 <= len(parts) <= MAX_PARTS:
+            raise ValueError(f"Superinstruction {name} must have "
+                             f"2 to {MAX_PARTS} parts")
+        if name in operations or name in names:
+            raise ValueError(f"Superinstruction {name} is already defined")
+        for part in parts:
+            if part not in operations:
+                raise ValueError(f"Superinstruction {name}: "
+                                 f"no operation '{part}'")
+        for part in parts[:-1]:
+            if part in CONTROL_OPS:
+                raise ValueError(f"Superinstruction {name}: "
+                                 f"'{part}' may only be the last part")
+        names.add(name)
+        superops.append((name, tuple(parts)))
+    return superops
+
+
+def read_superops(path: Path,
+                  operations: Iterable[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+    """Superinstructions defined in path; none if it does not exist"""
+    if not path.exists():
+        return []
+    with open(path, "r") as f:
+        return parse_superops(f, operations)
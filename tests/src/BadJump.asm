@@ -0,0 +1,11 @@
+# The verifier must reject this class (and the assembler reports
+# an error):  the jump lands past the last instruction of the method.
+.class BadJump:Obj
+
+.method $constructor
+    enter
+    const "falls off the end\n"
+    call String:print
+    pop
+    jump end
+end:
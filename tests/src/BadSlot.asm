@@ -0,0 +1,15 @@
+# The verifier must reject this class:  the only alloc for local
+# n is skipped, so n is not a local variable on the path that
+# stores it.
+.class BadSlot:Obj
+
+.method $constructor
+    enter
+    jump body
+.local n
+body:
+    const "stored\n"
+    store n
+    load n
+    call String:print
+    return 0
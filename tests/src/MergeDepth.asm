@@ -0,0 +1,16 @@
+# The verifier must reject this class:  where the two paths
+# from jump_if meet, one has left a value on the stack and the
+# other has not.
+.class MergeDepth:Obj
+
+.method $constructor
+    enter
+    const "before\n"
+    call String:print
+    const true
+    jump_if join   # Leaves the result of print on the stack
+    pop
+join:
+    const "after\n"
+    call String:print
+    return 0
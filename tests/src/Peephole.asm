@@ -0,0 +1,54 @@
+# Code that the peephole optimizer (-O) rewrites:  each part below
+# matches one of its rules, and the program must print the same
+# with or without -O (and --fuse).
+.class Peephole:Obj
+
+.method $constructor
+.local n
+    enter
+    const 1
+    store n
+    # push_pop:  values pushed only to be discarded
+    const 7
+    pop
+    load n
+    pop
+    # load_store:  storing what we just loaded
+    load n
+    store n
+    # jump_to_next:  jumps (conditional or not) to what follows anyway
+    jump next
+next:
+    const true
+    jump_if also_next
+also_next:
+    # branch_over_jump:  jump_if L; jump M; L:  is  jump_ifnot M
+    const 3
+    load n
+    call Int:less   # 1 < 3
+    jump_if taken
+    jump not_taken
+taken:
+    const "1 < 3\n"
+    call String:print
+    pop
+not_taken:
+    load n
+    const 3
+    call Int:less   # 3 < 1
+    jump_ifnot right
+    jump wrong
+right:
+    const "not 3 < 1\n"
+    call String:print
+    pop
+    load n
+    call Int:print
+    pop
+    const "\n"
+    call String:print
+    return 0
+wrong:
+    const "3 < 1\n"
+    call String:print
+    return 0
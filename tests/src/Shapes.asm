@@ -0,0 +1,66 @@
+# Several classes in one source (an assembly unit), one extending
+# another and the last using both.  Each class goes in its own
+# object file.
+.class Square:Obj
+.field side
+
+.method $constructor
+.args s
+    enter
+    load s
+    load $
+    store_field $:side
+    load $
+    return 1
+
+.method area
+    enter
+    load $
+    load_field $:side
+    load $
+    load_field $:side
+    call Int:mul
+    return 0
+
+.class Cube:Square
+
+.method $constructor
+.args s
+    enter
+    load s
+    load $
+    store_field $:side
+    load $
+    return 1
+
+.method volume
+    enter
+    load $
+    load_field $:side
+    load $
+    call $:area
+    call Int:mul
+    return 0
+
+.class Shapes:Obj
+
+.method $constructor
+    enter
+    const 3
+    new Square
+    call Square:$constructor
+    call Square:area
+    call Int:print
+    pop
+    const "\n"
+    call String:print
+    pop
+    const 2
+    new Cube
+    call Cube:$constructor
+    call Cube:volume
+    call Int:print
+    pop
+    const "\n"
+    call String:print
+    return 0
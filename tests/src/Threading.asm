@@ -0,0 +1,31 @@
+# Code for the control flow passes of the optimizer (-O):  jumps
+# to jumps are threaded, and code no path reaches is removed.
+# The program must print the same with or without -O.
+.class Threading:Obj
+
+.method $constructor
+    enter
+    const "start\n"
+    call String:print
+    pop
+    # thread_jump:  each jump to a jump goes straight to its target
+    jump hop
+back:
+    const true
+    jump_if skip
+    const "not skipped\n"
+    call String:print
+    pop
+skip:
+    const "end\n"
+    call String:print
+    return 0
+    # unreachable:  no path leads here, nor (once jump hop is
+    # threaded) to hop
+    const "unreachable\n"
+    call String:print
+    pop
+hop:
+    jump hop2
+hop2:
+    jump back
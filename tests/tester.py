@@ -1,8 +1,14 @@
 """Simple test script for Ori (tiny vm) asm files.
 (Extend later to work with Quack compilation)
 
+Every case is assembled and run in each mode (see MODES), and
+must print the same in all of them.
+
+Usage:  python3 tester.py [mode ...]   (default: all modes)
+
 FIXME: There must be better ways to handle file dependencies
 """
+import argparse
 import subprocess
 import pathlib
 import shutil
@@ -11,6 +17,7 @@ import csv
 
 import logging
 import sys
+from typing import Dict, List, NamedTuple
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -21,9 +28,36 @@ log.setLevel(logging.INFO)
 PY = "python3"
 ROOT = ".."
 ASM = f"{ROOT}/assemble.py"
+LINK = f"{ROOT}/link.py"
 VM = f"{ROOT}/bin/tiny_vm"
+# Built with VM_UNCHECKED (cmake target tiny_vm_unchecked)
+UNCHECKED_VM = f"{ROOT}/bin/tiny_vm_unchecked"
 BUILTINS = ["Bool.json", "Int.json", "Nothing.json", "Obj.json", "String.json"]
-ASMREQS = ["asm.conf", "opdefs.txt"]
+ASMREQS = ["asm.conf"]
+
+sys.path.insert(0, ROOT)
+import objfile  # noqa: E402
+
+
+class Mode(NamedTuple):
+    """Assemble with these options, then run on this VM, from the
+    object files or (link) from an image of only what the program
+    reaches (link.py --shake)
+    """
+    name: str
+    options: List[str]
+    vm: str
+    link: bool = False
+
+
+MODES = {mode.name: mode for mode in [
+    Mode("plain", [], VM),
+    Mode("optimize", ["-O"], VM),
+    Mode("fuse", ["-O", "--fuse"], VM),
+    # Verified classes run without the VM's checks
+    Mode("verify", ["--verify"], UNCHECKED_VM),
+    Mode("shake", [], VM, link=True),
+]}
 
 def install_prereqs():
     """Copy pre-requisite files.
@@ -40,45 +74,81 @@ def install_prereqs():
         log.debug(f"Copying {origin} to {copied}")
         shutil.copyfile(origin, copied)
 
-def assemble(class_name: str) -> bool:
-    """Translate src/Class.asm to OBJ/Class.json.
-    Separated because some classes (e.g., Counter) cannot
-    be run as main programs.  (Main program class constructors
-    cannot have arguments.)
+def assemble_all(class_names: List[str], options: List[str]) -> Dict[str, bool]:
+    """Translate src/Class.asm to OBJ/Class.tvm for every class
+    in one batch run of the assembler, rather than starting the
+    assembler once per class.  Some classes (e.g., Counter) are
+    assembled but not run, because main program class constructors
+    cannot have arguments.  A source may be a unit of several
+    classes (e.g., Shapes), each assembled to its own object file;
+    its case is named for the class it runs.  Returns class name ->
+    assembled ok.
     """
-    src = pathlib.Path("./src/" + class_name + ".asm")
-    obj = pathlib.Path("./OBJ/" + class_name + ".json")
-    try:
-        proc = subprocess.run([PY, ASM, src, obj], text=True)
-        proc.check_returncode() # May throw CalledProcessError
-    except subprocess.CalledProcessError:
-        log.warning(f"Assembler crashed on {src}")
-        return False
-    return True
+    sources = []
+    for class_name in class_names:
+        src = pathlib.Path("./src/" + class_name + ".asm")
+        obj = pathlib.Path("./OBJ/" + class_name + ".tvm")
+        if obj.exists():
+            obj.unlink()   # So a stale object file can't pass for new
+        if src.exists():
+            sources.append(str(src))
+        else:
+            log.warning(f"No source file {src}")
+    if sources:
+        proc = subprocess.run([PY, ASM] + options + ["--batch"] + sources, text=True)
+        if proc.returncode:
+            log.warning("Assembler failed on some classes")
+    return {class_name: pathlib.Path("./OBJ/" + class_name + ".tvm").exists()
+            for class_name in class_names}
+
+
+def is_verified(class_name: str) -> bool:
+    """Did the assembler mark OBJ/Class.tvm as verified?"""
+    return bool(objfile.read_object(pathlib.Path("./OBJ/" + class_name + ".tvm"))
+                .get("verified"))
+
 
+def link(class_name: str) -> bool:
+    """Link the program of main class C into OBJ/C.tvp, shaken"""
+    proc = subprocess.run([PY, LINK, class_name, "-L", "OBJ", "--shake"],
+                          text=True)
+    return proc.returncode == 0
 
-def test_class(class_name: str) -> bool:
-    """Assemble, run, and check a single test case
+
+def test_class(class_name: str, mode: Mode) -> bool:
+    """Run and check a single (already assembled) test case
     for a class C, in src/C.asm, with expected output
     in expect/C_stdout.txt.  Returns True iff test case
-    has expected outcome.
+    has expected outcome.  Output that does not match is
+    kept in out/C_mode_stdout.txt.
     """
     ok = True
     observed_stdout = pathlib.Path("out/" + class_name + "_stdout.txt")
     observed_stderr = pathlib.Path("out/" + class_name + "_stderr.txt")
     expect_stdout = pathlib.Path("expect/" + class_name + "_stdout.txt")
-    if not assemble(class_name):
+    if not expect_stdout.exists():
+        log.warning(f"No expected output {expect_stdout}")
         return False
+    if mode.link:
+        if not link(class_name):
+            log.warning(f"Could not link {class_name}")
+            return False
+        command = [mode.vm, "-i", "OBJ/" + class_name + ".tvp"]
+    else:
+        command = [mode.vm, class_name]
     try:
         std_out = open(observed_stdout, "w")
         std_err = open(observed_stderr, "w")
-        proc = subprocess.run([VM, class_name], text=True,
+        proc = subprocess.run(command, text=True,
                               stdout=std_out, stderr=std_err)
         proc.check_returncode() # May throw CalledProcessError
         if filecmp.cmp(observed_stdout, expect_stdout):
-            log.info(f"OK: {class_name} produced expected output")
+            log.info(f"OK: {class_name} produced expected output ({mode.name})")
         else:
-            log.info(f"{class_name} output did not match expectation")
+            kept = pathlib.Path(f"out/{class_name}_{mode.name}_stdout.txt")
+            shutil.copyfile(observed_stdout, kept)
+            log.info(f"{class_name} output did not match expectation "
+                     f"({mode.name}, see {kept})")
             ok = False
     except subprocess.CalledProcessError:
         log.warning(f"Crashed: {proc.args}")
@@ -86,27 +156,70 @@ def test_class(class_name: str) -> bool:
     return ok
 
 
+def test_mode(cases: List[Dict[str, str]], mode: Mode) -> int:
+    """Assemble and check every case in one mode; the number that failed.
+    Actions:  assemble (only), run (and compare output), verify
+    (run, and --verify must mark the class verified), reject
+    (--verify must not mark the class verified; not run, since
+    the verifier had reason to doubt it).
+    """
+    log.info(f"Mode {mode.name}: assemble {' '.join(mode.options)}")
+    verifying = "--verify" in mode.options
+    assembled = assemble_all([case["Class"] for case in cases], mode.options)
+    failed = 0
+    for case in cases:
+        class_name = case["Class"]
+        action = case["Action"]
+        ok = assembled[class_name]
+        if not ok:
+            log.warning(f"Assembler failed on class {class_name}")
+        if action == "assemble":
+            # Assemble but do not execute
+            log.info(f"Class '{class_name} -- assemble only")
+        elif action in ["run", "verify"]:
+            log.info(f"Class '{class_name} -- assemble and run")
+            if ok and verifying and action == "verify" and not is_verified(class_name):
+                log.warning(f"{class_name} was not verified")
+                ok = False
+            ok = ok and test_class(class_name, mode)
+        elif action == "reject":
+            log.info(f"Class '{class_name} -- assemble, must not verify")
+            if ok and verifying and is_verified(class_name):
+                log.warning(f"{class_name} was verified")
+                ok = False
+        else:
+            log.error(f"Unrecognized action '{action}' for class {class_name}")
+        if not ok:
+            print(f"*** Failed test case: {action} {class_name} ({mode.name})",
+                  file=sys.stderr)
+            failed += 1
+    return failed
+
+
 def main():
-    """Stub"""
+    parser = argparse.ArgumentParser(description="Run the test cases of src/TESTS.csv")
+    parser.add_argument("modes", nargs="*",
+                        help=f"Any of {', '.join(MODES)} (default: all)")
+    args = parser.parse_args()
+    for name in args.modes:
+        if name not in MODES:
+            parser.error(f"No mode '{name}'")
     install_prereqs()
     with open("src/TESTS.csv") as cases:
         case_reader = csv.DictReader(cases)
-        for case in case_reader:
-            class_name = case["Class"]
-            action = case["Action"]
-            if action == "assemble":
-                # Assemble but do not execute
-                log.info(f"Class '{class_name} -- assemble only")
-                ok = assemble(class_name)
-            elif action == "run":
-                log.info(f"Class '{class_name} -- assemble and run")
-                ok = test_class(class_name)
-            else:
-                log.error(f"Unrecognized action '{action}' for class {class_name}")
-            if not ok:
-                print(f"*** Failed test case: {action} {class_name}", file=sys.stderr)
+        cases = list(case_reader)
+    failed = 0
+    for name in args.modes or MODES:
+        mode = MODES[name]
+        if not pathlib.Path(mode.vm).exists():
+            # Every case of the mode fails; another VM would not test it
+            print(f"*** Failed mode {name}: no {mode.vm}", file=sys.stderr)
+            failed += len(cases)
+            continue
+        failed += test_mode(cases, mode)
     # FIXME: Add a check for omitted source files
-    print("Testing complete")
+    print(f"Testing complete ({failed} failed)")
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,445 @@
+"""Generate large synthetic programs, as Quack and as assembly,
+to measure how the translator, assembler, and loader scale.
+
+One program model is rendered both ways, so the two listings
+compute the same thing.  Its size and shape are set by options:
+the number of classes and the depth of their inheritance chains,
+methods per class, nesting of loops and conditionals in each
+method, statements per loop body, and distinct literals per
+method.  Every class overrides every method of its superclass
+and adds a field; the Main class constructs one object of each
+class, calls its last method (which calls the one before it,
+and so on), and prints the total.  Loops run a few trips and
+values are kept below LIMIT, so the program runs to completion
+at any size and always prints the same total for the same seed.
+
+The Quack listing follows qklib/quack_grammar.txt, and the
+assembly is what assemble.py accepts:  one .asm file per class,
+or with --unit, all of them in one file.  --check parses the
+one and assembles the other (into --out), so
+
+    python3 tools/gen_program.py --classes 200 --check --out /tmp/big
+    bin/tiny_vm -L /tmp/big Main
+
+runs the result.
+
+Usage (from anywhere):
+    python3 tools/gen_program.py [--classes 20] [--depth 4] [--methods 5]
+        [--nesting 2] [--body 3] [--literals 8] [--seed 1]
+        [--format qk|asm|both] [--unit] [--check] [--out DIR]
+"""
+import argparse
+import logging
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+START = Path.cwd()
+ROOT = Path(__file__).resolve().parent.parent
+
+# Values are brought back into [0, LIMIT) after each block
+LIMIT = 1000
+
+# Trips through each generated loop
+TRIPS = 3
+
+log = logging.getLogger("gen_program")
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=20,
+                        help="Number of classes, besides Main")
+    parser.add_argument("--depth", type=int, default=4,
+                        help="Classes in each inheritance chain "
+                             "(1: every class extends Obj)")
+    parser.add_argument("--methods", type=int, default=5,
+                        help="Methods of each class")
+    parser.add_argument("--nesting", type=int, default=2,
+                        help="Loops and conditionals nested in each method")
+    parser.add_argument("--body", type=int, default=3,
+                        help="Statements in each loop body")
+    parser.add_argument("--literals", type=int, default=8,
+                        help="Distinct integer literals in each method")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--format", choices=["qk", "asm", "both"], default="both")
+    parser.add_argument("--unit", action="store_true",
+                        help="Write the assembly of all classes to one "
+                             "file, Prog.asm, rather than one per class")
+    parser.add_argument("--check", action="store_true",
+                        help="Parse the Quack listing with the Quack "
+                             "grammar, and assemble the assembly into --out")
+    parser.add_argument("--out", type=Path, default=Path("gen"),
+                        help="Directory for the generated files")
+    args = parser.parse_args()
+    if min(args.classes, args.depth, args.methods, args.literals) < 1:
+        parser.error("--classes, --depth, --methods, and --literals must be at least 1")
+    if min(args.nesting, args.body) < 0:
+        parser.error("--nesting and --body must not be negative")
+    return args
+
+
+# ----------------
+#  The program model.  Statements are tuples; the only variable
+#  they compute with is t, an Int local of the method.
+#
+#    ("add", "+" or "-", literal)   t = t op literal
+#    ("loop", counter, body)        TRIPS times:  body
+#    ("if", literal, then, else)    if t < literal:  then, else:  else
+#    ("wrap",)                      while t >= LIMIT:  t = t - LIMIT,
+#                                   then while t < 0:  t = t + LIMIT
+#
+
+class Method:
+    def __init__(self, name: str, index: int, body: list, field: str):
+        self.name = name
+        self.index = index      # Calls the method of index - 1, if any
+        self.body = body
+        self.field = field      # Added to t before the call
+        self.counters = sorted(_counters(body))
+
+
+class Clazz:
+    def __init__(self, name: str, super_name: str, fields: List[str],
+                 field_literals: List[int], methods: List[Method]):
+        self.name = name
+        self.super_name = super_name
+        self.fields = fields            # Inherited first, own last
+        self.field_literals = field_literals
+        self.methods = methods
+
+    @property
+    def own_field(self) -> str:
+        return self.fields[-1]
+
+
+def _counters(body: list) -> Iterator[str]:
+    for stmt in body:
+        if stmt[0] == "loop":
+            yield stmt[1]
+            yield from _counters(stmt[2])
+        elif stmt[0] == "if":
+            yield from _counters(stmt[2])
+            yield from _counters(stmt[3])
+
+
+class Generator:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+
+    def program(self) -> List[Clazz]:
+        classes: List[Clazz] = []
+        for i in range(self.args.classes):
+            parent = classes[-1] if i % self.args.depth else None
+            inherited = parent.fields if parent else []
+            fields = inherited + [f"f{i}"]
+            classes.append(Clazz(
+                f"C{i}", parent.name if parent else "Obj", fields,
+                [self.rng.randrange(LIMIT) for _ in fields],
+                [self.method(j, fields) for j in range(self.args.methods)]))
+        return classes
+
+    def method(self, index: int, fields: List[str]) -> Method:
+        literals = self.rng.sample(range(1, max(LIMIT, 2 * self.args.literals)),
+                                   self.args.literals)
+        # The nested blocks use the first literals, round robin;
+        # any left over are added before them
+        needed = sum(self.args.body if level % 2 else min(self.args.body, 1)
+                     for level in range(1, self.args.nesting + 1))
+        uses = iter(literals * (1 + needed // len(literals)))
+        nested = self.block(1, uses)
+        used = min(len(literals), needed)
+        body = [("add", self.rng.choice("+-"), lit) for lit in literals[used:]]
+        return Method(f"m{index}", index, body + [("wrap",)] + nested,
+                      self.rng.choice(fields))
+
+    def block(self, level: int, uses: Iterator[int]) -> list:
+        """Loops at odd levels, conditionals at even levels,
+        down to --nesting
+        """
+        if level > self.args.nesting:
+            return []
+        if level % 2:
+            body = [("add", self.rng.choice("+-"), next(uses))
+                    for _ in range(self.args.body)]
+            body += [("wrap",)] + self.block(level + 1, uses)
+            return [("loop", f"i{level}", body)]
+        inner = [("add", "+", next(uses))] if self.args.body else []
+        then = inner + self.block(level + 1, uses)
+        return [("if", self.rng.randrange(LIMIT), then, [("add", "-", 1), ("wrap",)])]
+
+
+# ----------------
+#  Quack
+#
+
+def quack(classes: List[Clazz]) -> str:
+    lines = ["// Generated by tools/gen_program.py"]
+    for clazz in classes:
+        extends = f" extends {clazz.super_name}" if clazz.super_name != "Obj" else ""
+        lines.append(f"class {clazz.name}(n: Int){extends} {{")
+        for method in clazz.methods:
+            lines += _quack_method(method)
+        for field, literal in zip(clazz.fields, clazz.field_literals):
+            lines.append(f"    this.{field} = n + {literal};")
+        lines += ["}", ""]
+    lines.append("total = 0;")
+    for i, clazz in enumerate(classes):
+        last = clazz.methods[-1].name
+        lines += [f"c{i} = {clazz.name}({i});",
+                  f"r = c{i}.{last}({i});",
+                  "total = total + r;"]
+    lines += ["total.print();", '"\\n".print();', ""]
+    return "\n".join(lines)
+
+
+def _quack_method(method: Method) -> List[str]:
+    lines = [f"    def {method.name}(k: Int): Int {{", "        t = k;"]
+    lines += _quack_block(method.body, 2)
+    lines += [f"        f = this.{method.field};", "        t = t + f;"]
+    if method.index:
+        lines += [f"        r = this.m{method.index - 1}(k);",
+                  "        if r < t { t = t - 1; } else { t = t + 1; }"]
+    lines += _quack_block([("wrap",)], 2)
+    return lines + ["        return t;", "    }"]
+
+
+def _quack_block(body: list, level: int) -> List[str]:
+    pad = "    " * level
+    lines = []
+    for stmt in body:
+        if stmt[0] == "add":
+            lines.append(f"{pad}t = t {stmt[1]} {stmt[2]};")
+        elif stmt[0] == "wrap":
+            lines += [f"{pad}while t >= {LIMIT} {{ t = t - {LIMIT}; }}",
+                      f"{pad}while t < 0 {{ t = t + {LIMIT}; }}"]
+        elif stmt[0] == "loop":
+            counter = stmt[1]
+            lines += [f"{pad}{counter} = 0;", f"{pad}while {counter} < {TRIPS} {{"]
+            lines += _quack_block(stmt[2], level + 1)
+            lines += [f"{pad}    {counter} = {counter} + 1;", f"{pad}}}"]
+        else:
+            lines.append(f"{pad}if t < {stmt[1]} {{")
+            lines += _quack_block(stmt[2], level + 1)
+            lines.append(f"{pad}}} else {{")
+            lines += _quack_block(stmt[3], level + 1)
+            lines.append(f"{pad}}}")
+    return lines
+
+
+# ----------------
+#  Assembly.  Arguments are pushed before the receiver, so
+#  t + 5 is  const 5; load t; call Int:plus
+#
+
+class AsmWriter:
+    def __init__(self):
+        self.lines: List[str] = []
+        self.n_labels = 0
+
+    def emit(self, *instrs: str):
+        self.lines += [f"    {instr}" for instr in instrs]
+
+    def label(self, name: str):
+        self.lines.append(f"{name}:")
+
+    def new_label(self, kind: str) -> str:
+        self.n_labels += 1
+        return f"{kind}_{self.n_labels}"
+
+    def clazz(self, clazz: Clazz) -> List[str]:
+        self.lines = [f".class {clazz.name}:{clazz.super_name}",
+                      f".field {clazz.own_field}"]
+        # m_j calls m_(j-1), so a new method is always declared
+        # before it is called
+        self.lines += [".method $constructor", ".args n", "    enter"]
+        for field, literal in zip(clazz.fields, clazz.field_literals):
+            self.emit(f"const {literal}", "load n", "call Int:plus",
+                      "load $", f"store_field $:{field}")
+        self.emit("load $", "return 1")
+        for method in clazz.methods:
+            self.method(method)
+        return self.lines
+
+    def method(self, method: Method):
+        self.lines += ["", f".method {method.name}", ".args k",
+                       f".local {','.join(['t', 'f', 'r'] + method.counters)}",
+                       "    enter"]
+        self.emit("load k", "store t")
+        self.block(method.body)
+        self.emit("load $", f"load_field $:{method.field}", "store f",
+                  "load f", "load t", "call Int:plus", "store t")
+        if method.index:
+            self.emit("load k", "load $", f"call $:m{method.index - 1}", "store r")
+            # if r < t { t = t - 1; } else { t = t + 1; }
+            other, done = self.new_label("else"), self.new_label("endif")
+            self.emit("load t", "load r", "call Int:less", f"jump_ifnot {other}",
+                      "const 1", "load t", "call Int:sub", "store t", f"jump {done}")
+            self.label(other)
+            self.emit("const 1", "load t", "call Int:plus", "store t")
+            self.label(done)
+        self.block([("wrap",)])
+        self.emit("load t", "return 1")
+
+    def block(self, body: list):
+        for stmt in body:
+            if stmt[0] == "add":
+                op = "plus" if stmt[1] == "+" else "sub"
+                self.emit(f"const {stmt[2]}", "load t", f"call Int:{op}", "store t")
+            elif stmt[0] == "wrap":
+                # while not t < LIMIT: t = t - LIMIT
+                self.loop(["const " + str(LIMIT), "load t", "call Int:less"], False,
+                          [f"const {LIMIT}", "load t", "call Int:sub", "store t"])
+                # while t < 0:  t = t + LIMIT
+                self.loop(["const 0", "load t", "call Int:less"], True,
+                          [f"const {LIMIT}", "load t", "call Int:plus", "store t"])
+            elif stmt[0] == "loop":
+                counter = stmt[1]
+                self.emit("const 0", f"store {counter}")
+                head, end = self.new_label("while"), self.new_label("endwhile")
+                self.label(head)
+                self.emit(f"const {TRIPS}", f"load {counter}", "call Int:less",
+                          f"jump_ifnot {end}")
+                self.block(stmt[2])
+                self.emit("const 1", f"load {counter}", "call Int:plus",
+                          f"store {counter}", f"jump {head}")
+                self.label(end)
+            else:
+                other, done = self.new_label("else"), self.new_label("endif")
+                self.emit(f"const {stmt[1]}", "load t", "call Int:less",
+                          f"jump_ifnot {other}")
+                self.block(stmt[2])
+                self.emit(f"jump {done}")
+                self.label(other)
+                self.block(stmt[3])
+                self.label(done)
+
+    def loop(self, condition: List[str], while_true: bool, body: List[str]):
+        head, end = self.new_label("while"), self.new_label("endwhile")
+        self.label(head)
+        self.emit(*condition, f"{'jump_ifnot' if while_true else 'jump_if'} {end}")
+        self.emit(*body, f"jump {head}")
+        self.label(end)
+
+    def main(self, classes: List[Clazz]) -> List[str]:
+        objects = [f"c{i}" for i in range(len(classes))]
+        self.lines = [".class Main:Obj", ".method $constructor",
+                      f".local {','.join(['total', 'r'] + objects)}", "    enter"]
+        self.emit("const 0", "store total")
+        for i, clazz in enumerate(classes):
+            self.emit(f"const {i}", f"new {clazz.name}",
+                      f"call {clazz.name}:$constructor", f"store c{i}",
+                      f"const {i}", f"load c{i}",
+                      f"call {clazz.name}:{clazz.methods[-1].name}", "store r",
+                      "load r", "load total", "call Int:plus", "store total")
+        self.emit("load total", "call Int:print", "pop",
+                  'const "\\n"', "call String:print", "pop",
+                  "load $", "return 0")
+        return self.lines
+
+
+def assembly(classes: List[Clazz]) -> dict:
+    """Listing of each class (and Main), by class name"""
+    writer = AsmWriter()
+    listings = {clazz.name: writer.clazz(clazz) for clazz in classes}
+    listings["Main"] = writer.main(classes)
+    return {name: "\n".join(lines) + "\n" for name, lines in listings.items()}
+
+
+# ----------------
+#  Writing and checking
+#
+
+def write(args, classes: List[Clazz]) -> dict:
+    """Write the listings; paths written, by format"""
+    args.out.mkdir(parents=True, exist_ok=True)
+    written = {"qk": [], "asm": []}
+    if args.format in ("qk", "both"):
+        path = args.out / "Prog.qk"
+        path.write_text(quack(classes))
+        written["qk"].append(path)
+    if args.format in ("asm", "both"):
+        listings = assembly(classes)
+        if args.unit:
+            path = args.out / "Prog.asm"
+            path.write_text("\n".join(listings.values()))
+            written["asm"].append(path)
+        else:
+            for name, text in listings.items():
+                path = args.out / f"{name}.asm"
+                path.write_text(text)
+                written["asm"].append(path)
+    return written
+
+
+def check_quack(path: Path) -> Optional[str]:
+    """Parse with the Quack grammar; the error, if any"""
+    from new_translator import quack_parser
+    try:
+        quack_parser().parse(path.read_text())
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def check_assembly(paths: List[Path], outdir: Path) -> Optional[str]:
+    """Assemble into outdir, along with the built-in classes,
+    so that outdir can be a class path for the VM
+    """
+    from assemble import Configuration
+    config = Configuration()
+    for builtin in config.tvmlib.glob("*.json"):
+        shutil.copy(builtin, outdir)
+    result = subprocess.run([sys.executable, str(ROOT / "assemble.py"), "--no-cache",
+                             "--outdir", str(outdir), "--batch", *map(str, paths)],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode:
+        return result.stderr.strip()
+    return None
+
+
+def main():
+    args = cli()
+    logging.basicConfig(level=logging.INFO)
+    args.out = START / args.out
+    os.chdir(ROOT)      # assemble.py and the translator read files relative to it
+    sys.path.insert(0, str(ROOT))
+    classes = Generator(args).program()
+    written = write(args, classes)
+    for paths in written.values():
+        if paths:
+            size = sum(path.stat().st_size for path in paths)
+            lines = sum(path.read_text().count("\n") for path in paths)
+            log.info(f"Wrote {len(paths)} file(s), {lines:,} lines, "
+                     f"{size / 1024:,.0f} KB:  {paths[0].name}"
+                     f"{' ...' if len(paths) > 1 else ''}")
+    if not args.check:
+        return
+    failed = False
+    for path in written["qk"]:
+        start = time.perf_counter()
+        error = check_quack(path)
+        if error:
+            log.error(f"{path.name} does not parse:  {error}")
+            failed = True
+        else:
+            log.info(f"Parsed {path.name} in {time.perf_counter() - start:.2f} s")
+    if written["asm"]:
+        start = time.perf_counter()
+        error = check_assembly(written["asm"], args.out)
+        if error:
+            log.error(f"Assembly failed:  {error}")
+            failed = True
+        else:
+            log.info(f"Assembled into {args.out} in {time.perf_counter() - start:.2f} s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
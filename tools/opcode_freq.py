@@ -0,0 +1,113 @@
+"""Frequency of operation sequences in a corpus of object files,
+to choose superinstructions (see superops.py).
+
+Counts every run of 2 or more consecutive instructions in each
+method, ranked by the dispatches a superinstruction for it would
+save (occurrences * (length - 1)).  Runs with a control transfer
+anywhere but at the end cannot be fused, so are not counted.
+Object code that is already fused is counted as its parts.
+
+Usage (from anywhere):
+    python3 tools/opcode_freq.py tests/OBJ [more files or dirs]
+    python3 tools/opcode_freq.py --write superops.txt --top 8 tests/OBJ
+"""
+import argparse
+import collections
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+START = Path.cwd()
+ROOT = Path(__file__).resolve().parent.parent
+os.chdir(ROOT)       # assemble.py reads asm.conf from cwd
+sys.path.insert(0, str(ROOT))
+import assemble     # noqa: E402
+import objfile      # noqa: E402
+from superops import CONTROL_OPS, MAX_PARTS   # noqa: E402
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(
+        description="Report frequent operation sequences in object files")
+    parser.add_argument("corpus", nargs="+", type=Path,
+                        help="Object files (.tvm, .json) or directories of them")
+    parser.add_argument("--max-length", type=int, default=3,
+                        help=f"Longest sequence to count (at most {MAX_PARTS})")
+    parser.add_argument("--top", type=int, default=20,
+                        help="Number of sequences to report")
+    parser.add_argument("--write", type=Path, default=None,
+                        help="Write the top sequences as a superops.txt file")
+    args = parser.parse_args()
+    args.corpus = [START.joinpath(path) for path in args.corpus]
+    if args.write:
+        args.write = START.joinpath(args.write)
+    args.max_length = max(2, min(args.max_length, MAX_PARTS))
+    return args
+
+
+def object_files(paths: Iterable[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir()
+                                if p.suffix in objfile.SUFFIXES))
+        else:
+            files.append(path)
+    return files
+
+
+def decode(code: List[int], by_code: Dict[int, assemble.InstructionDef]) -> List[str]:
+    """Operation names of a method's code, skipping operands"""
+    names = []
+    i = 0
+    while i < len(code):
+        op = by_code[code[i]]
+        names.extend(op.parts)
+        i += 1 + int(op.ops)
+    return names
+
+
+def count_sequences(methods: Iterable[List[str]],
+                    max_length: int) -> collections.Counter:
+    counts = collections.Counter()
+    for names in methods:
+        for start in range(len(names)):
+            for length in range(2, max_length + 1):
+                run = tuple(names[start:start + length])
+                if len(run) < length:
+                    break
+                if any(name in CONTROL_OPS for name in run[:-1]):
+                    break
+                counts[run] += 1
+    return counts
+
+
+def main():
+    args = cli()
+    by_code = {op.code: op for op in assemble.INSTRS.ops.values()}
+    by_code.update({op.code: op for op in assemble.INSTRS.superops.values()})
+    methods = []
+    for path in object_files(args.corpus):
+        obj = objfile.read_object(path)
+        methods.extend(decode(method["code"], by_code)
+                       for method in obj.get("code", []))
+    counts = count_sequences(methods, args.max_length)
+    ranked = sorted(counts.items(),
+                    key=lambda item: (-item[1] * (len(item[0]) - 1), item[0]))
+    top = ranked[:args.top]
+    print(f"{'saved':>8} {'count':>8}  sequence")
+    for run, count in top:
+        print(f"{count * (len(run) - 1):8d} {count:8d}  {' '.join(run)}")
+    if args.write:
+        with open(args.write, "w") as f:
+            print("#\n#  Superinstructions, generated by tools/opcode_freq.py from\n"
+                  f"#  {len(methods)} methods.  See superops.py for the format.\n#",
+                  file=f)
+            for run, count in top:
+                print(f"{'_'.join(run)},{','.join(run)}   # {count} occurrences",
+                      file=f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Hot spots from a tiny_vm profile (tiny_vm -p FILE; see vm_profile.h).
+
+Attributes each sampled program counter to the method loaded
+there and, where the assembler wrote a source map beside the
+object file (assemble.py --map), to the assembly line, label and
+Quack source line of the instruction.  Return addresses point
+after the call, so we attribute callers to the word before.
+
+Reports samples by method (self and total) and by line, and can
+write the stacks in the "folded" form that flamegraph.pl and
+speedscope read.
+
+Usage (from the directory tiny_vm ran in):
+    python3 tools/profile_report.py profile.txt [--maps tests/OBJ]
+    python3 tools/profile_report.py profile.txt --folded out.folded [--lines]
+"""
+import argparse
+import bisect
+import collections
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Must match MAP_SUFFIX in assemble.py
+MAP_SUFFIX = ".map"
+
+# Stand-ins for code the loader did not place
+NATIVE = "<native>"
+UNKNOWN = "<vm>"
+
+
+def cli() -> object:
+    parser = argparse.ArgumentParser(
+        description="Report hot methods and lines from a tiny_vm profile")
+    parser.add_argument("profile", type=Path)
+    parser.add_argument("--maps", type=Path, action="append", default=None,
+                        help="Directory of source maps (Class.map); may be "
+                             "repeated.  Default: the VM's load library")
+    parser.add_argument("--top", type=int, default=20,
+                        help="Number of methods and lines to report")
+    parser.add_argument("--folded", type=Path, default=None,
+                        help="Write folded stacks for a flame graph")
+    parser.add_argument("--lines", action="store_true",
+                        help="Name flame graph frames with their line")
+    return parser.parse_args()
+
+
+class Profile:
+    def __init__(self, path: Path):
+        self.mode = ""
+        self.library: Optional[Path] = None
+        # (start, length, class, method), in order of start
+        self.methods: List[Tuple[int, int, str, str]] = []
+        self.stacks: List[Tuple[int, List[int]]] = []
+        self.dropped = 0
+        with open(path, "r") as f:
+            for line in f:
+                kind, _, rest = line.rstrip("\n").partition(" ")
+                if kind == "mode":
+                    self.mode = rest
+                elif kind == "library":
+                    self.library = Path(rest)
+                elif kind == "method":
+                    start, length, class_name, method_name = rest.split(" ", 3)
+                    self.methods.append((int(start), int(length),
+                                         class_name, method_name))
+                elif kind == "stack":
+                    count, *pcs = [int(word) for word in rest.split()]
+                    self.stacks.append((count, pcs))
+                elif kind == "dropped":
+                    self.dropped = int(rest)
+        self.methods.sort()
+        self.starts = [method[0] for method in self.methods]
+
+    def samples(self) -> int:
+        return sum(count for count, _ in self.stacks)
+
+
+class SourceMaps:
+    """Source maps by class, read when first needed"""
+    def __init__(self, directories: List[Path]):
+        self.directories = directories
+        self.maps: Dict[str, Optional[dict]] = {}
+
+    def method(self, class_name: str, method_name: str) -> Optional[dict]:
+        if class_name not in self.maps:
+            self.maps[class_name] = None
+            for directory in self.directories:
+                path = directory.joinpath(class_name + MAP_SUFFIX)
+                if path.exists():
+                    with open(path, "r") as f:
+                        self.maps[class_name] = json.load(f)
+                    break
+        source_map = self.maps[class_name]
+        if source_map is None:
+            return None
+        for method in source_map["methods"]:
+            if method["name"] == method_name:
+                return method
+        return None
+
+
+class Frame:
+    """Where a program counter is:  method, and line if we know"""
+    def __init__(self, method: str, asm_line: Optional[int] = None,
+                 label: Optional[str] = None,
+                 source_line: Optional[int] = None):
+        self.method = method
+        self.asm_line = asm_line
+        self.label = label
+        self.source_line = source_line
+
+    def line(self) -> str:
+        if self.asm_line is None:
+            return self.method
+        where = f"{self.method}:{self.asm_line}"
+        if self.source_line is not None:
+            where += f" (line {self.source_line})"
+        if self.label:
+            where += f" [{self.label}]"
+        return where
+
+
+def locate(profile: Profile, maps: SourceMaps, pc: int) -> Frame:
+    if pc < 0:
+        return Frame(NATIVE)
+    i = bisect.bisect_right(profile.starts, pc) - 1
+    if i < 0:
+        return Frame(UNKNOWN)
+    start, length, class_name, method_name = profile.methods[i]
+    if pc >= start + length:
+        return Frame(UNKNOWN)
+    name = f"{class_name}.{method_name}"
+    method = maps.method(class_name, method_name)
+    if method is None:
+        return Frame(name)
+    offset = pc - start
+    lines = method["lines"]
+    j = bisect.bisect_right([entry[0] for entry in lines], offset) - 1
+    if j < 0:
+        return Frame(name)
+    _, asm_line, label, source_line = lines[j]
+    return Frame(name, asm_line, label, source_line)
+
+
+def stack_frames(profile: Profile, maps: SourceMaps, pcs: List[int]) -> List[Frame]:
+    """Innermost first.  Return addresses (all but the first)
+    are the word after a call, so we look up the word before.
+    """
+    return [locate(profile, maps, pc if i == 0 or pc < 0 else pc - 1)
+            for i, pc in enumerate(pcs)]
+
+
+def report(profile: Profile, maps: SourceMaps, top: int, out=sys.stdout):
+    total = profile.samples()
+    self_counts = collections.Counter()
+    total_counts = collections.Counter()
+    line_counts = collections.Counter()
+    for count, pcs in profile.stacks:
+        frames = stack_frames(profile, maps, pcs)
+        self_counts[frames[0].method] += count
+        line_counts[frames[0].line()] += count
+        for method in {frame.method for frame in frames}:
+            total_counts[method] += count
+    print(f"{total} samples ({profile.mode}), {profile.dropped} dropped", file=out)
+
+    def percent(n: int) -> str:
+        return f"{100 * n / total:6.2f}%" if total else "      -"
+
+    print(f"\n{'self':>8} {'total':>8}  method", file=out)
+    for method, count in self_counts.most_common(top):
+        print(f"{percent(count)} {percent(total_counts[method])}  {method}", file=out)
+    print(f"\n{'self':>8}  line", file=out)
+    for line, count in line_counts.most_common(top):
+        print(f"{percent(count)}  {line}", file=out)
+
+
+def write_folded(profile: Profile, maps: SourceMaps, path: Path, lines: bool):
+    folded = collections.Counter()
+    for count, pcs in profile.stacks:
+        frames = stack_frames(profile, maps, pcs)
+        names = [frame.line() if lines else frame.method
+                 for frame in reversed(frames)]
+        # Semicolons separate frames in the folded format
+        folded[";".join(name.replace(";", ":") for name in names)] += count
+    with open(path, "w") as f:
+        for stack, count in sorted(folded.items()):
+            print(f"{stack} {count}", file=f)
+
+
+def main():
+    args = cli()
+    profile = Profile(args.profile)
+    directories = args.maps or ([profile.library] if profile.library else [])
+    maps = SourceMaps(directories)
+    report(profile, maps, args.top)
+    if args.folded:
+        write_folded(profile, maps, args.folded, args.lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 
 /**
  * GENERATED CODE, DO NOT EDIT
- * Generated 2022-02-19 16:11:59.775473 by build_bytecode_table.py
+ * Generated 2026-10-17 18:14:24.021058 by build_bytecode_table.py
  * 
  * Integer encoding of VM operations ---
  * Map those integer encodings to function pointers (for executing)
@@ -9,27 +9,167 @@
  */
  
 #include "vm_code_table.h"
+
+/* const; call */
+static void vm_op_const_call(void) {
+    vm_op_const();
+    vm_op_methodcall();
+}
+
+/* const; call */
+static void vm_op_const_call_unchecked(void) {
+    vm_op_const_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* load; call */
+static void vm_op_load_call(void) {
+    vm_op_load();
+    vm_op_methodcall();
+}
+
+/* load; call */
+static void vm_op_load_call_unchecked(void) {
+    vm_op_load_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* pop; const; call */
+static void vm_op_pop_const_call(void) {
+    vm_op_pop();
+    vm_op_const();
+    vm_op_methodcall();
+}
+
+/* pop; const; call */
+static void vm_op_pop_const_call_unchecked(void) {
+    vm_op_pop();
+    vm_op_const_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* const; load; call */
+static void vm_op_const_load_call(void) {
+    vm_op_const();
+    vm_op_load();
+    vm_op_methodcall();
+}
+
+/* const; load; call */
+static void vm_op_const_load_call_unchecked(void) {
+    vm_op_const_unchecked();
+    vm_op_load_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* pop; const */
+static void vm_op_pop_const(void) {
+    vm_op_pop();
+    vm_op_const();
+}
+
+/* pop; const */
+static void vm_op_pop_const_unchecked(void) {
+    vm_op_pop();
+    vm_op_const_unchecked();
+}
+
+/* store; load; call */
+static void vm_op_store_load_call(void) {
+    vm_op_store();
+    vm_op_load();
+    vm_op_methodcall();
+}
+
+/* store; load; call */
+static void vm_op_store_load_call_unchecked(void) {
+    vm_op_store_unchecked();
+    vm_op_load_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* const; load */
+static void vm_op_const_load(void) {
+    vm_op_const();
+    vm_op_load();
+}
+
+/* const; load */
+static void vm_op_const_load_unchecked(void) {
+    vm_op_const_unchecked();
+    vm_op_load_unchecked();
+}
+
+/* load; load_field; call */
+static void vm_op_load_load_field_call(void) {
+    vm_op_load();
+    vm_op_load_field();
+    vm_op_methodcall();
+}
+
+/* load; load_field; call */
+static void vm_op_load_load_field_call_unchecked(void) {
+    vm_op_load_unchecked();
+    vm_op_load_field_unchecked();
+    vm_op_methodcall_unchecked();
+}
+
+/* load; load_field */
+static void vm_op_load_load_field(void) {
+    vm_op_load();
+    vm_op_load_field();
+}
+
+/* load; load_field */
+static void vm_op_load_load_field_unchecked(void) {
+    vm_op_load_unchecked();
+    vm_op_load_field_unchecked();
+}
+
+/* store; load */
+static void vm_op_store_load(void) {
+    vm_op_store();
+    vm_op_load();
+}
+
+/* store; load */
+static void vm_op_store_load_unchecked(void) {
+    vm_op_store_unchecked();
+    vm_op_load_unchecked();
+}
+
+
 op_tbl_entry vm_op_bytecodes[] = {
 
-	 { "halt", vm_op_halt, 0 }, //0  Stops the processor.
-	 { "const", vm_op_const, 1 }, //1  Push constant; constant value follows
-	 { "call", vm_op_methodcall, 1 }, //2  Call an interpreted method
-	 { "call_native", vm_op_call_native, 1 }, //3  Trampoline to native method
-	 { "enter", vm_op_enter, 0 }, //4  Prologue of called method
-	 { "return", vm_op_return, 1 }, //5  Return from method, reclaiming locals
-	 { "new", vm_op_new, 1 }, //6  Allocate a new object instance
-	 { "pop", vm_op_pop, 0 }, //7  Discard top of stack
-	 { "alloc", vm_op_alloc, 1 }, //8  Allocate stack space for locals
-	 { "load", vm_op_load, 1 }, //9  Load (push) a local variable onto stack
-	 { "store", vm_op_store, 1 }, //10  Store (pop) top of stack to local variable
-	 { "load_field", vm_op_load_field, 1 }, //11  Load from object field
-	 { "store_field", vm_op_store_field, 1 }, //12  Store to object field
-	 { "roll", vm_op_roll, 1 }, //13  [obj arg1 ... argn] -> [arg1 ... argn obj]
-	 { "jump", vm_op_jump, 1 }, //14  Unconditional relative jump
-	 { "jump_if", vm_op_jump_if, 1 }, //15  Conditional relative jump, if true
-	 { "jump_ifnot", vm_op_jump_ifnot, 1 }, //16  Conditional relative jump, if false
-	 { "is_instance", vm_op_is_instance, 1 }, //17  Test membership in class (for typecase)
-
-    { 0, 0, 0}  // SENTRY
+	 { "halt", vm_op_halt, vm_op_halt, 0, 1, {0} }, //0  Stops the processor.
+	 { "const", vm_op_const, vm_op_const_unchecked, 1, 1, {1} }, //1  Push constant; constant value follows
+	 { "call", vm_op_methodcall, vm_op_methodcall_unchecked, 1, 1, {2} }, //2  Call an interpreted method
+	 { "call_native", vm_op_call_native, vm_op_call_native, 1, 1, {3} }, //3  Trampoline to native method
+	 { "enter", vm_op_enter, vm_op_enter_unchecked, 0, 1, {4} }, //4  Prologue of called method
+	 { "return", vm_op_return, vm_op_return_unchecked, 1, 1, {5} }, //5  Return from method, reclaiming locals
+	 { "new", vm_op_new, vm_op_new_unchecked, 1, 1, {6} }, //6  Allocate a new object instance
+	 { "pop", vm_op_pop, vm_op_pop, 0, 1, {7} }, //7  Discard top of stack
+	 { "alloc", vm_op_alloc, vm_op_alloc, 1, 1, {8} }, //8  Allocate stack space for locals
+	 { "load", vm_op_load, vm_op_load_unchecked, 1, 1, {9} }, //9  Load (push) a local variable onto stack
+	 { "store", vm_op_store, vm_op_store_unchecked, 1, 1, {10} }, //10  Store (pop) top of stack to local variable
+	 { "load_field", vm_op_load_field, vm_op_load_field_unchecked, 1, 1, {11} }, //11  Load from object field
+	 { "store_field", vm_op_store_field, vm_op_store_field_unchecked, 1, 1, {12} }, //12  Store to object field
+	 { "roll", vm_op_roll, vm_op_roll, 1, 1, {13} }, //13  [obj arg1 ... argn] -> [arg1 ... argn obj]
+	 { "jump", vm_op_jump, vm_op_jump, 1, 1, {14} }, //14  Unconditional relative jump
+	 { "jump_if", vm_op_jump_if, vm_op_jump_if_unchecked, 1, 1, {15} }, //15  Conditional relative jump, if true
+	 { "jump_ifnot", vm_op_jump_ifnot, vm_op_jump_ifnot_unchecked, 1, 1, {16} }, //16  Conditional relative jump, if false
+	 { "is_instance", vm_op_is_instance, vm_op_is_instance_unchecked, 1, 1, {17} }, //17  Test membership in class (for typecase)
+	 { "const_call", vm_op_const_call, vm_op_const_call_unchecked, 2, 2, {1, 2} }, //18  Superinstruction
+	 { "load_call", vm_op_load_call, vm_op_load_call_unchecked, 2, 2, {9, 2} }, //19  Superinstruction
+	 { "pop_const_call", vm_op_pop_const_call, vm_op_pop_const_call_unchecked, 2, 3, {7, 1, 2} }, //20  Superinstruction
+	 { "const_load_call", vm_op_const_load_call, vm_op_const_load_call_unchecked, 3, 3, {1, 9, 2} }, //21  Superinstruction
+	 { "pop_const", vm_op_pop_const, vm_op_pop_const_unchecked, 1, 2, {7, 1} }, //22  Superinstruction
+	 { "store_load_call", vm_op_store_load_call, vm_op_store_load_call_unchecked, 3, 3, {10, 9, 2} }, //23  Superinstruction
+	 { "const_load", vm_op_const_load, vm_op_const_load_unchecked, 2, 2, {1, 9} }, //24  Superinstruction
+	 { "load_load_field_call", vm_op_load_load_field_call, vm_op_load_load_field_call_unchecked, 3, 3, {9, 11, 2} }, //25  Superinstruction
+	 { "load_load_field", vm_op_load_load_field, vm_op_load_load_field_unchecked, 2, 2, {9, 11} }, //26  Superinstruction
+	 { "store_load", vm_op_store_load, vm_op_store_load_unchecked, 2, 2, {10, 9} }, //27  Superinstruction
+
+    { 0, 0, 0, 0}  // SENTRY
 };
 
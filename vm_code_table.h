@@ -11,10 +11,20 @@
 #include "vm_state.h"
 #include "vm_ops.h"
 
+/* Superinstructions (superops.txt) run up to this many
+ * operations; must match MAX_PARTS in superops.py
+ */
+#define MAX_SUPEROP_PARTS 4
+
 typedef struct {
     char *name;
     vm_Instr instr;
-    int n_operands;
+    vm_Instr unchecked;     // Without health and type checks, for verified code
+    int n_operands;     // Operand words following the instruction
+    int n_parts;        // 1, except for superinstructions
+    int parts[MAX_SUPEROP_PARTS];  // Byte codes of the operations run,
+                                   // in order; their operands follow
+                                   // the instruction in the same order
 } op_tbl_entry;
 
 extern op_tbl_entry vm_op_bytecodes[];
@@ -5,11 +5,17 @@
 #include "builtins.h" // For constants
 #include "vm_code_table.h" // opcode -> instruction
 #include "logger.h"
+#include "vm_objfile.h"
+#include "vm_profile.h"
 #include <cjson/cJSON.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <assert.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 
 
 // Set load library path before loading each class by name.
@@ -32,7 +38,7 @@ vm_addr vm_current_address() {
  * list of classes references will do; we can look them up by checking
  * the ref->header.name
  */
-#define MAX_CLASSES 100   // And we will behave very badly if you have more
+#define MAX_CLASSES 1024   // And we will behave very badly if you have more
 class_ref loaded_classes[MAX_CLASSES];
 static int n_classes_loaded;
 
@@ -118,38 +124,10 @@ class_ref ensure_loaded(char *class_name) {
 
 
 
-// Capacity limit:  For simplicity we read into a
-// buffer of 20k bytes.
-//
-#define FILE_BUFFER_CAPACITY (1024 * 100 * sizeof(char))
-
-
-/* read_file_fd
- * returns 0 (failure) or 1 (success)
- */
-int read_file_fd(FILE *fd, char *file_buffer) {
-    int pos = 0;
-    char ch;
-    /* Simple, not efficient. */
-    while (1) {
-        ch = fgetc(fd);
-        if (feof(fd)) {
-            break;
-        } else if (ferror(fd)) {
-            perror("Error reading file");
-            break;
-        }
-        file_buffer[pos++] = ch;
-    }
-    // Do we need to add the null byte?  Maybe.
-    file_buffer[pos] = 0;
-    return 1;
-}
-
-vm_Word *translate_method_code(cJSON *ops, int const_map[], class_ref class_map[]);
+/* ---------- Class creation, shared by both object formats ---------- */
 
 /*
- * Constants in a class file (.json) are referenced as small
+ * Constants in a class file are referenced as small
  * (non-negative) integer indexes
  * in a per-class "constant pool", or a fixed set of
  * negative integers (-1 .. -3 currently) for named literals.
@@ -158,6 +136,160 @@ vm_Word *translate_method_code(cJSON *ops, int const_map[], class_ref class_map[
  * (Java, in contrast, maintains a separate constant pool for each
  * class at run-time.)
  */
+static int remap_constant(char kind, char *literal) {
+    int internal = 0;
+    if (kind == 'i') {
+        internal = int_literal_const(literal);
+    } else if (kind == 's') {
+        internal = str_literal_const(strdup(literal));
+    } else {
+        perror("Constant of unknown type");
+    }
+    return internal;
+}
+
+/* Create the class object, with inherited methods copied
+ * into its vtable, and enter it in the loaded classes table.
+ */
+static class_ref create_class(char *class_name, class_ref the_super,
+                              int n_fields, int n_methods, int n_inherited) {
+    assert(the_super); // Error if we can't find the superclass
+    log_info("Class %s extends %s", class_name, the_super->header.class_name);
+    log_info("Class %s has %d methods and %d fields",
+             class_name, n_methods, n_fields);
+    size_t class_obj_size =
+            sizeof(struct class_header_struct)
+            + n_methods * sizeof(vm_Word);
+    size_t obj_size = sizeof(struct obj_header_struct) + n_fields * sizeof(vm_Word);
+    class_ref the_class = (class_ref) malloc(class_obj_size);
+    the_class->header = (struct class_header_struct) {
+            .class_name = strdup(class_name),
+            .healthy_class_tag = HEALTHY,
+            .n_fields = n_fields,
+            .object_size = obj_size,
+            .super = the_super
+    };
+    log_debug("Class %s class object size %d with %d methods",
+             class_name, class_obj_size, n_methods);
+    log_debug("Objects of %s size %d with %d fields",
+            class_name,  obj_size, n_fields);
+    log_debug("Size of object header alone is %d bytes\n",
+             sizeof(struct obj_header_struct));
+    // Copy inherited method pointers into vtable
+    for (int i = 0; i < n_inherited; ++i) {
+        the_class->vtable[i] = the_super->vtable[i];
+    }
+    set_loaded(the_class);
+    // We want the class in the "loaded classes" table before loading
+    // methods, because the methods might have references to the current class.
+    return the_class;
+}
+
+/* Translate method code (opcodes and operands from the object file)
+ * into vm instructions at the current load address.  Constants must
+ * be renumbered since local constant number is not global constant
+ * number, and class indexes become class references.
+ */
+/* The loaded form of an operand of operation op:  constants
+ * are renumbered in the run-time constant pool, and classes
+ * become class pointers.
+ */
+static vm_Word translate_operand(vm_Instr op, int operand,
+                                 int const_map[], class_ref class_map[]) {
+    if (op == vm_op_const) {
+        int const_index;
+        if (operand == CODE_FALSE) {
+            const_index = lookup_const_index("$false");
+        } else if (operand == CODE_TRUE) {
+            const_index = lookup_const_index("$true");
+        } else if (operand == CODE_NOTHING) {
+            const_index = lookup_const_index("$nothing");
+        } else {
+            assert(operand >= 0);
+            const_index = const_map[operand];
+        }
+        assert(const_index);
+        check_health_object(get_const_value(const_index));
+        return (vm_Word) {.intval = const_index};
+    }
+    if (op == vm_op_new || op == vm_op_is_instance) {
+        class_ref clazz = class_map[operand];
+        log_debug("Translating allocation of new '%s'",
+                  clazz->header.class_name);
+        return (vm_Word) {.clazz = clazz};
+    }
+    return (vm_Word) {.intval = operand};
+}
+
+/* Code of a class the assembler verified (see "Verification" in
+ * assemble.py) runs the unchecked forms of operations, in a VM
+ * built with VM_UNCHECKED; otherwise all code runs checked.
+ */
+static vm_Word *translate_method_code(const int32_t ops[], int n_ops,
+                                      int const_map[], class_ref class_map[],
+                                      int verified) {
+    vm_Word *method_start_address = vm_current_address();
+    for (int i = 0; i < n_ops; ++i) {
+        int opcode = ops[i];
+        op_tbl_entry *entry = &vm_op_bytecodes[opcode];
+        log_debug("[%d] Op: %d (%s)",
+               vm_current_address() - vm_code_block,
+               opcode, entry->name);
+#ifdef VM_UNCHECKED
+        vm_Instr instr = verified ? entry->unchecked : entry->instr;
+#else
+        vm_Instr instr = entry->instr;
+#endif
+        vm_code_block[vm_code_index++] = (vm_Word) {.instr = instr};
+        /* Each operation has at most one operand, but a
+         * superinstruction has the operands of all its parts.
+         */
+        for (int p = 0; p < entry->n_parts; ++p) {
+            op_tbl_entry *part = &vm_op_bytecodes[entry->parts[p]];
+            if (part->n_operands) {
+                assert(i + 1 < n_ops);
+                int operand = ops[++i];
+                log_debug("[%d] Operand: %d",
+                          vm_current_address() - vm_code_block,
+                          operand);
+                vm_code_block[vm_code_index++] =
+                        translate_operand(part->instr, operand, const_map, class_map);
+            }
+        }
+    }
+#ifdef VM_UNCHECKED
+    if (verified) {
+        memset(&vm_code_verified[method_start_address - vm_code_block], 1,
+               vm_current_address() - method_start_address);
+    }
+#endif
+    return method_start_address;
+}
+
+/* Is there room in the code block for a method of n_words?
+ * A class file is checked method by method, because loading
+ * its imports moves the load address along first.
+ */
+static int code_fits(const char *class_name, const char *method_name, int n_words) {
+    if (n_words > CODE_CAPACITY - vm_code_index) {
+        log_error("No room to load %s:%s (%d words); the code block "
+                  "holds %d words", class_name, method_name, n_words, CODE_CAPACITY);
+        return 0;
+    }
+    return 1;
+}
+
+/* Frame size the assembler computed for the method loaded at
+ * method_start (see vm_state.h); 0 if it did not know.
+ */
+static void set_frame_size(vm_addr method_start, int frame_size) {
+    vm_frame_size[method_start - vm_code_block] = frame_size;
+    log_debug("Method at %d needs %d frame words",
+              method_start - vm_code_block, frame_size);
+}
+
+/* ---------- JSON object files (for debugging) ---------- */
+
 static int remap_constants(int map[], cJSON *tree, int capacity) {
     cJSON *constants = cJSON_GetObjectItemCaseSensitive(tree,
                                            "constants");
@@ -172,14 +304,7 @@ static int remap_constants(int map[], cJSON *tree, int capacity) {
         cJSON *value_el = cJSON_GetObjectItemCaseSensitive(el, "value");
         char *kind = kind_el->valuestring;
         char *literal = value_el->valuestring;
-        int internal;
-        if (kind[0] == 'i') {
-            internal = int_literal_const(literal);
-        } else if (kind[0] == 's') {
-            internal = str_literal_const(strdup(literal));
-        } else {
-            perror("Constant of unknown type");
-        }
+        int internal = remap_constant(kind[0], literal);
         map[literal_count] = internal;
         log_debug("Literal %s internal %d remapped to %d",
                   literal, literal_count, internal);
@@ -216,74 +341,47 @@ static int map_classes(class_ref class_map[], cJSON *tree, int capacity) {
 }
 
 
-static int load_json(char buf[]) {
+static int load_json(const char buf[], size_t length) {
     cJSON *tree = NULL; // Tree as a whole
-    cJSON *val = NULL;  // Named value in tree
     cJSON *el = NULL;   // Element of value
-    tree = cJSON_Parse(buf);  // Must free at end
+    tree = cJSON_ParseWithLength(buf, length);  // Must free at end
     if (tree == NULL) {
         perror("load_json in vm_loader.c: Failed to parse buffer. ");
         assert(tree);  // Will definitely abort
     }
 
-    /* module constant index -> global constant index */
-    int constant_renumber_map[30];
-    int n_consts = remap_constants(constant_renumber_map, tree, 30);
+    /* module constant index -> global constant index.
+     * The assembler interns literals, so a class has at most one
+     * entry per distinct literal, and they must all fit in the pool.
+     */
+    int constant_renumber_map[CONST_POOL_CAPACITY];
+    int n_consts = remap_constants(constant_renumber_map, tree,
+                                   CONST_POOL_CAPACITY);
 
     // Mapping imported classes was here; moving AFTER we
     // create and index this class so that it can reference itself
 
     // Create and initialize a class object
-    // push_log_level(DEBUG);
     char *class_name = cJSON_GetStringValue(
             cJSON_GetObjectItemCaseSensitive(tree, "class_name"));
     char *super_name = cJSON_GetStringValue(
             cJSON_GetObjectItemCaseSensitive(tree, "super"));
-    log_info("Class %s extends %s", class_name, super_name);
     // Counts of methods and fields; I'm letting the assembler do the work here.
     int n_fields = (int) cJSON_GetNumberValue(
             cJSON_GetObjectItemCaseSensitive(tree, "n_fields"));
     int n_methods = (int) cJSON_GetNumberValue(
             cJSON_GetObjectItemCaseSensitive(tree, "n_methods"));
-    log_info("Class %s has %d methods and %d fields",
-             class_name, n_methods, n_fields);
-    size_t class_obj_size =
-            sizeof(struct class_header_struct)
-            + n_methods * sizeof(vm_Word);
-    size_t obj_size = sizeof(struct obj_header_struct) + n_fields * sizeof(vm_Word);
-    class_ref the_super = ensure_loaded(super_name);
-    assert(the_super); // Error if we can't find the superclass
-    class_ref the_class = (class_ref) malloc(class_obj_size);
-    the_class->header = (struct class_header_struct) {
-            .class_name = strdup(class_name),
-            .healthy_class_tag = HEALTHY,
-            .n_fields = n_fields,
-            .object_size = obj_size,
-            .super = the_super
-    };
-    log_debug("Class %s class object size %d with %d methods",
-             class_name, class_obj_size, n_methods);
-    log_debug("Objects of %s size %d with %d fields",
-            class_name,  obj_size, n_fields);
-    log_debug("Size of object header alone is %d bytes\n",
-             sizeof(struct obj_header_struct));
-    // Copy inherited method pointers into vtable
     int n_inherited = (int) cJSON_GetNumberValue(
             cJSON_GetObjectItemCaseSensitive(tree, "n_inherited"));
-    for (int i = 0; i < n_inherited; ++i) {
-        the_class->vtable[i] = the_super->vtable[i];
-    }
-    //pop_log_level();
-
-    set_loaded(the_class);
-    // We want the class in the "loaded classes" table before loading
-    // methods, because the methods might have references to the current class.
+    class_ref the_class = create_class(class_name, ensure_loaded(super_name),
+                                       n_fields, n_methods, n_inherited);
 
     /* module class index -> class reference,
     * with potential side effect of loading more class files.
     */
-    class_ref class_map[30];
-    int n_classes = map_classes(class_map, tree, 30);
+    class_ref class_map[MAX_CLASSES];
+    int n_classes = map_classes(class_map, tree, MAX_CLASSES);
+    int verified = cJSON_IsTrue(cJSON_GetObjectItemCaseSensitive(tree, "verified"));
 
 
     cJSON *code_table = cJSON_GetObjectItemCaseSensitive(tree, "code");
@@ -295,99 +393,322 @@ static int load_json(char buf[]) {
         int method_slot = (int) cJSON_GetNumberValue(
                 cJSON_GetObjectItemCaseSensitive(el, "slot"));
         cJSON *ops = cJSON_GetObjectItemCaseSensitive(el, "code");
+        assert (cJSON_IsArray(ops));
+        int n_ops = cJSON_GetArraySize(ops);
+        if (!code_fits(class_name, method_name, n_ops)) {
+            cJSON_Delete(tree);
+            return 0;
+        }
+        int32_t *words = malloc((n_ops + 1) * sizeof(int32_t));
+        int i = 0;
+        cJSON *op;
+        cJSON_ArrayForEach(op, ops) {
+            assert(cJSON_IsNumber(op));
+            words[i++] = op->valueint;
+        }
         vm_Word *method_start_addr =
-                translate_method_code(ops, constant_renumber_map, class_map);
+                translate_method_code(words, n_ops, constant_renumber_map, class_map,
+                                      verified);
+        free(words);
+        cJSON *frame_size = cJSON_GetObjectItemCaseSensitive(el, "frame_size");
+        if (cJSON_IsNumber(frame_size)) {
+            set_frame_size(method_start_addr, frame_size->valueint);
+        }
+        vm_profile_method_loaded(class_name, method_name, method_start_addr,
+                                 vm_current_address() - method_start_addr);
         the_class->vtable[method_slot] = method_start_addr;
     }
     cJSON_Delete(tree);
     return 1;
 }
 
-vm_Word *translate_method_code(cJSON *ops, int const_map[], class_ref class_map[]) {
-    // Translating code.  Constants must be renumbered since local
-    // constant number is not global constant number.
-    assert (cJSON_IsArray(ops));
-    cJSON *el = ops->child;
-    vm_Word *method_start_address = vm_current_address();
-    while (el) {
-        assert(cJSON_IsNumber(el));
-        int opcode = el->valueint;
-        log_debug("[%d] Op: %d (%s)",
-               vm_current_address() - vm_code_block,
-               opcode, vm_op_bytecodes[opcode].name);
-        vm_code_block[vm_code_index++] = (vm_Word)
-                {.instr = vm_op_bytecodes[opcode].instr};
-
-        if (vm_op_bytecodes[opcode].n_operands) {
-            // Max is 1 operand!
-            el = el->next;
-            int operand = el->valueint;
-            log_debug("[%d] Operand: %d",
-                      vm_current_address() - vm_code_block,
-                      operand);
-            if (vm_op_bytecodes[opcode].instr == vm_op_const) {
-                int const_index;
-                if (operand == CODE_FALSE) {
-                    const_index = lookup_const_index("$false");
-                } else if (operand == CODE_TRUE) {
-                    const_index = lookup_const_index("$true");
-                } else if (operand == CODE_NOTHING) {
-                    const_index = lookup_const_index("$nothing");
-                } else {
-                    assert(operand >= 0);
-                    const_index = const_map[operand];
-                }
-                assert(const_index);
-                check_health_object(get_const_value(const_index));
-                vm_code_block[vm_code_index++] = (vm_Word)
-                        {.intval=  const_index};
-            } else if(vm_op_bytecodes[opcode].instr == vm_op_new
-                      || vm_op_bytecodes[opcode].instr == vm_op_is_instance) {
-                class_ref clazz = class_map[operand];
-                log_debug("Translating allocation of new '%s'",
-                          clazz->header.class_name);
-                vm_code_block[vm_code_index++] = (vm_Word)
-                        {.clazz = clazz};
-            } else {
-                vm_code_block[vm_code_index++] = (vm_Word)
-                        {.intval = operand};
-            }
+/* ---------- Binary object files (see vm_objfile.h) ---------- */
+
+/* Is the table of n items of item_size at offset within the image? */
+static int in_image(size_t image_size, int32_t offset, int32_t n, size_t item_size) {
+    return offset >= 0 && n >= 0
+           && (size_t) offset + (size_t) n * item_size <= image_size;
+}
+
+static int load_binary(const char *image, size_t size) {
+    const tvm_objfile_header *h = (const tvm_objfile_header *) image;
+    if (size < sizeof(tvm_objfile_header)
+        || h->version != TVM_OBJFILE_VERSION
+        || !in_image(size, h->strings_off, h->n_strings, sizeof(int32_t))
+        || !in_image(size, h->imports_off, h->n_imports, sizeof(int32_t))
+        || !in_image(size, h->constants_off, h->n_constants,
+                     sizeof(tvm_objfile_constant))
+        || h->code_method_size < TVM_OBJFILE_METHOD_V1_SIZE
+        || !in_image(size, h->code_methods_off, h->n_code_methods,
+                     h->code_method_size)
+        || !in_image(size, h->code_off, h->n_code_words, sizeof(int32_t))
+        || h->n_constants > CONST_POOL_CAPACITY
+        || h->n_imports > MAX_CLASSES) {
+        log_error("Malformed or incompatible binary object file");
+        return 0;
+    }
+    const int32_t *string_offsets = (const int32_t *) (image + h->strings_off);
+#define OBJ_STRING(i) ((char *) (image + string_offsets[i]))
+
+    /* module constant index -> global constant index */
+    int constant_renumber_map[CONST_POOL_CAPACITY];
+    const tvm_objfile_constant *constants =
+            (const tvm_objfile_constant *) (image + h->constants_off);
+    for (int i = 0; i < h->n_constants; ++i) {
+        constant_renumber_map[i] = remap_constant(
+                (char) constants[i].kind, OBJ_STRING(constants[i].value));
+        log_debug("Literal %s internal %d remapped to %d",
+                  OBJ_STRING(constants[i].value), i, constant_renumber_map[i]);
+    }
+
+    class_ref the_class = create_class(
+            OBJ_STRING(h->class_name), ensure_loaded(OBJ_STRING(h->super_name)),
+            h->n_fields, h->n_methods, h->n_inherited);
+
+    /* module class index -> class reference,
+     * with potential side effect of loading more class files.
+     */
+    class_ref class_map[MAX_CLASSES];
+    const int32_t *imports = (const int32_t *) (image + h->imports_off);
+    for (int i = 0; i < h->n_imports; ++i) {
+        class_map[i] = ensure_loaded(OBJ_STRING(imports[i]));
+    }
+
+    const int32_t *code = (const int32_t *) (image + h->code_off);
+    for (int i = 0; i < h->n_code_methods; ++i) {
+        const tvm_objfile_method *method = (const tvm_objfile_method *)
+                (image + h->code_methods_off + i * h->code_method_size);
+        assert(method->code_start >= 0
+               && method->code_start + method->code_length <= h->n_code_words);
+        assert(method->slot >= 0 && method->slot < h->n_methods);
+        if (!code_fits(OBJ_STRING(h->class_name), OBJ_STRING(method->name),
+                       method->code_length)) {
+            return 0;
         }
-        el = el->next;
+        the_class->vtable[method->slot] = translate_method_code(
+                code + method->code_start, method->code_length,
+                constant_renumber_map, class_map,
+                h->flags & TVM_OBJFILE_VERIFIED);
+        if (h->code_method_size >= (int32_t) sizeof(tvm_objfile_method)) {
+            set_frame_size(the_class->vtable[method->slot], method->frame_size);
+        }
+        vm_profile_method_loaded(OBJ_STRING(h->class_name), OBJ_STRING(method->name),
+                                 the_class->vtable[method->slot],
+                                 vm_current_address() - the_class->vtable[method->slot]);
     }
-    return method_start_address;
+#undef OBJ_STRING
+    return 1;
 }
 
 
+/* ---------- Prelinked program images (see vm_objfile.h) ---------- */
+
+/* A constant for a literal the linker merged with its duplicates,
+ * so unlike remap_constant we need not look for it in the pool
+ */
+static int image_constant(char kind, char *literal) {
+    obj_ref value;
+    if (kind == 'i') {
+        value = new_int(atoi(literal));
+    } else {
+        assert(kind == 's');
+        value = new_string(strdup(literal));
+    }
+    return create_const_value(literal, value);
+}
 
-/* Load an "object" file (json format) from
- * a class name.
+/* Everything in an image is linked already, so we make each of
+ * its literals a constant, create its classes in order, translate
+ * all of its code, and fill in the vtables, all without looking
+ * anything up by name except the built-in classes.
  */
+static class_ref load_image(const char *image, size_t size) {
+    const tvm_image_header *h = (const tvm_image_header *) image;
+    if (size < sizeof(tvm_image_header)
+        || h->version != TVM_IMAGE_VERSION
+        || !in_image(size, h->strings_off, h->n_strings, sizeof(int32_t))
+        || !in_image(size, h->classes_off, h->n_classes, sizeof(tvm_image_class))
+        || !in_image(size, h->constants_off, h->n_constants,
+                     sizeof(tvm_objfile_constant))
+        || !in_image(size, h->methods_off, h->n_methods, sizeof(tvm_image_method))
+        || !in_image(size, h->vtables_off, h->n_vtable_words, sizeof(int32_t))
+        || !in_image(size, h->code_off, h->n_code_words, sizeof(int32_t))
+        || h->n_constants > CONST_POOL_CAPACITY
+        || h->n_code_words > CODE_CAPACITY - vm_code_index
+        || h->n_classes + n_classes_loaded >= MAX_CLASSES
+        || h->main_class < 0 || h->main_class >= h->n_classes) {
+        log_error("Malformed or incompatible program image");
+        return 0;
+    }
+    const int32_t *string_offsets = (const int32_t *) (image + h->strings_off);
+#define IMAGE_STRING(i) ((char *) (image + string_offsets[i]))
+
+    /* image constant index -> global constant index */
+    int constant_renumber_map[CONST_POOL_CAPACITY];
+    const tvm_objfile_constant *constants =
+            (const tvm_objfile_constant *) (image + h->constants_off);
+    for (int i = 0; i < h->n_constants; ++i) {
+        constant_renumber_map[i] = image_constant(
+                (char) constants[i].kind, IMAGE_STRING(constants[i].value));
+    }
+
+    /* image class index -> class reference; each class
+     * comes after its superclass
+     */
+    class_ref class_map[MAX_CLASSES];
+    const tvm_image_class *classes = (const tvm_image_class *) (image + h->classes_off);
+    for (int i = 0; i < h->n_classes; ++i) {
+        const tvm_image_class *c = &classes[i];
+        if (c->flags & TVM_IMAGE_BUILTIN) {
+            class_map[i] = find_loaded(IMAGE_STRING(c->name));
+            if (!class_map[i]) {
+                log_error("%s is not a built-in class", IMAGE_STRING(c->name));
+                return 0;
+            }
+            continue;
+        }
+        assert(c->super >= 0 && c->super < i);
+        assert(c->vtable >= 0 && c->vtable + c->n_methods <= h->n_vtable_words);
+        class_map[i] = create_class(IMAGE_STRING(c->name), class_map[c->super],
+                                    c->n_fields, c->n_methods, c->n_inherited);
+    }
+
+    /* All the code, in one piece */
+    vm_addr code_base = vm_current_address();
+    const int32_t *code = (const int32_t *) (image + h->code_off);
+    const tvm_image_method *methods =
+            (const tvm_image_method *) (image + h->methods_off);
+    for (int i = 0; i < h->n_methods; ++i) {
+        const tvm_image_method *method = &methods[i];
+        assert(method->clazz >= 0 && method->clazz < h->n_classes);
+        assert(method->code_start >= 0
+               && method->code_start + method->code_length <= h->n_code_words);
+        const tvm_image_class *c = &classes[method->clazz];
+        vm_addr method_start = translate_method_code(
+                code + method->code_start, method->code_length,
+                constant_renumber_map, class_map, c->flags & TVM_OBJFILE_VERIFIED);
+        assert(method_start == code_base + method->code_start);
+        set_frame_size(method_start, method->frame_size);
+        vm_profile_method_loaded(IMAGE_STRING(c->name), IMAGE_STRING(method->name),
+                                 method_start, method->code_length);
+    }
+
+    /* Vtables, where methods inherited from built-in classes
+     * are already in place (create_class copied them)
+     */
+    const int32_t *vtables = (const int32_t *) (image + h->vtables_off);
+    for (int i = 0; i < h->n_classes; ++i) {
+        const tvm_image_class *c = &classes[i];
+        if (c->flags & TVM_IMAGE_BUILTIN) {
+            continue;
+        }
+        for (int slot = 0; slot < c->n_methods; ++slot) {
+            int32_t offset = vtables[c->vtable + slot];
+            if (offset >= 0) {
+                class_map[i]->vtable[slot] = code_base + offset;
+            } else if (slot >= c->n_inherited) {
+                class_map[i]->vtable[slot] = NULL;  // Declared, never defined
+            }
+        }
+    }
+#undef IMAGE_STRING
+    return class_map[h->main_class];
+}
+
+
 #define PATHBUFSIZE 4096
+
+/* Is a modified after b? */
+static int newer(struct timespec a, struct timespec b) {
+    return a.tv_sec > b.tv_sec || (a.tv_sec == b.tv_sec && a.tv_nsec > b.tv_nsec);
+}
+
+/* Load an object file from a class name, preferring the
+ * binary form (.tvm) and falling back to JSON.  If both are
+ * there and the JSON form is newer, the binary form is stale:
+ * warn and load the JSON form (as objfile.find_object does).
+ */
 extern int vm_load_class(char *classname) {
     char load_path[PATHBUFSIZE];
+    char json_path[PATHBUFSIZE];
+    struct stat tvm_stat, json_stat;
     // Use printf for multi-concat
-    snprintf(load_path, PATHBUFSIZE, "%s/%s.json", PATH_PREFIX, classname);
+    snprintf(load_path, PATHBUFSIZE, "%s/%s.tvm", PATH_PREFIX, classname);
+    snprintf(json_path, PATHBUFSIZE, "%s/%s.json", PATH_PREFIX, classname);
+    if (access(load_path, R_OK) != 0) {
+        strcpy(load_path, json_path);
+    } else if (stat(load_path, &tvm_stat) == 0 && stat(json_path, &json_stat) == 0
+               && newer(json_stat.st_mtim, tvm_stat.st_mtim)) {
+        log_warn("%s is older than %s; using %s", load_path, json_path, json_path);
+        strcpy(load_path, json_path);
+    }
     log_info("Loading %s", load_path);
     return vm_load_from_path(load_path);
 }
 
 
-int vm_load_from_path(char *path) {
-    char file_buffer[FILE_BUFFER_CAPACITY];
-    FILE *fd = fopen(path, "r");
-    if (! fd) {
+/* Map the whole file into memory (read only), or NULL */
+static char *map_file(char *path, size_t *size) {
+    int fd = open(path, O_RDONLY);
+    if (fd < 0) {
         perror("Failed to open file");
+        return NULL;
+    }
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size == 0) {
+        perror("Failed to read file");
+        close(fd);
+        return NULL;
+    }
+    *size = (size_t) st.st_size;
+    char *image = mmap(NULL, *size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (image == MAP_FAILED) {
+        perror("Failed to map file");
+        return NULL;
+    }
+    return image;
+}
+
+/* Load from a mapping of the whole file; binary object files
+ * are recognized by their magic number, anything else is
+ * taken to be JSON.
+ */
+int vm_load_from_path(char *path) {
+    size_t size;
+    char *image = map_file(path, &size);
+    if (image == NULL) {
         return 0;
     }
     int ok;
-    ok = read_file_fd(fd, file_buffer);
-    if (ok) {
-        cJSON *jobj = cJSON_Parse(file_buffer);
-        ok = (jobj != NULL);
+    if (size >= 4 && memcmp(image, TVM_OBJFILE_MAGIC, 4) == 0) {
+        ok = load_binary(image, size);
+    } else {
+        ok = load_json(image, size);
     }
+    munmap(image, size);
     assert(ok);
-    ok = load_json(file_buffer);
-    fclose(fd);
     return ok;
 }
+
+/* Load a prelinked program image (link.py) and make
+ * its main class the one to run.
+ */
+int vm_load_image(char *path) {
+    size_t size;
+    char *image = map_file(path, &size);
+    if (image == NULL) {
+        return 0;
+    }
+    class_ref main_class = 0;
+    if (size >= 4 && memcmp(image, TVM_IMAGE_MAGIC, 4) == 0) {
+        main_class = load_image(image, size);
+    } else {
+        log_error("%s is not a program image", path);
+    }
+    munmap(image, size);
+    if (main_class) {
+        vm_loader_set_main(main_class->header.class_name);
+    }
+    return main_class != 0;
+}
@@ -24,16 +24,21 @@ void vm_loader_set_main(char *main_class_name);
  */
 extern class_ref find_loaded(char *name);
 
-/* Load an "object" file (json format) from
- * a class name.
+/* Load an "object" file from a class name:
+ * Class.tvm (binary) if present, otherwise Class.json.
  */
 extern int vm_load_class(char *classname);
 
-/* Load an "object" file, which should be in JSON format.
- * Return 1 = success, 0 = failure.
+/* Load an "object" file, in binary (see vm_objfile.h)
+ * or JSON format.  Return 1 = success, 0 = failure.
  */
 extern int vm_load_from_path(char *path);
 
+/* Load a whole program, prelinked by link.py (see vm_objfile.h),
+ * and set its main class to run.  Return 1 = success, 0 = failure.
+ */
+extern int vm_load_image(char *path);
+
 /* Constants in method bytecode will be small non-negative
  * integers corresponding to the "constants" list in the
  * object code json, or chosen from this fixed set of
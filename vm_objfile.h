@@ -0,0 +1,130 @@
+/* Binary object file format ("TVMO"), written by assemble.py
+ * (see objfile.py) and read by the loader.
+ *
+ * The file is designed to be memory-mapped and used in place:
+ * a fixed header gives the position of each table, all integers
+ * are 32-bit little-endian, and every table starts on a 4-byte
+ * boundary.  Strings are NUL-terminated UTF-8, referred to
+ * everywhere by their index in the string table.  The assembler
+ * writes the code first, right after the header, as it finishes
+ * each method, and the other tables after it; the loader goes
+ * only by the offsets in the header.
+ *
+ * NOTE:  The layout MUST be consistent between the
+ * loader (here) and the assembler (objfile.py).
+ */
+
+#ifndef TINY_VM_VM_OBJFILE_H
+#define TINY_VM_VM_OBJFILE_H
+
+#include <stdint.h>
+
+#define TVM_OBJFILE_MAGIC "TVMO"
+#define TVM_OBJFILE_VERSION 1
+
+typedef struct {
+    char magic[4];          // TVM_OBJFILE_MAGIC, not NUL-terminated
+    int32_t version;        // TVM_OBJFILE_VERSION
+    int32_t flags;          // TVM_OBJFILE_VERIFIED, or 0
+    int32_t class_name;     // String index
+    int32_t super_name;     // String index
+    int32_t n_fields;
+    int32_t n_methods;      // Size of the vtable
+    int32_t n_inherited;
+    int32_t n_strings;
+    int32_t strings_off;    // int32 file offset of each string
+    int32_t n_imports;
+    int32_t imports_off;    // int32 string index of each imported class
+    int32_t method_names_off;   // int32 string index [n_methods]
+    int32_t field_names_off;    // int32 string index [n_fields]
+    int32_t n_constants;
+    int32_t constants_off;  // tvm_objfile_constant [n_constants]
+    int32_t n_code_methods;
+    int32_t code_methods_off;   // Method records, code_method_size bytes each
+    int32_t code_method_size;   // Lets later versions append fields
+                                // (16 bytes before arity was added)
+    int32_t n_code_words;
+    int32_t code_off;       // int32 [n_code_words], all methods' code
+} tvm_objfile_header;
+
+typedef struct {
+    int32_t kind;           // 'i' or 's'
+    int32_t value;          // String index of the literal text
+} tvm_objfile_constant;
+
+typedef struct {
+    int32_t name;           // String index
+    int32_t slot;           // Position in vtable
+    int32_t code_start;     // Index of first word in code table
+    int32_t code_length;    // Number of words
+    int32_t arity;          // Number of arguments
+    int32_t max_stack;      // Deepest evaluation stack above the locals
+    int32_t frame_size;     // Words from fp up, including the above; 0 if not known
+} tvm_objfile_method;
+
+/* Header flags */
+#define TVM_OBJFILE_VERIFIED 1  // The assembler's verifier accepted every method
+
+/* Size of method records without arity, max_stack, and frame_size */
+#define TVM_OBJFILE_METHOD_V1_SIZE 16
+
+/* ---------- Prelinked program images ("TVMP") ----------
+ *
+ * link.py combines the object files of a whole program (the
+ * main class and every class it reaches) into one image, laid
+ * out like an object file.  Linking is already done:  class
+ * operands are indexes in the image's class table, in which
+ * each class follows its superclass, constant operands index
+ * the merged constant pool, and each class has its complete
+ * vtable.  Code words are the same operation codes as in object
+ * files, all methods in one table.
+ *
+ * NOTE:  The layout MUST be consistent between the
+ * loader and the linker (link.py).
+ */
+
+#define TVM_IMAGE_MAGIC "TVMP"
+#define TVM_IMAGE_VERSION 1
+
+typedef struct {
+    char magic[4];          // TVM_IMAGE_MAGIC, not NUL-terminated
+    int32_t version;        // TVM_IMAGE_VERSION
+    int32_t main_class;     // Class index
+    int32_t n_strings;
+    int32_t strings_off;    // int32 file offset of each string
+    int32_t n_classes;
+    int32_t classes_off;    // tvm_image_class [n_classes]
+    int32_t n_constants;
+    int32_t constants_off;  // tvm_objfile_constant [n_constants]
+    int32_t n_methods;
+    int32_t methods_off;    // tvm_image_method [n_methods]
+    int32_t n_vtable_words;
+    int32_t vtables_off;    // int32 code offset of each method, or -1
+    int32_t n_code_words;
+    int32_t code_off;       // int32 [n_code_words], all methods' code
+} tvm_image_header;
+
+/* Class flags; also TVM_OBJFILE_VERIFIED */
+#define TVM_IMAGE_BUILTIN 2     // Built into the VM; only the name is used
+
+typedef struct {
+    int32_t name;           // String index
+    int32_t super;          // Class index (earlier), or -1 if built in
+    int32_t flags;
+    int32_t n_fields;
+    int32_t n_methods;      // Size of the vtable
+    int32_t n_inherited;
+    int32_t vtable;         // Index in vtables of its slot 0; for each
+                            // slot, the method's code offset, or -1
+                            // where the superclass's method (built in)
+} tvm_image_class;
+
+typedef struct {
+    int32_t clazz;          // Class index
+    int32_t name;           // String index
+    int32_t code_start;     // Index of first word in code table
+    int32_t code_length;    // Number of words
+    int32_t frame_size;     // As in tvm_objfile_method
+} tvm_image_method;
+
+#endif //TINY_VM_VM_OBJFILE_H
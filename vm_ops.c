@@ -5,23 +5,37 @@
 #include "vm_ops.h"
 #include "vm_state.h"
 #include "builtins.h"  // For literals lit_true, lit_false, nothing
+#include "vm_profile.h"
 #include "logger.h"
 #include <stdlib.h>
 #include <stdio.h>
 #include <assert.h>
 
+/* Operations that check the health (or type) of what they
+ * handle have a second, unchecked form, vm_op_<name>_unchecked,
+ * which the loader uses for classes the assembler verified
+ * (see opdefs.txt and VM_UNCHECKED in vm_loader.c).  Both forms
+ * share one body, op_<name>(checked); with checked a constant,
+ * the compiler drops the checks from the unchecked form.
+ */
+#define CHECK(x) do { if (checked) { x; } } while (0)
+#define UNCHECKED_FORM(name) \
+    void vm_op_##name(void) { op_##name(1); } \
+    void vm_op_##name##_unchecked(void) { op_##name(0); }
+
 /*  Push inline constant (by constant table index).
  *  The constant is not CREATED here; it is REFERENCED here.
  *
  * vm_op_const(i): [] -> [ obj_ref ]
  */
-void vm_op_const(void) {
+static inline void op_const(int checked) {
     int inline_const_index = vm_fetch_next().intval;
     obj_ref the_constant = get_const_value(inline_const_index);
-    check_health_object(the_constant);
-    vm_eval_push(the_constant);
+    CHECK(check_health_object(the_constant));
+    vm_frame_push_word((vm_Word) {.obj = the_constant});
     return;
 }
+UNCHECKED_FORM(const)
 
 /* Halt the virtual machine */
 void vm_op_halt(void) {
@@ -42,24 +56,26 @@ extern void vm_op_jump() {
 }
 
 /* Jump if true */
-extern void vm_op_jump_if() {
+static inline void op_jump_if(int checked) {
     int span = vm_fetch_next().intval;
     obj_ref cond = vm_frame_pop_word().obj;
-    assert_is_type(cond, the_class_Boolean);
+    CHECK(assert_is_type(cond, the_class_Boolean));
     if (cond == lit_true) {
         vm_relative_jump(span);
     }
-};
+}
+UNCHECKED_FORM(jump_if)
 
 /* Jump if false */
-extern void vm_op_jump_ifnot() {
+static inline void op_jump_ifnot(int checked) {
     int span = vm_fetch_next().intval;
     obj_ref cond = vm_frame_pop_word().obj;
-    assert_is_type(cond, the_class_Boolean);
+    CHECK(assert_is_type(cond, the_class_Boolean));
     if (cond == lit_false) {
         vm_relative_jump(span);
     }
 }
+UNCHECKED_FORM(jump_ifnot)
 
 /* ========  Linkage instructions =========== */
 
@@ -68,25 +84,42 @@ extern void vm_op_jump_ifnot() {
  * next word in the instruction stream should
  * be the index of the native_method in the vtable.
  */
-extern void vm_op_methodcall(void) {
+static inline void op_methodcall(int checked) {
     int method_index = vm_fetch_next().intval;
     // New "this" will be receiver object
     vm_addr new_fp = vm_sp;
+    // Address of code for called method, found in the
+    // class vtable.
+    obj_ref receiver = (*new_fp).obj;
+    CHECK(check_health_object(receiver));
+    class_ref clazz = receiver->header.clazz;
+    CHECK(check_health_class(clazz));
+    vm_addr method_addr = clazz->vtable[method_index];
+    // The one check that the callee's frame fits (see vm_state.h),
+    // or if we don't know its size, a check at each push
+    int need = vm_frame_need(method_addr);
+    if (need == 0) {
+        if (!vm_frame_unsized_fp) {
+            vm_frame_unsized_fp = new_fp;
+        }
+    } else if (new_fp + need > vm_frame_stack + FRAME_CAPACITY) {
+        log_error("Frame stack overflow calling method %d of %s",
+                  method_index, clazz->header.class_name);
+        vm_run_state = VM_HALTED;
+        return;
+    }
     // Save program counter for return
     vm_frame_push_word((vm_Word) {.code_addr = vm_pc});
     // Save caller's frame pointer
     vm_frame_push_word((vm_Word) {.frame_addr = vm_fp});
     vm_fp = new_fp;
-    // Address of code for called method, found in the
-    // class vtable.
-    obj_ref receiver = (*vm_fp).obj;
-    check_health_object(receiver);
-    class_ref clazz = receiver->header.clazz;
-    check_health_class(clazz);
-    vm_addr method_addr = clazz->vtable[method_index];
     vm_pc = method_addr;
+    if (vm_profile_entries) {
+        vm_profile_sample();
+    }
     return;
 }
+UNCHECKED_FORM(methodcall)
 
 /* Trampoline to a native method.
  * Wrap this inside an interpreted method
@@ -120,22 +153,30 @@ extern void vm_op_enter() {
     stack_dump(10);
 }
 
+extern void vm_op_enter_unchecked() {
+    // Not even the debugging dump
+}
+
 
 
-extern void vm_op_return() {
+static inline void op_return(int checked) {
     // Needs arity to reclaim arguments correctly
     int arity = vm_fetch_next().intval;
-    assert(0 <= arity);   // Sanity check -- arity is non-negative
-    assert(10 >= arity);  // Sanity check --- arity at most 10
+    CHECK(assert(0 <= arity));   // Sanity check -- arity is non-negative
+    CHECK(assert(10 >= arity));  // Sanity check --- arity at most 10
     vm_Word return_value = vm_frame_pop_word();
-    check_health_object(return_value.obj);
+    CHECK(check_health_object(return_value.obj));
     vm_sp = vm_fp + 2;
+    if (vm_fp == vm_frame_unsized_fp) {
+        vm_frame_unsized_fp = NULL;
+    }
     vm_fp = vm_frame_pop_word().frame_addr;
     vm_pc = vm_frame_pop_word().code_addr;
     vm_sp -= arity;
     *vm_sp = return_value;
     return;
 }
+UNCHECKED_FORM(return)
 
 /* The object allocator should be called just before
  * a call to the constructor. It creates an object with the
@@ -163,14 +204,15 @@ extern obj_ref vm_new_obj(class_ref clazz) {
     return new_thing;
 }
 
-extern void vm_op_new(void) {
+static inline void op_new(int checked) {
     class_ref clazz = vm_fetch_next().clazz;
-    check_health_class(clazz);
+    CHECK(check_health_class(clazz));
     obj_ref new_thing = vm_new_obj(clazz);
-    check_health_object(new_thing);
-    vm_eval_push(new_thing);
+    CHECK(check_health_object(new_thing));
+    vm_frame_push_word((vm_Word) {.obj = new_thing});
     return;
 }
+UNCHECKED_FORM(new)
 
 /* is_instance is the other op that takes a class as operand
  * FIXME:  Refactor to reduce duplication with assert_is_type
@@ -196,15 +238,16 @@ int is_instance(obj_ref thing, class_ref clazz) {
     }
  }
 
-extern void vm_op_is_instance(void) {
+static inline void op_is_instance(int checked) {
     class_ref clazz = vm_fetch_next().clazz;
-    check_health_class(clazz);
+    CHECK(check_health_class(clazz));
     if (is_instance(vm_frame_pop_word().obj, clazz)) {
         vm_frame_push_word((vm_Word) lit_true);
     } else {
         vm_frame_push_word((vm_Word) lit_false);
     }
 }
+UNCHECKED_FORM(is_instance)
 
 
 /*
@@ -235,25 +278,27 @@ void vm_op_roll(void) {
  * [] -> [x]
  * FIXME: Refactor stack access into vm_state ?
  */
-extern void vm_op_load() {
+static inline void op_load(int checked) {
     int variable_frame_index = vm_fetch_next().intval;
     obj_ref value = (vm_fp + variable_frame_index)->obj;
-    check_health_object(value);
-    vm_eval_push(value);
+    CHECK(check_health_object(value));
+    vm_frame_push_word((vm_Word) {.obj = value});
     return;
 }
+UNCHECKED_FORM(load)
 
 
 /* Pop top element and store into local variable
  * [x] -> []
  */
-extern void vm_op_store() {
+static inline void op_store(int checked) {
     int variable_frame_index = vm_fetch_next().intval;
-    obj_ref value = vm_eval_pop();
-    check_health_object(value);
+    obj_ref value = vm_frame_pop_word().obj;
+    CHECK(check_health_object(value));
     (vm_fp + variable_frame_index)->obj =  value;
     return;
 }
+UNCHECKED_FORM(store)
 
 /* Allocate stack space for local variables.
  * [] -> [ n, n, ... ]   (As many nothing objects as allocated)
@@ -271,16 +316,17 @@ extern void vm_op_alloc() {
 /* For load, object should be at top of stack.
  * [obj] -> [field]
  * */
-extern void vm_op_load_field() {
+static inline void op_load_field(int checked) {
     int field_slot = vm_fetch_next().intval;
     obj_ref the_obj = vm_frame_pop_word().obj;
-    check_health_object(the_obj);
-    log_debug("Loading field %d from %s object\n", field_slot,
-              the_obj->header.clazz->header.class_name);
+    CHECK(check_health_object(the_obj));
+    CHECK(log_debug("Loading field %d from %s object\n", field_slot,
+                    the_obj->header.clazz->header.class_name));
     obj_ref val = the_obj->fields[field_slot];
-    check_health_object(val);
+    CHECK(check_health_object(val));
     vm_frame_push_word((vm_Word) {.obj=val});
 }
+UNCHECKED_FORM(load_field)
 
 /* For store, push object to be stored into first,
  * then calculate value to store into it.
@@ -290,20 +336,21 @@ extern void vm_op_load_field() {
  * the simplest and most consistent approach for code generation.
  * [val obj] -> []
  */
-extern void vm_op_store_field() {
+static inline void op_store_field(int checked) {
     // push_log_level(DEBUG);
     int field_slot = vm_fetch_next().intval;
     obj_ref target_obj = vm_frame_pop_word().obj;
-    check_health_object(target_obj);
+    CHECK(check_health_object(target_obj));
     obj_ref value = vm_frame_pop_word().obj;
-    check_health_object(value);
-    assert(target_obj->header.clazz->header.n_fields > field_slot);
+    CHECK(check_health_object(value));
+    CHECK(assert(target_obj->header.clazz->header.n_fields > field_slot));
     // If you crash on the assertion above, consider whether target
     // and value are in the right order on the stack.
-    log_debug("Storing value of class %s into field %d of type %s",
-              value->header.clazz->header.class_name,
-              field_slot,
-              target_obj->header.clazz->header.class_name);
+    CHECK(log_debug("Storing value of class %s into field %d of type %s",
+                    value->header.clazz->header.class_name,
+                    field_slot,
+                    target_obj->header.clazz->header.class_name));
     target_obj->fields[field_slot] = value;
     // pop_log_level();
 }
+UNCHECKED_FORM(store_field)
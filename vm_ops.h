@@ -107,5 +107,22 @@ extern void vm_op_load_field();  // Load from field of object
 // store_field n: [value target] -> [], target.fields[n] = value
 extern void vm_op_store_field(); // Store into field of object
 
+/* Unchecked forms, without the health and type checks, for
+ * code the assembler has verified (see the "unchecked" column
+ * of opdefs.txt).  Operations without checks have none.
+ */
+extern void vm_op_const_unchecked(void);
+extern void vm_op_methodcall_unchecked(void);
+extern void vm_op_enter_unchecked(void);
+extern void vm_op_return_unchecked(void);
+extern void vm_op_new_unchecked(void);
+extern void vm_op_is_instance_unchecked(void);
+extern void vm_op_jump_if_unchecked(void);
+extern void vm_op_jump_ifnot_unchecked(void);
+extern void vm_op_load_unchecked(void);
+extern void vm_op_store_unchecked(void);
+extern void vm_op_load_field_unchecked(void);
+extern void vm_op_store_field_unchecked(void);
+
 
 #endif //TINY_VM_VM_OPS_H
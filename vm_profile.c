@@ -0,0 +1,157 @@
+/* Sampling profiler:  counts of call stacks, written at exit.
+ * See vm_profile.h for what a sample is.
+ *
+ * The profile is a text file, one record per line:
+ *     mode interval <n>   or   mode entry
+ *     library <load path>
+ *     method <start> <length> <class> <method>
+ *     stack <count> <pc> <return address> ...   (innermost first)
+ *     dropped <count>     (samples of stacks we had no room for)
+ */
+
+#include "vm_profile.h"
+#include "vm_state.h"
+#include "logger.h"
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+int vm_profile_countdown = 0;
+int vm_profile_entries = 0;
+
+static char *profile_path = NULL;
+static char *profile_library = "";
+static int profile_interval = 0;
+
+typedef struct {
+    long count;         // 0 if the entry is free
+    int depth;
+    int32_t pcs[PROFILE_MAX_DEPTH];
+} profile_stack;
+
+/* Open-addressed hash table of distinct stacks */
+static profile_stack *stacks = NULL;
+static long dropped = 0;
+
+typedef struct {
+    char *class_name;
+    char *method_name;
+    int start;
+    int length;
+} profile_method;
+
+static profile_method *methods = NULL;
+static int n_methods = 0;
+static int methods_capacity = 0;
+
+static int32_t code_offset(vm_addr pc) {
+    if (pc >= vm_code_block && pc < vm_code_block + CODE_CAPACITY) {
+        return (int32_t) (pc - vm_code_block);
+    }
+    return -1;
+}
+
+static uint32_t hash_stack(int32_t pcs[], int depth) {
+    uint32_t h = 2166136261u;   // FNV-1a
+    for (int i = 0; i < depth; ++i) {
+        h = (h ^ (uint32_t) pcs[i]) * 16777619u;
+    }
+    return h;
+}
+
+void vm_profile_sample(void) {
+    int32_t pcs[PROFILE_MAX_DEPTH];
+    int depth = 0;
+    pcs[depth++] = code_offset(vm_pc);
+    /* At fp: receiver, return address, caller's frame pointer.
+     * The outermost frame is above the bottom of the stack.
+     */
+    vm_addr fp = vm_fp;
+    while (fp > vm_frame_stack && depth < PROFILE_MAX_DEPTH) {
+        pcs[depth++] = code_offset(fp[1].code_addr);
+        fp = fp[2].frame_addr;
+    }
+    uint32_t slot = hash_stack(pcs, depth) % PROFILE_MAX_STACKS;
+    for (int probe = 0; probe < PROFILE_MAX_STACKS; ++probe) {
+        profile_stack *entry = &stacks[slot];
+        if (entry->count == 0) {
+            entry->depth = depth;
+            memcpy(entry->pcs, pcs, depth * sizeof(int32_t));
+        }
+        if (entry->depth == depth
+            && memcmp(entry->pcs, pcs, depth * sizeof(int32_t)) == 0) {
+            entry->count += 1;
+            vm_profile_countdown = profile_interval;
+            return;
+        }
+        slot = (slot + 1) % PROFILE_MAX_STACKS;
+    }
+    dropped += 1;
+    vm_profile_countdown = profile_interval;
+}
+
+void vm_profile_method_loaded(char *class_name, char *method_name,
+                              vm_addr start, int length) {
+    if (profile_path == NULL) {
+        return;
+    }
+    if (n_methods == methods_capacity) {
+        methods_capacity = methods_capacity ? 2 * methods_capacity : 64;
+        methods = realloc(methods, methods_capacity * sizeof(profile_method));
+    }
+    methods[n_methods++] = (profile_method) {
+            .class_name = strdup(class_name),
+            .method_name = strdup(method_name),
+            .start = code_offset(start),
+            .length = length
+    };
+}
+
+/* Called at exit, however the program ends */
+static void profile_write(void) {
+    FILE *f = fopen(profile_path, "w");
+    if (f == NULL) {
+        perror("Could not write profile");
+        return;
+    }
+    long samples = 0;
+    if (vm_profile_entries) {
+        fprintf(f, "mode entry\n");
+    } else {
+        fprintf(f, "mode interval %d\n", profile_interval);
+    }
+    fprintf(f, "library %s\n", profile_library);
+    for (int i = 0; i < n_methods; ++i) {
+        fprintf(f, "method %d %d %s %s\n", methods[i].start, methods[i].length,
+                methods[i].class_name, methods[i].method_name);
+    }
+    for (int i = 0; i < PROFILE_MAX_STACKS; ++i) {
+        if (stacks[i].count == 0) {
+            continue;
+        }
+        samples += stacks[i].count;
+        fprintf(f, "stack %ld", stacks[i].count);
+        for (int d = 0; d < stacks[i].depth; ++d) {
+            fprintf(f, " %d", stacks[i].pcs[d]);
+        }
+        fprintf(f, "\n");
+    }
+    fprintf(f, "dropped %ld\n", dropped);
+    fclose(f);
+    log_info("Wrote %ld samples to %s", samples, profile_path);
+}
+
+void vm_profile_start(char *path, int interval, int at_entry,
+                      char *load_library) {
+    profile_path = path;
+    profile_library = load_library;
+    stacks = calloc(PROFILE_MAX_STACKS, sizeof(profile_stack));
+    if (at_entry) {
+        vm_profile_entries = 1;
+    } else {
+        profile_interval = interval > 0 ? interval : PROFILE_DEFAULT_INTERVAL;
+        vm_profile_countdown = profile_interval;
+    }
+    atexit(profile_write);
+}
@@ -0,0 +1,44 @@
+/* Sampling profiler (tiny_vm -p FILE).
+ *
+ * A sample is the call stack at one moment:  the program counter
+ * and the return address in each active frame, as word offsets in
+ * vm_code_block (-1 for code outside it, such as native methods).
+ * We sample either every n instructions or at every method entry,
+ * and count identical stacks together.  When the VM exits we write
+ * the counts, along with where each method was loaded, for
+ * tools/profile_report.py to attribute to methods and (with the
+ * assembler's source maps) to lines.
+ */
+
+#ifndef TINY_VM_VM_PROFILE_H
+#define TINY_VM_VM_PROFILE_H
+
+#include "vm_core.h"
+
+#define PROFILE_DEFAULT_INTERVAL 1000   // Instructions between samples
+#define PROFILE_MAX_DEPTH 64            // Deeper frames are not recorded
+#define PROFILE_MAX_STACKS 4096         // Distinct stacks we can count
+
+/* Instructions until the next periodic sample,
+ * or 0 if we are not sampling periodically.
+ */
+extern int vm_profile_countdown;
+
+/* Nonzero if we sample at each method entry */
+extern int vm_profile_entries;
+
+/* Start profiling, writing to path when the VM exits.
+ * With at_entry, sample at method entries; otherwise
+ * every interval instructions.
+ */
+extern void vm_profile_start(char *path, int interval, int at_entry,
+                             char *load_library);
+
+/* Record the current call stack */
+extern void vm_profile_sample(void);
+
+/* The loader tells us where it put each method */
+extern void vm_profile_method_loaded(char *class_name, char *method_name,
+                                     vm_addr start, int length);
+
+#endif //TINY_VM_VM_PROFILE_H
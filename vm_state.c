@@ -5,6 +5,7 @@
 
 #include "vm_state.h"
 #include "vm_code_table.h"
+#include "vm_profile.h"
 #include "logger.h"
 #include "builtins.h"  // For debugging only
 #include <assert.h>
@@ -15,6 +16,17 @@
 
 vm_Word vm_code_block[CODE_CAPACITY];
 vm_addr vm_pc =   &vm_code_block[0];
+#ifdef VM_UNCHECKED
+unsigned char vm_code_verified[CODE_CAPACITY];
+
+/* Is the word at pc code of a verified class?  (Trampolines
+ * outside the code block are not.)
+ */
+static inline int verified_at(vm_addr pc) {
+    return pc >= vm_code_block && pc < vm_code_block + CODE_CAPACITY
+           && vm_code_verified[pc - vm_code_block];
+}
+#endif
 int vm_run_state = VM_RUNNING;
 enum LOG_LEVEL vm_logging = INFO;
 
@@ -26,6 +38,13 @@ char *guess_description(vm_Word w);
  */
 vm_Word vm_fetch_next(void) {
     vm_Word cur = (*vm_pc);
+#ifdef VM_UNCHECKED
+    if (LOGGING > DEBUG && verified_at(vm_pc)) {
+        // Don't describe words of verified code for a log that discards them
+        vm_pc ++;
+        return cur;
+    }
+#endif
     if (vm_pc >= vm_code_block && vm_pc < vm_code_block + CODE_CAPACITY) {
         // Looks like we are executing an instruction in the main
         // code memory
@@ -62,8 +81,27 @@ vm_Word *vm_sp = vm_frame_stack;    // Stack pointer, points to top item
 /* Evaluation stack is at end of activation record. */
 
 
+int vm_frame_size[CODE_CAPACITY];
+
+int vm_frame_need(vm_addr method_addr) {
+    if (method_addr >= vm_code_block && method_addr < vm_code_block + CODE_CAPACITY) {
+        int size = vm_frame_size[method_addr - vm_code_block];
+        if (size > 0) {
+            return size;
+        }
+    }
+    return 0;
+}
+
+vm_addr vm_frame_unsized_fp = NULL;
+
 /* Push a single word on the frame stack */
 void vm_frame_push_word(vm_Word val) {
+    if (vm_frame_unsized_fp && vm_sp + 1 >= vm_frame_stack + FRAME_CAPACITY) {
+        log_error("Frame stack overflow");
+        vm_run_state = VM_HALTED;
+        return;
+    }
     ++ vm_sp;
     *vm_sp = val;
 }
@@ -151,6 +189,7 @@ extern int lookup_const_index(char *literal) {
  */
 extern int create_const_value(char *literal, obj_ref value) {
     int const_index = vm_next_const;
+    assert(const_index < CONST_POOL_CAPACITY);
     vm_next_const += 1;
     vm_constant_pool[const_index].name = strdup(literal);
     vm_constant_pool[const_index].const_object = value;
@@ -199,7 +238,8 @@ char *op_name(vm_Instr op) {
     static char buff[100];
     /* Is it an instruction? */
     for (int i=0; vm_op_bytecodes[i].name; ++i) {
-        if (vm_op_bytecodes[i].instr == op) {
+        if (vm_op_bytecodes[i].instr == op
+            || vm_op_bytecodes[i].unchecked == op) {
             char *name = vm_op_bytecodes[i].name;
             return name;
         }
@@ -213,13 +253,16 @@ char *guess_description(vm_Word w) {
     static char buff[500];
     /* Is it an instruction? */
     for (int i=0; vm_op_bytecodes[i].name; ++i) {
-        if (vm_op_bytecodes[i].instr == w.instr) {
+        if (vm_op_bytecodes[i].instr == w.instr
+            || vm_op_bytecodes[i].unchecked == w.instr) {
             char *name = vm_op_bytecodes[i].name;
             return name;
         }
     }
-    /*  A small integer constant? */
-    if (w.intval >= -1000 && w.intval <= 1000) {
+    /*  A small integer constant?  (Including any index into
+     *  the code block or constant pool; addresses are larger.)
+     */
+    if (w.intval >= -CODE_CAPACITY && w.intval <= CODE_CAPACITY) {
         sprintf(buff, "(int) %d", w.intval);
         return buff;
     }
@@ -280,8 +323,18 @@ void stack_dump(int n_words) {
     log_debug("===");
 }
 
-/* One execution step, at current PC */
+/* One execution step, at current PC.
+ * Built with VM_UNCHECKED, a step in code of a verified class
+ * skips the per-step health check and tracing unless logging
+ * at DEBUG level; code of other classes keeps them.
+ */
 void vm_step() {
+#ifdef VM_UNCHECKED
+    if (LOGGING > DEBUG && verified_at(vm_pc)) {
+        (*vm_fetch_next().instr)();
+        return;
+    }
+#endif
     vm_Instr instr = vm_fetch_next().instr;
     char *name = guess_description((vm_Word) instr);
     log_debug("Step:  %s",name );
@@ -295,6 +348,9 @@ void vm_run() {
     vm_run_state = VM_RUNNING;
     // push_log_level(DEBUG);
     while (vm_run_state == VM_RUNNING) {
+        if (vm_profile_countdown && --vm_profile_countdown == 0) {
+            vm_profile_sample();
+        }
         vm_step();
     }
     // pop_log_level();
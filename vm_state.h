@@ -13,9 +13,9 @@
 #ifndef TINY_VM_VM_STATE_H
 #define TINY_VM_VM_STATE_H
 
-#define CODE_CAPACITY    1024  // Max # instruction words
+#define CODE_CAPACITY    65536  // Max # instruction words
 #define FRAME_CAPACITY   1024    // Procedure call stack words
-#define CONST_POOL_CAPACITY 128  // Constant objects, created during loading
+#define CONST_POOL_CAPACITY 4096  // Constant objects, created during loading
 
 /* Core definitions shared with
  * builtins.h
@@ -35,6 +35,14 @@
 extern vm_Word vm_code_block[];
 extern vm_addr vm_pc;
 
+#ifdef VM_UNCHECKED
+/* Which words of vm_code_block hold code of a verified class
+ * (see VM_UNCHECKED in vm_loader.c).  Only there does a step
+ * skip the per-step health check and tracing.
+ */
+extern unsigned char vm_code_verified[];
+#endif
+
 /* Fetch word at program counter, and advance
  * pc to point to next instruction.
  */
@@ -77,6 +85,25 @@ extern vm_Word vm_frame_stack[FRAME_CAPACITY];
 extern vm_addr vm_sp;   // Stack pointer  (next free location on stack)
 extern vm_addr vm_fp;   // Frame pointer  (locals and return address are relative to this)
 
+/* The assembler computes how many words each method can push on
+ * its frame (see FrameDepth in assemble.py), and methodcall
+ * checks once, at the call, that the whole frame fits.
+ * Words from the frame pointer up (receiver, return address,
+ * saved frame pointer, locals, and evaluation stack) that the
+ * method starting at each word of vm_code_block needs; 0 if not known.
+ */
+extern int vm_frame_size[CODE_CAPACITY];
+
+/* Words the method at method_addr needs on the frame stack; 0 if not known */
+extern int vm_frame_need(vm_addr method_addr);
+
+/* Frame pointer of the oldest active method whose frame size is
+ * not known (built-in methods, object files without frame sizes),
+ * or NULL.  While there is one, each push is checked against
+ * FRAME_CAPACITY instead.
+ */
+extern vm_addr vm_frame_unsized_fp;
+
 /* Single word push/pop */
 extern void vm_frame_push_word(vm_Word val);
 extern vm_Word vm_frame_pop_word();